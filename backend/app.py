@@ -1,16 +1,27 @@
-from flask import Flask, jsonify, request
+from flask import Flask, Request, jsonify, request, send_file
 from flask_cors import CORS
 from dotenv import load_dotenv
 import os
 import json
 import logging
 import re
+import zipfile
+from config import Config
 from models import (
     init_db, get_roles, create_or_get_role, get_full_session_data,
     get_session_by_id, get_candidate_by_id, get_role_by_id, get_all_sessions,
     get_role_candidates_for_pool
 )
-from services.analysis_service import run_full_analysis
+from services.analysis_service import run_full_analysis, run_ingestion, run_ranking
+from services.pipeline import get_active_pipeline_stats
+from services.rate_limiter import get_gemini_limiter
+from services.gemini_cache import get_cache_stats
+from services.local_extractor import preload_models
+from services.file_store import HashingUploadFile, start_orphan_gc
+from services.archive_reader import ArchiveLimitError, expand_uploads
+from services.profile_import import import_profiles
+from services.pdf_preview import get_stored_pdf, get_thumbnail
+from services.extraction_worker import submit_full_text, wait_result
 from services.gemini_service import generate_comparison_explanation
 from services.email_service import EmailService
 
@@ -28,7 +39,21 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+class StreamingRequest(Request):
+    """Request that streams uploaded files to disk chunk by chunk.
+
+    Each file part is written straight into a hashing temp file next to
+    the upload store, so large batches are never buffered in memory and
+    the content hash is ready without a second read.
+    """
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        return HashingUploadFile(Config.UPLOAD_TMP_FOLDER)
+
+
 app = Flask(__name__)
+app.request_class = StreamingRequest
 CORS(app, origins=['http://localhost:5173', 'http://localhost:5174', 'http://localhost:5175'], supports_credentials=True)
 
 # Allow large file uploads (500MB for many resumes)
@@ -38,9 +63,16 @@ app.config['MAX_CONTENT_LENGTH'] = 500 * 1024 * 1024
 init_db()
 logger.info('Database initialized')
 
+# Warm the NER model before serving (and before any worker fork)
+if Config.PRELOAD_NLP:
+    preload_models()
+
 # Ensure required directories exist
-os.makedirs('uploads', exist_ok=True)
-os.makedirs('data', exist_ok=True)
+os.makedirs(Config.UPLOAD_FOLDER, exist_ok=True)
+os.makedirs(os.path.dirname(Config.DATABASE_PATH), exist_ok=True)
+
+# Remove stored PDFs no candidate references anymore
+start_orphan_gc()
 
 
 # Response helper functions
@@ -97,6 +129,16 @@ def health_check():
     return success_response({'status': 'ok'})
 
 
+@app.route('/api/pipeline/stats')
+def pipeline_stats():
+    """Get live per-stage queue depth and throughput of running analyses."""
+    return success_response({
+        'pipelines': get_active_pipeline_stats(),
+        'gemini_rate_limit': get_gemini_limiter().get_stats(),
+        'gemini_cache': get_cache_stats()
+    })
+
+
 @app.route('/api/roles', methods=['GET'])
 def list_roles():
     """Get all roles with candidate counts."""
@@ -165,6 +207,85 @@ def create_role():
         return error_response('CREATE_ERROR', str(e), 500)
 
 
+@app.route('/api/candidates/<candidate_id>/resume', methods=['GET'])
+def get_candidate_resume(candidate_id):
+    """Serve a candidate's original PDF.
+
+    Supports conditional and range requests (send_file with
+    conditional=True), so viewers can fetch pages incrementally and
+    revisits are answered with 304.
+    """
+    candidate = get_candidate_by_id(candidate_id)
+    if not candidate:
+        return error_response('NOT_FOUND', 'Candidate not found', 404)
+
+    pdf_path, content_hash = get_stored_pdf(candidate.get('pdf_path'))
+    if not pdf_path:
+        return error_response('NOT_FOUND', 'Resume file not available', 404)
+
+    return send_file(
+        pdf_path,
+        mimetype='application/pdf',
+        download_name=f"{candidate.get('name') or 'resume'}.pdf",
+        conditional=True,
+        etag=content_hash,
+        max_age=Config.PREVIEW_CACHE_MAX_AGE
+    )
+
+
+@app.route('/api/candidates/<candidate_id>/thumbnail', methods=['GET'])
+def get_candidate_thumbnail(candidate_id):
+    """Serve a PNG of the first page of a candidate's resume.
+
+    Rendered on first request and cached on disk by content hash.
+    """
+    candidate = get_candidate_by_id(candidate_id)
+    if not candidate:
+        return error_response('NOT_FOUND', 'Candidate not found', 404)
+
+    pdf_path, content_hash = get_stored_pdf(candidate.get('pdf_path'))
+    if not pdf_path:
+        return error_response('NOT_FOUND', 'Resume file not available', 404)
+
+    # Browser already has this render
+    if content_hash in request.if_none_match:
+        return '', 304
+
+    thumbnail_path = get_thumbnail(pdf_path, content_hash)
+    if not thumbnail_path:
+        return error_response('RENDER_ERROR', 'Could not render resume preview', 500)
+
+    return send_file(
+        thumbnail_path,
+        mimetype='image/png',
+        conditional=True,
+        etag=content_hash,
+        max_age=Config.PREVIEW_CACHE_MAX_AGE
+    )
+
+
+@app.route('/api/candidates/<candidate_id>/text', methods=['GET'])
+def get_candidate_text(candidate_id):
+    """Get the full text of a candidate's resume.
+
+    The stored resume_text stops at the extraction budget; this reads
+    every page of the stored PDF on the extraction pool.
+    """
+    candidate = get_candidate_by_id(candidate_id)
+    if not candidate:
+        return error_response('NOT_FOUND', 'Candidate not found', 404)
+
+    pdf_path, _ = get_stored_pdf(candidate.get('pdf_path'))
+    if not pdf_path:
+        return error_response('NOT_FOUND', 'Resume file not available', 404)
+
+    result = wait_result(submit_full_text(pdf_path))
+    if result.get('error'):
+        return error_response('EXTRACTION_ERROR', result['error'], 500)
+
+    return success_response({'candidate_id': candidate_id, 'text': result['text']})
+
+
 @app.route('/api/sessions', methods=['GET'])
 def list_sessions():
     """Get all sessions for history page."""
@@ -210,7 +331,7 @@ def analyze_resumes():
     - job_description: string (required)
     - weights: JSON string (optional)
     - thresholds: JSON string (optional)
-    - files: PDF files (required, at least one)
+    - files: PDF files and/or ZIP archives of PDFs (required, at least one)
 
     Returns complete analysis with rankings.
     """
@@ -248,12 +369,18 @@ def analyze_resumes():
         if not valid_files:
             return error_response('VALIDATION_ERROR', 'No valid files provided', 400)
 
+        # ZIPs are validated now and their members streamed during Phase 1
+        try:
+            upload_files = expand_uploads(valid_files)
+        except (ArchiveLimitError, zipfile.BadZipFile) as e:
+            return error_response('VALIDATION_ERROR', f'Invalid ZIP archive: {e}', 400)
+
         # Run analysis pipeline
         logger.info(f"Starting analysis: {len(valid_files)} files for '{role_title}'")
         result = run_full_analysis(
             role_title=role_title,
             job_description=job_description,
-            files=valid_files,
+            files=upload_files,
             weights=weights,
             thresholds=thresholds
         )
@@ -266,6 +393,118 @@ def analyze_resumes():
         return error_response('ANALYSIS_ERROR', str(e), 500)
 
 
+@app.route('/api/ingest', methods=['POST'])
+def ingest_resumes():
+    """Add resumes to a role pool without ranking (Phase 1 only).
+
+    Accepts multipart/form-data with:
+    - role_title: string (required)
+    - job_description: string (optional, recorded for later ranking)
+    - files: PDF files and/or ZIP archives of PDFs (required, at least one)
+
+    Returns the new candidate IDs and extraction summary. Rank the pool
+    afterwards with POST /api/roles/<role_id>/rank.
+    """
+    try:
+        role_title = request.form.get('role_title', '').strip()
+        job_description = request.form.get('job_description', '').strip()
+        files = [f for f in request.files.getlist('files') if f and f.filename]
+
+        if not role_title:
+            return error_response('VALIDATION_ERROR', 'Role title is required', 400)
+        if not files:
+            return error_response('VALIDATION_ERROR', 'At least one resume file is required', 400)
+
+        try:
+            upload_files = expand_uploads(files)
+        except (ArchiveLimitError, zipfile.BadZipFile) as e:
+            return error_response('VALIDATION_ERROR', f'Invalid ZIP archive: {e}', 400)
+
+        logger.info(f"Starting ingestion: {len(files)} files for '{role_title}'")
+        result = run_ingestion(role_title, upload_files, job_description)
+        result['candidate_ids'] = [c['candidate_id'] for c in result['candidates']]
+
+        logger.info(f"Ingestion complete: session {result['session_id']}")
+        return success_response(result, 201)
+
+    except Exception as e:
+        logger.error(f'Ingestion error: {e}', exc_info=True)
+        return error_response('INGEST_ERROR', str(e), 500)
+
+
+@app.route('/api/roles/<role_id>/rank', methods=['POST'])
+def rank_role_pool(role_id):
+    """Rank a role's current pool on demand (Phase 2 only).
+
+    Accepts optional JSON with:
+    - job_description: string (defaults to the role's most recent one)
+    - weights: dimension weights (defaults to the role's saved weights)
+    - thresholds: threshold configuration
+
+    Returns the same ranking result as /api/analyze, without extraction.
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        weights = data.get('weights') or {}
+        thresholds = data.get('thresholds') or {}
+        if not isinstance(weights, dict) or not isinstance(thresholds, dict):
+            return error_response('VALIDATION_ERROR', 'weights and thresholds must be objects', 400)
+
+        try:
+            result = run_ranking(
+                role_id,
+                job_description=(data.get('job_description') or '').strip(),
+                weights=weights,
+                thresholds=thresholds
+            )
+        except ValueError as e:
+            return error_response('VALIDATION_ERROR', str(e), 400)
+
+        if result is None:
+            return error_response('NOT_FOUND', 'Role not found', 404)
+
+        logger.info(f"Ranking complete: session {result['session_id']}")
+        return success_response(result)
+
+    except Exception as e:
+        logger.error(f'Ranking error: {e}', exc_info=True)
+        return error_response('RANKING_ERROR', str(e), 500)
+
+
+@app.route('/api/import', methods=['POST'])
+def import_candidate_profiles():
+    """Bulk import pre-extracted candidate profiles (JSON Lines).
+
+    Accepts either multipart/form-data with:
+    - role_title: string (required)
+    - file: JSON Lines file, one profile per line (required)
+    or a raw application/x-ndjson body with ?role_title=... in the query.
+
+    Profiles skip PDF parsing and Gemini and join the role pool directly.
+    Invalid lines are skipped and reported.
+    """
+    try:
+        role_title = (request.form.get('role_title') or request.args.get('role_title', '')).strip()
+        if not role_title:
+            return error_response('VALIDATION_ERROR', 'Role title is required', 400)
+
+        upload = request.files.get('file')
+        if upload:
+            lines = upload.stream
+        elif request.mimetype in ('application/x-ndjson', 'application/jsonl', 'application/json-lines'):
+            lines = request.stream
+        else:
+            return error_response('VALIDATION_ERROR', 'A JSON Lines file or application/x-ndjson body is required', 400)
+
+        result = import_profiles(role_title, lines)
+        logger.info(f"Imported {result['imported']} profiles into '{role_title}' ({result['failed']} rejected)")
+        return success_response(result, 201 if result['imported'] else 200)
+
+    except Exception as e:
+        logger.error(f'Import error: {e}', exc_info=True)
+        return error_response('IMPORT_ERROR', str(e), 500)
+
+
 # Helper functions for comparison endpoint
 
 def calculate_dimension_winners(candidate1: dict, candidate2: dict) -> dict:
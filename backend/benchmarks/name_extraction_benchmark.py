@@ -0,0 +1,129 @@
+"""Benchmark spaCy vs rule-based name extraction on synthetic resumes.
+
+Usage (from backend/):
+    python benchmarks/name_extraction_benchmark.py --count 500 --seed 7
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.local_extractor import (  # noqa: E402
+    NAME_MODE_RULES,
+    NAME_MODE_SPACY,
+    extract_name,
+    get_nlp
+)
+
+FIRST_NAMES = [
+    'James', 'Maria', 'Ahmed', 'Priya', 'Chen', 'Olivia', 'Lucas', 'Fatima',
+    'Noah', 'Aisha', 'Mateo', 'Sofia', 'Hiroshi', 'Emma', 'Omar', 'Zara'
+]
+LAST_NAMES = [
+    'Smith', 'Garcia', 'Khan', 'Patel', 'Wang', "O'Brien", 'Silva', 'Malik',
+    'Johnson', 'Rahman', 'Rossi', 'Nakamura', 'Müller', 'Haddad', 'Kowalski'
+]
+TITLES = ['Software Engineer', 'Data Analyst', 'Product Designer', 'DevOps Engineer']
+COMPANIES = ['Acme Corp', 'Globex', 'Initech', 'Umbrella Labs', 'Stark Industries']
+
+BODY = """
+PROFESSIONAL SUMMARY
+{title} with {years} years of experience building reliable systems.
+
+EXPERIENCE
+{title} - {company} (2019 - Present)
+- Led migration of legacy services to the cloud
+- Mentored three junior engineers
+
+EDUCATION
+BSc Computer Science, State University, 2018
+
+SKILLS
+Python, SQL, Docker, Kubernetes, React
+"""
+
+# Header layouts seen in real resumes; {name} is the expected answer
+LAYOUTS = [
+    "{name}\n{email}\n{phone}",
+    "{upper}\n{title}\n{email} | {phone}",
+    "RESUME\n{name}\n{email}",
+    "Curriculum Vitae\n\nName: {name}\nEmail: {email}",
+    "{name} | {email} | {phone}",
+    "{name}\n{title} • {city}\n{email}",
+]
+CITIES = ['Lahore', 'Berlin', 'Austin', 'Toronto', 'Lisbon']
+
+
+def make_corpus(count: int, seed: int) -> list:
+    """Generate (text, expected_name) pairs."""
+    rng = random.Random(seed)
+    corpus = []
+
+    for _ in range(count):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        name = f"{first} {last}"
+        fields = {
+            "name": name,
+            "upper": name.upper(),
+            "email": f"{first.lower()}.{last.lower().replace(chr(39), '')}@example.com",
+            "phone": f"+1 555 {rng.randint(100, 999)} {rng.randint(1000, 9999)}",
+            "title": rng.choice(TITLES),
+            "company": rng.choice(COMPANIES),
+            "city": rng.choice(CITIES),
+            "years": rng.randint(1, 15)
+        }
+        header = rng.choice(LAYOUTS).format(**fields)
+        corpus.append((header + "\n" + BODY.format(**fields), name))
+
+    return corpus
+
+
+def run_mode(mode: str, corpus: list) -> dict:
+    """Time extraction per resume and score exact (case-insensitive) matches."""
+    # Load the model outside the timed loop; raises if spaCy is unavailable
+    if mode == NAME_MODE_SPACY:
+        get_nlp()
+    extract_name(corpus[0][0], mode=mode)
+
+    latencies = []
+    correct = 0
+    for text, expected in corpus:
+        start = time.perf_counter()
+        name = extract_name(text, mode=mode)
+        latencies.append((time.perf_counter() - start) * 1000)
+        if name and name.lower() == expected.lower():
+            correct += 1
+
+    latencies.sort()
+    return {
+        "accuracy": correct / len(corpus),
+        "mean_ms": statistics.mean(latencies),
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1]
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=300, help='Synthetic resumes to generate')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed for the corpus')
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.count, args.seed)
+    print(f"{'mode':<8} {'accuracy':>9} {'mean ms':>9} {'p95 ms':>9}")
+
+    for mode in (NAME_MODE_SPACY, NAME_MODE_RULES):
+        try:
+            stats = run_mode(mode, corpus)
+        except (ImportError, OSError) as e:
+            print(f"{mode:<8} skipped ({e})")
+            continue
+        print(f"{mode:<8} {stats['accuracy']:>9.1%} {stats['mean_ms']:>9.3f} {stats['p95_ms']:>9.3f}")
+
+
+if __name__ == '__main__':
+    main()
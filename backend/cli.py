@@ -0,0 +1,228 @@
+"""Command-line entry point for headless batch analysis.
+
+Runs the same analysis service as /api/analyze against the same database
+and caches, so results show up in the dashboard. Progress and results
+are streamed to stdout as NDJSON (one JSON object per line); logs go to
+stderr and logs/cli.log.
+
+    python cli.py analyze --role "Backend Engineer" --jd jd.txt resumes/
+    python cli.py import --role "Backend Engineer" profiles.jsonl
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from config import Config, BASE_DIR
+from models import init_db
+
+logger = logging.getLogger('cli')
+
+RESUME_EXTENSIONS = ('.pdf', '.zip')
+
+_stdout_lock = threading.Lock()
+
+
+def emit(event: dict) -> None:
+    """Write one NDJSON line to stdout (safe to call from pipeline threads)."""
+    line = json.dumps(event, default=str)
+    with _stdout_lock:
+        sys.stdout.write(line + '\n')
+        sys.stdout.flush()
+
+
+def setup_logging(verbose: bool) -> None:
+    log_dir = os.path.join(BASE_DIR, 'logs')
+    os.makedirs(log_dir, exist_ok=True)
+    logging.basicConfig(
+        level=logging.INFO if verbose else logging.WARNING,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(os.path.join(log_dir, 'cli.log')),
+            logging.StreamHandler(sys.stderr)
+        ]
+    )
+
+
+def find_resume_files(directory: str, recursive: bool = False) -> list:
+    """List PDFs and ZIP archives in a directory, sorted by path."""
+    paths = []
+    if recursive:
+        for root, _, names in os.walk(directory):
+            paths.extend(os.path.join(root, name) for name in names)
+    else:
+        paths = [entry.path for entry in os.scandir(directory) if entry.is_file()]
+
+    return sorted(
+        path for path in paths
+        if path.lower().endswith(RESUME_EXTENSIONS) and not os.path.basename(path).startswith('.')
+    )
+
+
+def load_json_arg(value: str | None, name: str) -> dict:
+    """Parse a JSON option given inline or as @path/to/file.json."""
+    if not value:
+        return {}
+    if value.startswith('@'):
+        with open(value[1:]) as f:
+            value = f.read()
+    try:
+        return json.loads(value)
+    except json.JSONDecodeError as e:
+        raise SystemExit(f"Invalid {name} JSON: {e}")
+
+
+def apply_tuning(args) -> None:
+    """Override pipeline and rate-limit settings from command-line flags.
+
+    Must run before any work starts: the extraction pool reads its size
+    when it is first created.
+    """
+    overrides = {
+        'EXTRACTION_WORKERS': 'workers',
+        'GEMINI_WORKERS': 'gemini_workers',
+        'NER_BATCH_SIZE': 'ner_batch_size',
+        'PIPELINE_QUEUE_SIZE': 'queue_size',
+        'RANK_BATCH_SIZE': 'rank_batch_size',
+        'GEMINI_RPM': 'rpm',
+        'GEMINI_TPM': 'tpm'
+    }
+    for name, arg in overrides.items():
+        value = getattr(args, arg, None)
+        if value is not None:
+            setattr(Config, name, value)
+
+
+def run_analyze(args) -> int:
+    from services.analysis_service import run_full_analysis
+    from services.archive_reader import expand_uploads_individually
+    from services.file_store import LocalFile
+    from services.local_extractor import preload_models
+
+    with open(args.jd) as f:
+        job_description = f.read().strip()
+    if not job_description:
+        raise SystemExit(f"Job description file is empty: {args.jd}")
+
+    paths = find_resume_files(args.directory, args.recursive)
+    if not paths:
+        raise SystemExit(f"No PDF or ZIP files found in {args.directory}")
+
+    weights = load_json_arg(args.weights, 'weights')
+    thresholds = load_json_arg(args.thresholds, 'thresholds')
+
+    # Load spaCy before the extraction pool forks, as the web app does
+    if Config.PRELOAD_NLP:
+        preload_models()
+
+    files = [LocalFile(path) for path in paths]
+    uploads, rejected = expand_uploads_individually(files)
+
+    emit({
+        "event": "start",
+        "role_title": args.role,
+        "files": len(paths),
+        "settings": {
+            "workers": Config.EXTRACTION_WORKERS,
+            "gemini_workers": Config.GEMINI_WORKERS,
+            "ner_batch_size": Config.NER_BATCH_SIZE,
+            "queue_size": Config.PIPELINE_QUEUE_SIZE,
+            "rank_batch_size": Config.RANK_BATCH_SIZE,
+            "rpm": Config.GEMINI_RPM,
+            "tpm": Config.GEMINI_TPM
+        }
+    })
+    for filename, reason in rejected.items():
+        emit({"event": "resume", "filename": filename, "status": "failed", "error": reason})
+
+    started = time.monotonic()
+    try:
+        result = run_full_analysis(
+            role_title=args.role,
+            job_description=job_description,
+            files=uploads,
+            weights=weights,
+            thresholds=thresholds,
+            on_progress=emit
+        )
+    finally:
+        for file in files:
+            file.close()
+
+    emit({"event": "result", "elapsed_seconds": round(time.monotonic() - started, 2), **result})
+    return 0
+
+
+def run_import(args) -> int:
+    from services.profile_import import import_profiles
+
+    emit({"event": "start", "role_title": args.role, "source": args.file})
+    started = time.monotonic()
+
+    if args.file == '-':
+        result = import_profiles(args.role, sys.stdin, args.batch_size, on_progress=emit)
+    else:
+        with open(args.file, 'rb') as f:
+            result = import_profiles(args.role, f, args.batch_size, on_progress=emit)
+
+    emit({"event": "result", "elapsed_seconds": round(time.monotonic() - started, 2), **result})
+    return 0 if not result['failed'] else 2
+
+
+def add_tuning_arguments(parser: argparse.ArgumentParser) -> None:
+    group = parser.add_argument_group('tuning (defaults from config/.env)')
+    group.add_argument('--workers', type=int, help="Extraction processes (PDF parsing, NER)")
+    group.add_argument('--gemini-workers', type=int, help="Concurrent Gemini extraction calls")
+    group.add_argument('--ner-batch-size', type=int, help="Resumes per batched NER pass")
+    group.add_argument('--queue-size', type=int, help="Bounded queue size between pipeline stages")
+    group.add_argument('--rank-batch-size', type=int, help="Candidates per Gemini ranking request")
+    group.add_argument('--rpm', type=int, help="Gemini requests per minute allowed by your quota")
+    group.add_argument('--tpm', type=int, help="Gemini prompt tokens per minute allowed by your quota")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='cli.py', description="TalentLens AI command-line tools")
+    parser.add_argument('-v', '--verbose', action='store_true', help="Log progress details to stderr")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    analyze = commands.add_parser('analyze', help="Extract and rank a directory of resumes for a role")
+    analyze.add_argument('directory', help="Directory of PDF resumes and/or ZIP archives")
+    analyze.add_argument('--role', required=True, help="Role title (existing pools are reused)")
+    analyze.add_argument('--jd', required=True, help="Path to the job description text file")
+    analyze.add_argument('--weights', help="Dimension weights as JSON or @file.json")
+    analyze.add_argument('--thresholds', help="Threshold configuration as JSON or @file.json")
+    analyze.add_argument('--recursive', action='store_true', help="Include subdirectories")
+    add_tuning_arguments(analyze)
+    analyze.set_defaults(handler=run_analyze)
+
+    import_cmd = commands.add_parser('import', help="Import pre-extracted profiles from a JSON Lines file")
+    import_cmd.add_argument('file', help="JSON Lines file with one profile per line ('-' for stdin)")
+    import_cmd.add_argument('--role', required=True, help="Role title (existing pools are reused)")
+    import_cmd.add_argument('--batch-size', type=int, help="Profiles per database transaction")
+    import_cmd.set_defaults(handler=run_import)
+
+    return parser
+
+
+def main(argv: list = None) -> int:
+    args = build_parser().parse_args(argv)
+    setup_logging(args.verbose)
+    apply_tuning(args)
+    init_db()
+    os.makedirs(Config.UPLOAD_FOLDER, exist_ok=True)
+
+    try:
+        return args.handler(args)
+    except SystemExit:
+        raise
+    except Exception as e:
+        logger.error(f"{args.command} failed: {e}", exc_info=True)
+        emit({"event": "error", "message": str(e)})
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
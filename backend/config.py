@@ -13,3 +13,90 @@ class Config:
     GMAIL_APP_PASSWORD = os.getenv('GMAIL_APP_PASSWORD')
     DATABASE_PATH = os.path.join(BASE_DIR, 'data', 'app.db')
     UPLOAD_FOLDER = os.path.join(BASE_DIR, 'uploads')
+    UPLOAD_TMP_FOLDER = os.path.join(UPLOAD_FOLDER, 'tmp')  # streamed uploads in flight
+
+    # Resume previews: first-page PNGs cached by content hash, browser cache lifetime
+    THUMBNAIL_FOLDER = os.path.join(BASE_DIR, 'cache', 'thumbnails')
+    THUMBNAIL_WIDTH = int(os.getenv('THUMBNAIL_WIDTH', 360))  # pixels
+    PREVIEW_CACHE_MAX_AGE = int(os.getenv('PREVIEW_CACHE_MAX_AGE', 86400))  # seconds
+
+    # Local extraction process pool (PyMuPDF + spaCy)
+    EXTRACTION_WORKERS = int(os.getenv('EXTRACTION_WORKERS', os.cpu_count() or 1))
+    EXTRACTION_TIMEOUT = int(os.getenv('EXTRACTION_TIMEOUT', 30))  # CPU seconds per file
+    EXTRACTION_MEMORY_MB = int(os.getenv('EXTRACTION_MEMORY_MB', 512))  # per-worker budget
+
+    # Phase 1 pipeline: bounded queue size between stages, Gemini stage concurrency
+    PIPELINE_QUEUE_SIZE = int(os.getenv('PIPELINE_QUEUE_SIZE', 16))
+    GEMINI_WORKERS = int(os.getenv('GEMINI_WORKERS', 4))  # the rate limiter keeps any count within quota
+
+    # Gemini quota shared by all calls in the process (0 disables a limit; defaults: 2.5 Flash free tier)
+    GEMINI_RPM = int(os.getenv('GEMINI_RPM', 10))
+    GEMINI_TPM = int(os.getenv('GEMINI_TPM', 250000))
+    GEMINI_MAX_IN_FLIGHT = int(os.getenv('GEMINI_MAX_IN_FLIGHT', 64))  # concurrent requests on the event loop
+    RANK_BATCH_SIZE = int(os.getenv('RANK_BATCH_SIZE', 20))  # Gemini can't handle 80+ at once
+
+    # Persistent Gemini response cache (identical prompts are answered from SQLite)
+    GEMINI_CACHE_ENABLED = os.getenv('GEMINI_CACHE_ENABLED', 'true').lower() == 'true'
+    GEMINI_CACHE_TTL_HOURS = int(os.getenv('GEMINI_CACHE_TTL_HOURS', 168))
+    GEMINI_CACHE_MAX_ENTRIES = int(os.getenv('GEMINI_CACHE_MAX_ENTRIES', 10000))
+
+    # Text extraction budget; pages past it are not read (full text via /api/candidates/<id>/text)
+    TEXT_CHAR_BUDGET = int(os.getenv('TEXT_CHAR_BUDGET', 12000))
+    TEXT_PAGE_BUDGET = int(os.getenv('TEXT_PAGE_BUDGET', 10))
+
+    # Batched spaCy NER for name extraction
+    NER_BATCH_SIZE = int(os.getenv('NER_BATCH_SIZE', 64))
+    NER_PROCESSES = int(os.getenv('NER_PROCESSES', 1))
+
+    # Name extraction: 'spacy' (NER) or 'rules' (layout heuristics, no model)
+    NAME_EXTRACTION_MODE = os.getenv('NAME_EXTRACTION_MODE', 'spacy')
+    PRELOAD_NLP = os.getenv('PRELOAD_NLP', 'true').lower() == 'true'
+
+    # Orphaned upload garbage collection (seconds); 0 disables the background GC
+    UPLOAD_GC_INTERVAL = int(os.getenv('UPLOAD_GC_INTERVAL', 3600))
+    UPLOAD_GC_MIN_AGE = int(os.getenv('UPLOAD_GC_MIN_AGE', 3600))
+
+    # ZIP ingestion limits (zip-bomb guards)
+    ZIP_MAX_MEMBERS = int(os.getenv('ZIP_MAX_MEMBERS', 1000))
+    ZIP_MAX_MEMBER_MB = int(os.getenv('ZIP_MAX_MEMBER_MB', 20))
+    ZIP_MAX_TOTAL_MB = int(os.getenv('ZIP_MAX_TOTAL_MB', 1024))
+    ZIP_MAX_RATIO = int(os.getenv('ZIP_MAX_RATIO', 100))
+
+    # Split resumes into sections and send Gemini only the ones extraction needs
+    SEGMENT_RESUMES = os.getenv('SEGMENT_RESUMES', 'true').lower() == 'true'
+
+    # Token budget for resume text in the extraction prompt (after compaction)
+    EXTRACTION_TOKEN_BUDGET = int(os.getenv('EXTRACTION_TOKEN_BUDGET', 2500))
+
+    # Packed extraction: several resumes per Gemini request, up to a prompt token budget
+    EXTRACTION_PACKING = os.getenv('EXTRACTION_PACKING', 'true').lower() == 'true'
+    EXTRACTION_PACK_TOKEN_BUDGET = int(os.getenv('EXTRACTION_PACK_TOKEN_BUDGET', 12000))
+    EXTRACTION_PACK_MAX_RESUMES = int(os.getenv('EXTRACTION_PACK_MAX_RESUMES', 6))  # bounds response size
+    EXTRACTION_PACK_WAIT = float(os.getenv('EXTRACTION_PACK_WAIT', 2.0))  # seconds to fill a pack
+
+    # Near-duplicate resumes (estimated Jaccard): supersede above the first,
+    # also reuse the prior extraction instead of calling Gemini above the second
+    NEAR_DUPLICATE_THRESHOLD = float(os.getenv('NEAR_DUPLICATE_THRESHOLD', 0.8))
+    NEAR_DUPLICATE_REUSE_THRESHOLD = float(os.getenv('NEAR_DUPLICATE_REUSE_THRESHOLD', 0.9))
+
+    # Watch-folder ingestion: one subfolder per role under the watch folder;
+    # files arriving within a batch window are ingested together
+    INGEST_WATCH_FOLDER = os.getenv('INGEST_WATCH_FOLDER') or os.path.join(BASE_DIR, 'inbox')
+    INGEST_BATCH_WINDOW = int(os.getenv('INGEST_BATCH_WINDOW', 30))  # seconds
+    INGEST_MAX_BATCH = int(os.getenv('INGEST_MAX_BATCH', 500))
+    INGEST_POLL_INTERVAL = int(os.getenv('INGEST_POLL_INTERVAL', 10))  # seconds, polling fallback
+    INGEST_USE_INOTIFY = os.getenv('INGEST_USE_INOTIFY', 'true').lower() == 'true'
+
+    # Profiles per transaction for JSON Lines bulk import
+    IMPORT_BATCH_SIZE = int(os.getenv('IMPORT_BATCH_SIZE', 1000))
+
+    # Pre-extraction triage: reject non-resumes before they reach Gemini
+    TRIAGE_ENABLED = os.getenv('TRIAGE_ENABLED', 'true').lower() == 'true'
+    TRIAGE_MIN_CHARS_PER_PAGE = int(os.getenv('TRIAGE_MIN_CHARS_PER_PAGE', 150))
+    TRIAGE_MAX_PAGES = int(os.getenv('TRIAGE_MAX_PAGES', 20))
+    TRIAGE_MIN_RESUME_SIGNALS = int(os.getenv('TRIAGE_MIN_RESUME_SIGNALS', 2))  # sections + contact
+
+    # Local structured extraction; Gemini only runs below these confidence/quality gates
+    LOCAL_EXTRACTION = os.getenv('LOCAL_EXTRACTION', 'true').lower() == 'true'
+    LOCAL_EXTRACTION_MIN_CONFIDENCE = float(os.getenv('LOCAL_EXTRACTION_MIN_CONFIDENCE', 0.75))
+    LOCAL_EXTRACTION_MIN_QUALITY = int(os.getenv('LOCAL_EXTRACTION_MIN_QUALITY', 80))
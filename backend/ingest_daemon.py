@@ -0,0 +1,51 @@
+"""Watch-folder ingestion daemon.
+
+Watches one subfolder per role under INGEST_WATCH_FOLDER (default
+backend/inbox) and adds arriving resumes to that role's pool:
+
+    python ingest_daemon.py [--root PATH] [--batch-window SECONDS]
+"""
+
+import argparse
+import logging
+import os
+import signal
+from config import Config
+from models import init_db
+from services.local_extractor import preload_models
+from services.folder_watcher import FolderIngestionDaemon
+
+os.makedirs('logs', exist_ok=True)
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler('logs/ingest.log'),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ingest resumes dropped into per-role folders")
+    parser.add_argument('--root', default=Config.INGEST_WATCH_FOLDER, help="Folder containing one subfolder per role")
+    parser.add_argument('--batch-window', type=float, default=Config.INGEST_BATCH_WINDOW,
+                        help="Seconds to collect arriving files before ingesting them together")
+    parser.add_argument('--max-batch', type=int, default=Config.INGEST_MAX_BATCH,
+                        help="Ingest as soon as a role has this many pending files")
+    args = parser.parse_args()
+
+    init_db()
+    os.makedirs(Config.UPLOAD_FOLDER, exist_ok=True)
+    if Config.PRELOAD_NLP:
+        preload_models()
+
+    daemon = FolderIngestionDaemon(args.root, args.batch_window, args.max_batch)
+    signal.signal(signal.SIGTERM, lambda *_: daemon.stop())
+    signal.signal(signal.SIGINT, lambda *_: daemon.stop())
+    daemon.run()
+
+
+if __name__ == '__main__':
+    main()
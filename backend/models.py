@@ -93,6 +93,79 @@ def init_db():
         CREATE INDEX IF NOT EXISTS idx_candidates_email
         ON candidates(email)
     ''')
+    # Duplicate checks match on (role, lowercased email)
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_candidates_role_email_lower
+        ON candidates(role_id, LOWER(email))
+    ''')
+
+    # Create extraction cache table (keyed by SHA-256 of uploaded PDF bytes)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS extraction_cache (
+            content_hash TEXT PRIMARY KEY,
+            resume_text TEXT,
+            local_data TEXT,
+            gemini_data TEXT,
+            pdf_path TEXT,
+            hit_count INTEGER DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            last_hit_at TIMESTAMP
+        )
+    ''')
+
+    # Create near-duplicate index (MinHash signature + LSH band buckets per candidate)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS resume_signatures (
+            candidate_id TEXT PRIMARY KEY,
+            role_id TEXT NOT NULL,
+            signature BLOB NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (candidate_id) REFERENCES candidates(id)
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS resume_lsh_buckets (
+            role_id TEXT NOT NULL,
+            band INTEGER NOT NULL,
+            bucket TEXT NOT NULL,
+            candidate_id TEXT NOT NULL
+        )
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_lsh_buckets_lookup
+        ON resume_lsh_buckets(role_id, band, bucket)
+    ''')
+
+    # Create ingestion checkpoint table (files the watch-folder daemon already took in)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS ingested_files (
+            path TEXT PRIMARY KEY,
+            size INTEGER NOT NULL,
+            mtime REAL NOT NULL,
+            role_id TEXT,
+            session_id TEXT,
+            status TEXT NOT NULL,
+            error TEXT,
+            ingested_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # Create Gemini response cache (keyed by model, prompt template version, settings and prompt)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS gemini_response_cache (
+            cache_key TEXT PRIMARY KEY,
+            model TEXT NOT NULL,
+            template TEXT NOT NULL,
+            response TEXT NOT NULL,
+            hit_count INTEGER DEFAULT 0,
+            created_at TIMESTAMP DEFAULT (STRFTIME('%Y-%m-%d %H:%M:%f', 'now')),
+            last_used_at TIMESTAMP DEFAULT (STRFTIME('%Y-%m-%d %H:%M:%f', 'now'))
+        )
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_gemini_cache_last_used
+        ON gemini_response_cache(last_used_at)
+    ''')
 
     conn.commit()
     conn.close()
@@ -138,6 +211,19 @@ def get_candidate_count(role_id):
     return count
 
 
+def get_unranked_candidate_count(role_id):
+    """Get count of active candidates that joined the pool since it was last ranked."""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute(
+        'SELECT COUNT(*) FROM candidates WHERE role_id = ? AND status = ? AND last_ranked_at IS NULL',
+        (role_id, 'active')
+    )
+    count = cursor.fetchone()[0]
+    conn.close()
+    return count
+
+
 def create_role(title, weights=None):
     """Create a new role with UUID."""
     role_id = str(uuid.uuid4())
@@ -523,11 +609,14 @@ def store_candidate_with_duplicate_check(
     local_data: dict,
     gemini_data: dict,
     resume_text: str = None,
-    pdf_path: str = None
+    pdf_path: str = None,
+    near_duplicate_id: str = None
 ) -> dict:
     """Store candidate with duplicate detection.
 
-    If email already exists in pool, supersedes old candidate.
+    If email already exists in pool, supersedes old candidate. Otherwise a
+    near-duplicate found by the signature index (near_duplicate_id) is
+    superseded instead.
 
     Args:
         role_id: Role UUID
@@ -536,6 +625,7 @@ def store_candidate_with_duplicate_check(
         gemini_data: Dict with structured extraction
         resume_text: Raw resume text
         pdf_path: Path to PDF file
+        near_duplicate_id: Active candidate whose resume is a near-duplicate
 
     Returns:
         Dict with candidate info and duplicate status
@@ -560,6 +650,12 @@ def store_candidate_with_duplicate_check(
             supersede_candidate(existing['id'])
             logger.info(f"Superseding existing candidate {existing['id']} with email {email}")
 
+    if not result["is_duplicate"] and near_duplicate_id:
+        if supersede_candidate(near_duplicate_id):
+            result["is_duplicate"] = True
+            result["superseded_id"] = near_duplicate_id
+            logger.info(f"Superseding near-duplicate candidate {near_duplicate_id}")
+
     # Create new candidate
     candidate = create_candidate_from_extraction(
         role_id=role_id,
@@ -578,6 +674,369 @@ def store_candidate_with_duplicate_check(
     return result
 
 
+def bulk_create_candidates(role_id: str, session_id: str, records: list) -> dict:
+    """Insert many pre-extracted candidates in a single transaction.
+
+    Follows store_candidate_with_duplicate_check: an active candidate in
+    the role with the same email is superseded by the new record.
+
+    Args:
+        role_id: Role UUID
+        session_id: Session UUID
+        records: Validated profile dicts with name, email, phone,
+            resume_text and the extraction fields (skills, experience_years,
+            experience_details, education, projects, positions)
+
+    Returns:
+        Dict with candidate_ids (aligned with records) and superseded count
+    """
+    from datetime import datetime
+
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    candidate_ids = []
+    superseded = 0
+    uploaded_at = datetime.utcnow().isoformat()
+
+    try:
+        for record in records:
+            email = record.get('email')
+            if email:
+                cursor.execute('''
+                    UPDATE candidates
+                    SET status = 'superseded'
+                    WHERE role_id = ? AND LOWER(email) = ? AND status = 'active'
+                ''', (role_id, email.lower()))
+                superseded += cursor.rowcount
+
+            candidate_id = str(uuid.uuid4())
+            cursor.execute('''
+                INSERT INTO candidates (
+                    id, role_id, session_id,
+                    name, email, phone, resume_text, pdf_path,
+                    skills, experience_years, experience_details,
+                    education, projects, positions,
+                    status, uploaded_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                candidate_id,
+                role_id,
+                session_id,
+                record.get('name') or 'Unknown',
+                email,
+                record.get('phone'),
+                record.get('resume_text'),
+                None,
+                json.dumps(record.get('skills', [])),
+                record.get('experience_years', 0),
+                json.dumps(record.get('experience_details', [])),
+                json.dumps(record.get('education', [])),
+                json.dumps(record.get('projects', [])),
+                json.dumps(record.get('positions', [])),
+                'active',
+                uploaded_at
+            ))
+            candidate_ids.append(candidate_id)
+
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+    return {"candidate_ids": candidate_ids, "superseded": superseded}
+
+
+# Extraction Cache Functions
+
+def get_cached_extraction(content_hash: str) -> dict | None:
+    """Look up a cached extraction by PDF content hash.
+
+    Records the hit so cache usage can be inspected later.
+
+    Args:
+        content_hash: SHA-256 hex digest of the uploaded PDF bytes
+
+    Returns:
+        Dict with resume_text, local_data, gemini_data, pdf_path or None
+    """
+    if not content_hash:
+        return None
+
+    conn = get_db_connection()
+    cursor = conn.cursor()
+
+    cursor.execute('''
+        SELECT content_hash, resume_text, local_data, gemini_data, pdf_path
+        FROM extraction_cache
+        WHERE content_hash = ?
+    ''', (content_hash,))
+
+    row = cursor.fetchone()
+
+    if not row:
+        conn.close()
+        return None
+
+    cursor.execute('''
+        UPDATE extraction_cache
+        SET hit_count = hit_count + 1, last_hit_at = CURRENT_TIMESTAMP
+        WHERE content_hash = ?
+    ''', (content_hash,))
+
+    conn.commit()
+    conn.close()
+
+    try:
+        local_data = json.loads(row['local_data']) if row['local_data'] else {}
+        gemini_data = json.loads(row['gemini_data']) if row['gemini_data'] else {}
+    except json.JSONDecodeError:
+        return None
+
+    return {
+        "content_hash": row['content_hash'],
+        "resume_text": row['resume_text'],
+        "local_data": local_data,
+        "gemini_data": gemini_data,
+        "pdf_path": row['pdf_path']
+    }
+
+
+def store_cached_extraction(
+    content_hash: str,
+    resume_text: str,
+    local_data: dict,
+    gemini_data: dict,
+    pdf_path: str = None
+) -> None:
+    """Store extraction results for a PDF content hash.
+
+    Args:
+        content_hash: SHA-256 hex digest of the uploaded PDF bytes
+        resume_text: Text extracted from the PDF
+        local_data: Dict with name, email, phone
+        gemini_data: Dict with structured extraction
+        pdf_path: Path to stored PDF file
+    """
+    if not content_hash:
+        return
+
+    conn = get_db_connection()
+    cursor = conn.cursor()
+
+    cursor.execute('''
+        INSERT OR REPLACE INTO extraction_cache
+            (content_hash, resume_text, local_data, gemini_data, pdf_path)
+        VALUES (?, ?, ?, ?, ?)
+    ''', (
+        content_hash,
+        resume_text,
+        json.dumps(local_data),
+        json.dumps(gemini_data),
+        pdf_path
+    ))
+
+    conn.commit()
+    conn.close()
+
+
+# Gemini Response Cache Functions
+
+def get_cached_gemini_response(cache_key: str, ttl_seconds: int) -> str | None:
+    """Look up a cached Gemini response and mark it recently used.
+
+    Args:
+        cache_key: Key from gemini_cache.make_cache_key
+        ttl_seconds: Entries older than this are treated as missing
+
+    Returns:
+        Cached response JSON string, or None
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+
+    cursor.execute('''
+        SELECT response FROM gemini_response_cache
+        WHERE cache_key = ? AND created_at > STRFTIME('%Y-%m-%d %H:%M:%f', 'now', ?)
+    ''', (cache_key, f'-{ttl_seconds} seconds'))
+
+    row = cursor.fetchone()
+    if row:
+        cursor.execute('''
+            UPDATE gemini_response_cache
+            SET hit_count = hit_count + 1, last_used_at = STRFTIME('%Y-%m-%d %H:%M:%f', 'now')
+            WHERE cache_key = ?
+        ''', (cache_key,))
+        conn.commit()
+
+    conn.close()
+    return row['response'] if row else None
+
+
+def store_gemini_response(
+    cache_key: str,
+    model: str,
+    template: str,
+    response: str,
+    ttl_seconds: int,
+    max_entries: int
+) -> None:
+    """Store a Gemini response, dropping expired and least recently used entries.
+
+    Args:
+        cache_key: Key from gemini_cache.make_cache_key
+        model: Model name
+        template: Prompt template name
+        response: Response JSON string
+        ttl_seconds: Age after which entries are deleted
+        max_entries: Size bound; least recently used entries beyond it are deleted
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+
+    cursor.execute('''
+        INSERT OR REPLACE INTO gemini_response_cache (cache_key, model, template, response)
+        VALUES (?, ?, ?, ?)
+    ''', (cache_key, model, template, response))
+
+    cursor.execute('''
+        DELETE FROM gemini_response_cache
+        WHERE created_at <= STRFTIME('%Y-%m-%d %H:%M:%f', 'now', ?)
+    ''', (f'-{ttl_seconds} seconds',))
+
+    cursor.execute('''
+        DELETE FROM gemini_response_cache
+        WHERE cache_key IN (
+            SELECT cache_key FROM gemini_response_cache
+            ORDER BY last_used_at DESC
+            LIMIT -1 OFFSET ?
+        )
+    ''', (max_entries,))
+
+    conn.commit()
+    conn.close()
+
+
+# Near-Duplicate Signature Index Functions
+
+def store_resume_signature(candidate_id: str, role_id: str, signature: bytes, buckets: list) -> None:
+    """Index a candidate's MinHash signature and LSH buckets.
+
+    Args:
+        candidate_id: Candidate UUID
+        role_id: Role UUID
+        signature: Packed signature (near_duplicate.encode_signature)
+        buckets: List of (band, bucket) tuples
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+
+    cursor.execute('''
+        INSERT OR REPLACE INTO resume_signatures (candidate_id, role_id, signature)
+        VALUES (?, ?, ?)
+    ''', (candidate_id, role_id, signature))
+    cursor.execute('DELETE FROM resume_lsh_buckets WHERE candidate_id = ?', (candidate_id,))
+    cursor.executemany('''
+        INSERT INTO resume_lsh_buckets (role_id, band, bucket, candidate_id)
+        VALUES (?, ?, ?, ?)
+    ''', [(role_id, band, bucket, candidate_id) for band, bucket in buckets])
+
+    conn.commit()
+    conn.close()
+
+
+def get_signature_matches(role_id: str, buckets: list) -> list:
+    """Find active candidates sharing at least one LSH bucket.
+
+    Each (band, bucket) pair is an indexed lookup, so the cost depends on
+    the number of colliding candidates, not the pool size.
+
+    Args:
+        role_id: Role UUID
+        buckets: List of (band, bucket) tuples of the new resume
+
+    Returns:
+        List of dicts with candidate_id, email, signature, and the
+        candidate's structured extraction fields
+    """
+    if not buckets:
+        return []
+
+    conn = get_db_connection()
+    cursor = conn.cursor()
+
+    conditions = ' OR '.join(['(b.band = ? AND b.bucket = ?)'] * len(buckets))
+    params = [role_id] + [value for pair in buckets for value in pair]
+
+    cursor.execute(f'''
+        SELECT DISTINCT c.id AS candidate_id, c.email, s.signature,
+               c.skills, c.experience_years, c.experience_details,
+               c.education, c.projects, c.positions
+        FROM resume_lsh_buckets b
+        JOIN resume_signatures s ON s.candidate_id = b.candidate_id
+        JOIN candidates c ON c.id = b.candidate_id
+        WHERE b.role_id = ? AND ({conditions}) AND c.status = 'active'
+    ''', params)
+
+    rows = cursor.fetchall()
+    conn.close()
+
+    return [dict(row) for row in rows]
+
+
+# Ingestion Checkpoint Functions
+
+def get_ingested_file(path: str) -> dict | None:
+    """Get the checkpoint record of a watched file.
+
+    Args:
+        path: Absolute path of the file
+
+    Returns:
+        Dict with path, size, mtime, status or None if never ingested
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+
+    cursor.execute('''
+        SELECT path, size, mtime, status
+        FROM ingested_files
+        WHERE path = ?
+    ''', (path,))
+
+    row = cursor.fetchone()
+    conn.close()
+
+    return dict(row) if row else None
+
+
+def record_ingested_files(records: list) -> None:
+    """Checkpoint a batch of watched files in one transaction.
+
+    Args:
+        records: List of dicts with path, size, mtime, role_id,
+            session_id, status ('ingested' or 'failed'), and error
+    """
+    if not records:
+        return
+
+    conn = get_db_connection()
+    cursor = conn.cursor()
+
+    cursor.executemany('''
+        INSERT OR REPLACE INTO ingested_files
+            (path, size, mtime, role_id, session_id, status, error)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    ''', [
+        (r['path'], r['size'], r['mtime'], r.get('role_id'), r.get('session_id'), r['status'], r.get('error'))
+        for r in records
+    ])
+
+    conn.commit()
+    conn.close()
+
+
 def get_candidate_by_id(candidate_id: str) -> dict | None:
     """Get full candidate record by ID."""
     conn = get_db_connection()
@@ -647,6 +1106,23 @@ def create_session_for_upload(role_id: str, job_description: str = '') -> dict:
     return {"id": session_id}
 
 
+def get_latest_job_description(role_id: str) -> str | None:
+    """Get the most recent non-empty job description recorded for a role."""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+
+    cursor.execute('''
+        SELECT job_description FROM sessions
+        WHERE role_id = ? AND job_description != ''
+        ORDER BY created_at DESC
+        LIMIT 1
+    ''', (role_id,))
+
+    row = cursor.fetchone()
+    conn.close()
+    return row['job_description'] if row else None
+
+
 def update_session_counts(session_id: str, candidates_added: int, pool_size: int) -> None:
     """Update session with final counts after processing."""
     conn = get_db_connection()
@@ -2,21 +2,36 @@
 
 import json
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+from config import Config
 from models import (
     create_or_get_role,
     create_session,
+    create_session_for_upload,
+    get_candidate_count,
+    get_unranked_candidate_count,
+    get_latest_job_description,
+    get_role_by_id,
     update_session_counts,
     update_session_priorities,
     update_session_eliminations,
     update_session_thresholds,
     update_session_why_not_others,
     store_candidate_with_duplicate_check,
+    get_cached_extraction,
+    store_cached_extraction,
     get_db_connection
 )
-from services.pdf_parser import process_pdf_file
-from services.local_extractor import extract_basic_info
-from services.gemini_service import extract_structured_data, detect_job_priorities
+from services.pdf_parser import submit_pdf_save, compute_content_hash
+from services.file_store import compute_file_hash
+from services.extraction_worker import submit_pdf_extraction, submit_info_batch, wait_result
+from services.gemini_service import (
+    extract_structured_data_packed,
+    detect_job_priorities,
+    validate_extraction
+)
+from services.near_duplicate import compute_signature, find_near_duplicate, index_candidate
+from services.pipeline import StagedPipeline
 from services.pool_manager import get_pool_for_role
 from services.ranking_service import (
     process_threshold_elimination,
@@ -39,49 +54,503 @@ ANALYSIS_PHASES = [
 ]
 
 
-def process_single_resume(file, role_id: str, session_id: str) -> dict | None:
-    """Process a single resume through Phase 1.
+def read_upload(file) -> dict:
+    """Read an upload once and look it up in the extraction cache.
+
+    Uploads are keyed by a SHA-256 of their bytes, so a PDF that was
+    extracted before skips parsing and Gemini entirely. Files already on
+    disk (streamed uploads, watch-folder and CLI files) are not loaded:
+    the worker and the store read them by path.
+
+    Args:
+        file: Flask FileStorage object (or LocalFile / archive member)
+
+    Returns:
+        Work item dict with filename, data (None when source_path holds
+        the file), source_path, link_source, content_hash, and cached
+    """
+    source_path = getattr(file, 'local_path', None)
+    stream = None
+    if not source_path:
+        stream = getattr(file, 'stream', None)
+        source_path = getattr(stream, 'path', None)
+
+    if source_path:
+        data = None
+        if stream is not None:
+            stream.flush()  # the worker reads the temp file by name
+        # Streamed uploads were hashed while being written to disk
+        content_hash = getattr(stream, 'content_hash', None) or compute_file_hash(source_path)
+    else:
+        data = file.read()
+        content_hash = getattr(stream, 'content_hash', None) or compute_content_hash(data)
+
+    return {
+        "filename": file.filename,
+        "data": data,
+        "content_hash": content_hash,
+        "source_path": source_path,
+        # Only streamed upload temp files are ours to hard-link into the store
+        "link_source": stream is not None and source_path is not None,
+        "cached": get_cached_extraction(content_hash)
+    }
+
+
+def parse_resume(item: dict) -> bool:
+    """Parse stage: PDF validation, text extraction and triage on the process pool.
+
+    Files that triage rejects (cover letters, transcripts, scans without
+    text) stop here, before NER or any Gemini call. Starts saving the PDF
+    once it passed and releases the upload bytes.
+
+    Args:
+        item: Work item from read_upload
+
+    Returns:
+        True if the item can continue to name/contact extraction
+    """
+    source = item["data"] if item["data"] is not None else item["source_path"]
+    parsed = wait_result(submit_pdf_extraction(source))
+    pdf = parsed.get('pdf')
+
+    if parsed.get('error') or not pdf or not pdf['valid']:
+        item["error"] = parsed.get('error') or 'Invalid or corrupted PDF'
+        logger.warning(f"Failed to process PDF: {item['filename']} ({item['error']})")
+        return False
+
+    triage = parsed.get('triage')
+    if triage and not triage['accepted']:
+        item["error"] = f"Not a resume: {triage['reason']}"
+        item["rejected"] = True
+        logger.info(f"Triage rejected {item['filename']}: {triage['reason']} {triage['signals']}")
+        return False
+
+    item["resume_text"] = pdf['text']
+    if not item["resume_text"]:
+        logger.warning(f"No text in PDF: {item['filename']}")
+
+    # Section-filtered text for Gemini when the segmenter ran
+    item["prompt_text"] = pdf.get('prompt_text') or item["resume_text"]
+    item["tokens_saved"] = pdf.get('tokens_saved', 0)
+    item["sections"] = pdf.get('sections') or {}
+    if item["tokens_saved"]:
+        logger.info(f"Segmented {item['filename']}: ~{item['tokens_saved']} input tokens saved")
+
+    item["pdf_write"] = submit_pdf_save(
+        item["content_hash"],
+        item["data"],
+        item.get("source_path"),
+        item.get("link_source", False)
+    )
+    item["data"] = None
+    return True
+
+
+def saved_pdf_path(item: dict) -> str | None:
+    """Wait for an item's background PDF write and return its stored path.
+
+    Args:
+        item: Work item that passed parse_resume
+
+    Returns:
+        Stored path, or None if the write failed (so no record points at
+        a missing file)
+    """
+    if "pdf_path" not in item:
+        item["pdf_path"] = item["pdf_write"].result()
+        if not item["pdf_path"]:
+            logger.error(f"PDF for {item['filename']} could not be stored; keeping the candidate without it")
+    return item["pdf_path"]
+
+
+def identify_resumes(items: list) -> None:
+    """NER stage: name, email, phone for a batch of parsed resumes.
+
+    One batched spaCy pass covers the whole batch. If the batch fails
+    (e.g. blows its CPU budget), items are retried one by one so a single
+    pathological text can't take the rest down with it.
+
+    Args:
+        items: Work items that passed parse_resume
+    """
+    texts = [item["resume_text"] for item in items]
+    sections_list = [item.get("sections") or {} for item in items] if Config.LOCAL_EXTRACTION else None
+    result = wait_result(submit_info_batch(texts, sections_list))
+
+    if not result.get('error'):
+        structured = result.get('structured') or [None] * len(items)
+        for item, local_data, signature, local_structured in zip(
+            items, result['local_data'], result['signatures'], structured
+        ):
+            item["local_data"] = local_data
+            item["signature"] = signature
+            item["local_structured"] = local_structured
+        return
+
+    if len(items) == 1:
+        logger.warning(f"Name/contact extraction failed for {items[0]['filename']}: {result['error']}")
+        items[0]["local_data"] = {"name": None, "email": None, "phone": None}
+        return
+
+    logger.warning(f"Batch name/contact extraction failed ({result['error']}), retrying per file")
+    for item in items:
+        identify_resumes([item])
+
+
+def is_confident_local_extraction(data: dict | None) -> bool:
+    """Check whether a local structured extraction can replace Gemini.
+
+    Both the extractor's own confidence and validate_extraction's
+    quality score must clear their configured thresholds.
+
+    Args:
+        data: Result of extract_structured_local, or None
+
+    Returns:
+        True if Gemini can be skipped for this resume
+    """
+    if not data or data.get('confidence', 0) < Config.LOCAL_EXTRACTION_MIN_CONFIDENCE:
+        return False
+    return validate_extraction(data)['_quality_score'] >= Config.LOCAL_EXTRACTION_MIN_QUALITY
+
+
+def resolve_without_gemini(item: dict, role_id: str = None) -> bool:
+    """Try to fill in an item's structured data without calling Gemini.
+
+    A near-duplicate of a resume already in the role's pool reuses that
+    candidate's extraction. Confident local extractions (see
+    is_confident_local_extraction) are used as-is.
 
     Args:
-        file: Flask FileStorage object
+        item: Work item that passed parse_resume
+        role_id: Role UUID whose pool is checked for near-duplicates
+
+    Returns:
+        True if gemini_data is set, False if the item still needs Gemini
+    """
+    local_structured = item.get("local_structured")
+
+    near_duplicate = None
+    if role_id and item.get("signature"):
+        near_duplicate = find_near_duplicate(role_id, item["signature"], item["local_data"].get('email'))
+    if near_duplicate:
+        item["near_duplicate_id"] = near_duplicate['candidate_id']
+        logger.info(
+            f"{item['filename']} is a near-duplicate of candidate {near_duplicate['candidate_id']} "
+            f"(similarity {near_duplicate['similarity']:.2f})"
+        )
+
+    if near_duplicate and near_duplicate['similarity'] >= Config.NEAR_DUPLICATE_REUSE_THRESHOLD:
+        item["gemini_data"] = near_duplicate['gemini_data']
+        item["extraction_source"] = "reused"
+        return True
+
+    if is_confident_local_extraction(local_structured):
+        item["gemini_data"] = local_structured
+        item["extraction_source"] = "local"
+        logger.info(
+            f"Local extraction used for {item['filename']} "
+            f"(confidence {local_structured['confidence']})"
+        )
+        return True
+
+    return False
+
+
+def cache_extraction(item: dict) -> None:
+    """Cache an item's extraction; only complete ones, so failures get retried next time.
+
+    Items whose PDF could not be stored are not cached either, so a later
+    upload of the same file stores it again.
+    """
+    resume_text = item["resume_text"]
+    if resume_text.strip() and not item["gemini_data"].get('extraction_error') and saved_pdf_path(item):
+        store_cached_extraction(
+            content_hash=item["content_hash"],
+            resume_text=resume_text,
+            local_data=item["local_data"],
+            gemini_data=item["gemini_data"],
+            pdf_path=item["pdf_path"]
+        )
+
+
+def extract_resumes(items: list, role_id: str = None) -> None:
+    """Gemini stage: structured extraction for a batch, packed into few requests.
+
+    Items that still need Gemini after resolve_without_gemini are sent
+    together through extract_structured_data_packed.
+
+    Args:
+        items: Work items that passed parse_resume
+        role_id: Role UUID whose pool is checked for near-duplicates
+    """
+    pending = [item for item in items if not resolve_without_gemini(item, role_id)]
+
+    if pending:
+        extracted = extract_structured_data_packed([
+            item.get("prompt_text") or item["resume_text"] for item in pending
+        ])
+        for item, data in zip(pending, extracted):
+            item["gemini_data"] = data
+            item["extraction_source"] = "gemini"
+
+    for item in items:
+        cache_extraction(item)
+
+
+def store_resume(item: dict, role_id: str, session_id: str) -> dict:
+    """Writer stage: store candidate with duplicate check.
+
+    Args:
+        item: Work item that is cached or went through extraction
+        role_id: Role UUID
+        session_id: Session UUID
+
+    Returns:
+        Candidate dict with cache_hit flag
+    """
+    cached = item.get("cached")
+    if cached:
+        item["local_data"] = cached['local_data']
+        item["gemini_data"] = cached['gemini_data']
+        item["resume_text"] = cached['resume_text']
+        item["pdf_path"] = cached['pdf_path']
+    else:
+        saved_pdf_path(item)
+
+    result = store_candidate_with_duplicate_check(
+        role_id=role_id,
+        session_id=session_id,
+        local_data=item["local_data"],
+        gemini_data=item["gemini_data"],
+        resume_text=item["resume_text"],
+        pdf_path=item["pdf_path"],
+        near_duplicate_id=item.get("near_duplicate_id")
+    )
+    result['cache_hit'] = bool(cached)
+
+    # Cache hits skipped the worker pass, so sign them here
+    signature = item.get("signature") or compute_signature(item["resume_text"])
+    index_candidate(result['candidate_id'], role_id, signature)
+
+    source = " from cache" if cached else ""
+    logger.info(f"Processed{source}: {item['local_data'].get('name')} ({result['status']})")
+    return result
+
+
+def run_extraction_pipeline(files, role_id: str, session_id: str, on_progress=None) -> dict:
+    """Run Phase 1 as a staged producer/consumer pipeline.
+
+    Stages are connected by bounded queues, each with its own concurrency:
+    parse (process pool, one thread per extraction worker), ner (batched
+    spaCy on the same pool), gemini (rate-limited), and a single SQLite
+    writer. Cache hits go straight to the writer, so fast work never
+    waits behind Gemini. Files are pulled lazily, so a streaming source
+    (e.g. ZIP members) is only read as fast as the pipeline accepts it.
+
+    Args:
+        files: Iterable of upload-like objects (filename + read())
         role_id: Role UUID
         session_id: Session UUID
+        on_progress: Optional callback receiving a dict per finished resume
+            (called from pipeline threads)
 
     Returns:
-        Candidate dict or None if failed
+        Dict with candidates, errors ({filename, reason} per failed file),
+        rejected (triage and in-batch duplicates), cache_hits, uploaded,
+        segmentation totals, local/Gemini/reused extraction counts, and
+        pipeline stats
     """
+    results = {
+        "candidates": [],
+        "errors": [],
+        "rejected": 0,
+        "cache_hits": 0,
+        "uploaded": 0,
+        "segmented": 0,
+        "tokens_saved": 0,
+        "local_extractions": 0,
+        "gemini_extractions": 0,
+        "reused_extractions": 0
+    }
+    lock = threading.Lock()
+    pipeline = StagedPipeline(f"phase1-{session_id}")
+    first_by_hash = {}  # content hash -> first filename in this upload
+
+    def fail(item, reason):
+        if item.get("rejected"):
+            logger.info(f"Skipped {item['filename']}: {reason}")
+        else:
+            logger.error(f"Error processing {item['filename']}: {reason}")
+        item["data"] = None
+        with lock:
+            results["errors"].append({"filename": item["filename"], "reason": str(reason)})
+            if item.get("rejected"):
+                results["rejected"] += 1
+        if on_progress:
+            on_progress({"event": "resume", "filename": item["filename"], "status": "failed", "error": str(reason)})
+
+    def parse_stage(item):
+        if parse_resume(item):
+            pipeline.submit('ner', item)
+        else:
+            fail(item, item.get('error'))
+
+    def ner_stage(items):
+        identify_resumes(items)
+        for item in items:
+            pipeline.submit('gemini', item)
+
+    def gemini_stage(items):
+        extract_resumes(items, role_id)
+        for item in items:
+            with lock:
+                results[f"{item['extraction_source']}_extractions"] += 1
+                if item.get("tokens_saved"):
+                    results["segmented"] += 1
+                    results["tokens_saved"] += item["tokens_saved"]
+            pipeline.submit('writer', item)
+
+    def writer_stage(item):
+        candidate = store_resume(item, role_id, session_id)
+        with lock:
+            results["candidates"].append(candidate)
+            if candidate.get('cache_hit'):
+                results["cache_hits"] += 1
+            done = len(results["candidates"]) + len(results["errors"])
+
+        # Log progress every 10 resumes
+        if done % 10 == 0:
+            logger.info(f"Progress: {done} resumes processed")
+        if on_progress:
+            on_progress({
+                "event": "resume",
+                "filename": item["filename"],
+                "status": candidate['status'],
+                "candidate_id": candidate['candidate_id'],
+                "name": candidate.get('name'),
+                "superseded_id": candidate.get('superseded_id'),
+                "cache_hit": candidate['cache_hit'],
+                "source": item.get("extraction_source", "cache")
+            })
+
+    queue_size = Config.PIPELINE_QUEUE_SIZE
+    pipeline.add_stage('parse', parse_stage, Config.EXTRACTION_WORKERS, queue_size, fail)
+    pipeline.add_stage(
+        'ner', ner_stage, Config.EXTRACTION_WORKERS, max(queue_size, Config.NER_BATCH_SIZE), fail,
+        batch_size=max(1, Config.NER_BATCH_SIZE), batched=True
+    )
+    # Gemini workers collect a few resumes each so they can be packed into one request
+    pack_size = Config.EXTRACTION_PACK_MAX_RESUMES if Config.EXTRACTION_PACKING else 1
+    pipeline.add_stage(
+        'gemini', gemini_stage, Config.GEMINI_WORKERS, max(queue_size, pack_size), fail,
+        batch_size=max(1, pack_size), batch_timeout=Config.EXTRACTION_PACK_WAIT, batched=True
+    )
+    pipeline.add_stage('writer', writer_stage, 1, queue_size, fail)
+    pipeline.start()
+
     try:
-        # Extract PDF text
-        pdf_result = process_pdf_file(file)
-        if pdf_result['status'] == 'failed':
-            logger.warning(f"Failed to process PDF: {file.filename}")
-            return None
-
-        resume_text = pdf_result['text']
-        pdf_path = pdf_result.get('file_path')
-
-        # Local extraction (name, email, phone)
-        local_data = extract_basic_info(resume_text)
-
-        # Gemini extraction (skills, experience, etc.)
-        gemini_data = extract_structured_data(resume_text)
-
-        # Store candidate with duplicate check
-        result = store_candidate_with_duplicate_check(
-            role_id=role_id,
-            session_id=session_id,
-            local_data=local_data,
-            gemini_data=gemini_data,
-            resume_text=resume_text,
-            pdf_path=pdf_path
-        )
+        for file in files:
+            results["uploaded"] += 1
+            try:
+                item = read_upload(file)
+            except Exception as e:
+                fail({"filename": file.filename}, str(e))
+                continue
 
-        logger.info(f"Processed: {local_data.get('name')} ({result['status']})")
-        return result
+            # The same file twice in one upload would be extracted twice
+            if item["content_hash"] in first_by_hash:
+                item["rejected"] = True
+                fail(item, f"Duplicate of {first_by_hash[item['content_hash']]} in this upload")
+                continue
+            first_by_hash[item["content_hash"]] = item["filename"]
 
-    except Exception as e:
-        logger.error(f"Resume processing error for {file.filename}: {e}")
-        return None
+            pipeline.submit('writer' if item["cached"] else 'parse', item)
+    finally:
+        pipeline.close()
+
+    results["pipeline"] = pipeline.get_stats()
+    return results
+
+
+def summarize_extraction(phase1: dict) -> dict:
+    """Build the extraction block of analysis/ingestion responses.
+
+    Args:
+        phase1: Result of run_extraction_pipeline
+
+    Returns:
+        Dict with upload, cache, pipeline, and token-saving statistics
+    """
+    candidates = phase1['candidates']
+    errors = phase1['errors']
+
+    return {
+        "uploaded": phase1['uploaded'],
+        "processed": len(candidates),
+        "failed": len(errors),
+        "rejected": phase1['rejected'],
+        "errors": errors if errors else None,
+        "cache": {
+            "hits": phase1['cache_hits'],
+            "misses": phase1['uploaded'] - phase1['cache_hits']
+        },
+        "pipeline": phase1['pipeline'],
+        "structured_extraction": {
+            "local": phase1['local_extractions'],
+            "gemini": phase1['gemini_extractions'],
+            "reused_from_near_duplicates": phase1['reused_extractions']
+        },
+        "segmentation": {
+            "segmented": phase1['segmented'],
+            "tokens_saved": phase1['tokens_saved'],
+            "avg_tokens_saved": (
+                round(phase1['tokens_saved'] / phase1['segmented']) if phase1['segmented'] else 0
+            )
+        }
+    }
+
+
+def run_ingestion(role_title: str, files, job_description: str = '', on_progress=None) -> dict:
+    """Run Phase 1 only: add resumes to a role's pool without ranking.
+
+    Used for bulk intake outside the interactive analyze request; the
+    pool is ranked later, on demand, by run_ranking.
+
+    Args:
+        role_title: Title of the role (created if new)
+        files: Iterable of uploads (FileStorage objects, archive members, local files)
+        job_description: JD text to record on the session, if known
+        on_progress: Optional per-resume progress callback (see run_extraction_pipeline)
+
+    Returns:
+        Dict with session_id, role, extraction summary, and candidates
+    """
+    role = create_or_get_role(role_title)
+    role_id = role['id']
+    session_id = create_session_for_upload(role_id, job_description)['id']
+    logger.info(f"Ingesting resumes for role {role_title} (session {session_id})")
+
+    phase1 = run_extraction_pipeline(files, role_id, session_id, on_progress)
+    pool_size = get_candidate_count(role_id)
+    update_session_counts(session_id, len(phase1['candidates']), pool_size)
+
+    logger.info(
+        f"Ingestion complete: {len(phase1['candidates'])} candidates added, "
+        f"{len(phase1['errors'])} failed, pool size {pool_size}"
+    )
+
+    return {
+        "session_id": session_id,
+        "role": {
+            "id": role_id,
+            "title": role_title,
+            "is_new": role.get('is_new', False),
+            "total_in_pool": pool_size
+        },
+        "extraction": summarize_extraction(phase1),
+        "candidates": phase1['candidates']
+    }
 
 
 def generate_why_not_others(
@@ -175,86 +644,41 @@ def store_rankings(session_id: str, rankings: list) -> None:
     logger.info(f"Stored rankings for {len(rankings)} candidates")
 
 
-def run_full_analysis(
-    role_title: str,
+def rank_pool(
+    role_id: str,
+    session_id: str,
     job_description: str,
-    files: list,
     weights: dict,
-    thresholds: dict
+    thresholds: dict,
+    report_phase=None
 ) -> dict:
-    """Run complete analysis pipeline.
-
-    Phase 1: Extract data from each PDF
-    Phase 2: Multi-level ranking
+    """Run Phase 2 on a role's current pool and store the results on a session.
 
     Args:
-        role_title: Title of the role
+        role_id: Role UUID
+        session_id: Session UUID the rankings are recorded under
         job_description: Job description text
-        files: List of Flask FileStorage objects
-        weights: Dimension weights
+        weights: Validated dimension weights
         thresholds: Threshold configuration
+        report_phase: Optional callback receiving the ANALYSIS_PHASES index
+            as each phase starts
 
     Returns:
-        Complete analysis result
+        Dict with the ranking part of an analysis response, plus pool_size
     """
-    logger.info(f"Starting analysis for role: {role_title}")
-
-    # Validate and normalize weights
-    weights = validate_weights(weights)
-
-    # Step 1: Create/get role
-    role = create_or_get_role(role_title, weights)
-    role_id = role['id']
-    logger.info(f"Role: {role_id} (is_new: {role.get('is_new')})")
-
-    # Step 2: Create session
-    session_id = create_session(role_id, job_description, 0, 0)
-    logger.info(f"Session: {session_id}")
-
-    # Step 3: Phase 1 - Extract data from PDFs (concurrent processing)
-    logger.info(f"Phase 1: Extracting {len(files)} resumes with concurrent processing")
-    new_candidates = []
-    extraction_errors = []
-
-    # Use ThreadPoolExecutor for concurrent PDF processing
-    # Limit to 1 worker to stay within Gemini free tier rate limits
-    max_workers = 1
-
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all files for processing
-        future_to_file = {
-            executor.submit(process_single_resume, file, role_id, session_id): file
-            for file in files
-        }
-
-        # Collect results as they complete
-        for i, future in enumerate(as_completed(future_to_file)):
-            file = future_to_file[future]
-            try:
-                candidate = future.result()
-                if candidate:
-                    new_candidates.append(candidate)
-                else:
-                    extraction_errors.append(file.filename)
-            except Exception as e:
-                logger.error(f"Error processing {file.filename}: {e}")
-                extraction_errors.append(file.filename)
-
-            # Log progress every 10 resumes
-            if (i + 1) % 10 == 0:
-                logger.info(f"Progress: {i + 1}/{len(files)} resumes processed")
-
-    logger.info(f"Phase 1 complete: {len(new_candidates)} candidates extracted")
-    if extraction_errors:
-        logger.warning(f"Failed to extract: {extraction_errors}")
+    def report(index):
+        if report_phase:
+            report_phase(index)
 
-    # Step 4: Fetch full pool
+    # Fetch full pool
+    report(1)
     pool = get_pool_for_role(role_id)
     pool_size = len(pool)
     logger.info(f"Pool size: {pool_size} candidates")
 
-    # Step 5: Level 1 - Infer priorities
+    # Level 1 - Infer priorities
     logger.info("Phase 2 Level 1: Detecting priorities")
+    report(2)
     priority_result = detect_job_priorities(job_description)
     priorities = priority_result.get('inferred_priorities', {})
     priority_reasoning = priority_result.get('reasoning', '')
@@ -262,8 +686,9 @@ def run_full_analysis(
     # Store priorities in session
     update_session_priorities(session_id, priorities, priority_reasoning)
 
-    # Step 6: Level 2 - Apply thresholds
+    # Level 2 - Apply thresholds
     logger.info("Phase 2 Level 2: Applying thresholds")
+    report(3)
     threshold_result = process_threshold_elimination(
         job_description, pool, thresholds
     )
@@ -275,45 +700,31 @@ def run_full_analysis(
     update_session_thresholds(session_id, thresholds)
     update_session_eliminations(session_id, elimination_summary)
 
-    # Step 7: Level 3 & 4 - Rank with tie-breakers
+    # Level 3 & 4 - Rank with tie-breakers
     logger.info(f"Phase 2 Level 3-4: Ranking {len(remaining)} candidates")
+    report(4)
     rankings = []
     if remaining:
         rankings = rank_with_tie_breakers(
             job_description, remaining, weights, priorities
         )
 
-    # Step 8: Store rankings
     if rankings:
         store_rankings(session_id, rankings)
 
-    # Step 9: Update session with results
-    update_session_counts(session_id, len(new_candidates), pool_size)
-
-    # Step 10: Build response
     top_candidates = rankings[:6]  # Top 6 for dashboard
 
     # Get tie-breaker summary
+    report(5)
     tie_breaker_info = get_tie_breaker_summary(rankings) if rankings else {"count": 0}
 
     # Generate and store why-not-others explanation
     why_not_others_text = generate_why_not_others(rankings, eliminated, pool_size)
     update_session_why_not_others(session_id, why_not_others_text)
+    report(6)
 
     return {
-        "session_id": session_id,
-        "role": {
-            "id": role_id,
-            "title": role_title,
-            "is_new": role.get('is_new', False),
-            "total_in_pool": pool_size
-        },
-        "extraction": {
-            "uploaded": len(files),
-            "processed": len(new_candidates),
-            "failed": len(extraction_errors),
-            "errors": extraction_errors if extraction_errors else None
-        },
+        "pool_size": pool_size,
         "inferred_priorities": priorities,
         "priority_reasoning": priority_reasoning,
         "eliminated": elimination_summary,
@@ -326,6 +737,159 @@ def run_full_analysis(
     }
 
 
+def _phase_reporter(on_progress):
+    """Turn an on_progress callback into a report_phase(index) callback."""
+    if not on_progress:
+        return None
+
+    def report_phase(index):
+        on_progress({
+            "event": "phase",
+            "phase": ANALYSIS_PHASES[index],
+            "step": index + 1,
+            "total_steps": len(ANALYSIS_PHASES)
+        })
+
+    return report_phase
+
+
+def run_full_analysis(
+    role_title: str,
+    job_description: str,
+    files,
+    weights: dict,
+    thresholds: dict,
+    on_progress=None
+) -> dict:
+    """Run complete analysis pipeline.
+
+    Phase 1: Extract data from each PDF
+    Phase 2: Multi-level ranking
+
+    Args:
+        role_title: Title of the role
+        job_description: Job description text
+        files: Iterable of uploads (FileStorage objects or archive members)
+        weights: Dimension weights
+        thresholds: Threshold configuration
+        on_progress: Optional callback receiving progress dicts: a "phase"
+            event as each of ANALYSIS_PHASES starts, and a "resume" event
+            per finished resume
+
+    Returns:
+        Complete analysis result
+    """
+    logger.info(f"Starting analysis for role: {role_title}")
+    report_phase = _phase_reporter(on_progress)
+
+    # Validate and normalize weights
+    weights = validate_weights(weights)
+
+    # Step 1: Create/get role
+    role = create_or_get_role(role_title, weights)
+    role_id = role['id']
+    logger.info(f"Role: {role_id} (is_new: {role.get('is_new')})")
+
+    # Step 2: Create session
+    session_id = create_session(role_id, job_description, 0, 0)
+    logger.info(f"Session: {session_id}")
+
+    # Step 3: Phase 1 - Extract data from PDFs (staged pipeline)
+    logger.info("Phase 1: Extracting resumes through staged pipeline")
+    if report_phase:
+        report_phase(0)
+    phase1 = run_extraction_pipeline(files, role_id, session_id, on_progress)
+    new_candidates = phase1['candidates']
+    extraction_errors = phase1['errors']
+    cache_hits = phase1['cache_hits']
+
+    logger.info(
+        f"Phase 1 complete: {len(new_candidates)} candidates extracted "
+        f"({cache_hits} from cache)"
+    )
+    logger.info(f"Phase 1 pipeline stats: {json.dumps(phase1['pipeline'])}")
+    if extraction_errors:
+        logger.warning(f"Failed to extract: {[e['filename'] for e in extraction_errors]}")
+
+    # Step 4: Phase 2 - Rank the full pool
+    ranking = rank_pool(role_id, session_id, job_description, weights, thresholds, report_phase)
+    pool_size = ranking.pop('pool_size')
+    update_session_counts(session_id, len(new_candidates), pool_size)
+
+    return {
+        "session_id": session_id,
+        "role": {
+            "id": role_id,
+            "title": role_title,
+            "is_new": role.get('is_new', False),
+            "total_in_pool": pool_size
+        },
+        "extraction": summarize_extraction(phase1),
+        **ranking
+    }
+
+
+def run_ranking(
+    role_id: str,
+    job_description: str = None,
+    weights: dict = None,
+    thresholds: dict = None,
+    on_progress=None
+) -> dict:
+    """Run Phase 2 only: rank a role's existing pool on demand.
+
+    Pairs with run_ingestion: resumes trickle into the pool without
+    ranking, and the pool is ranked once when results are needed.
+
+    Args:
+        role_id: Role UUID
+        job_description: JD text (defaults to the role's most recent one)
+        weights: Dimension weights (defaults to the role's saved weights)
+        thresholds: Threshold configuration
+        on_progress: Optional callback receiving a "phase" event per phase
+
+    Returns:
+        Analysis result in the run_full_analysis shape, without the
+        extraction block; candidates_added counts pool members that had
+        not been ranked before. None if the role does not exist.
+
+    Raises:
+        ValueError: If no job description is given or recorded for the role
+    """
+    role = get_role_by_id(role_id)
+    if not role:
+        return None
+
+    job_description = job_description or get_latest_job_description(role_id)
+    if not job_description:
+        raise ValueError("Job description is required: none recorded for this role")
+
+    if not weights and role.get('weights'):
+        weights = json.loads(role['weights'])
+    weights = validate_weights(weights or {})
+    thresholds = thresholds or {}
+
+    candidates_added = get_unranked_candidate_count(role_id)
+    session_id = create_session(role_id, job_description, 0, 0)
+    logger.info(f"Ranking pool for role {role['title']} (session {session_id}, {candidates_added} unranked)")
+
+    ranking = rank_pool(role_id, session_id, job_description, weights, thresholds, _phase_reporter(on_progress))
+    pool_size = ranking.pop('pool_size')
+    update_session_counts(session_id, candidates_added, pool_size)
+
+    return {
+        "session_id": session_id,
+        "role": {
+            "id": role_id,
+            "title": role['title'],
+            "is_new": False,
+            "total_in_pool": pool_size
+        },
+        "candidates_added": candidates_added,
+        **ranking
+    }
+
+
 def format_top_candidates(top_candidates: list, pool: list) -> list:
     """Format top candidates with additional info from pool.
 
@@ -0,0 +1,195 @@
+"""Streaming ZIP archive ingestion with zip-bomb guards."""
+
+import logging
+import os
+import threading
+import zipfile
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+
+
+class ArchiveLimitError(ValueError):
+    """Raised when an archive or member exceeds ingestion limits."""
+
+
+def is_zip_upload(file) -> bool:
+    """Check whether an uploaded file is a ZIP archive."""
+    filename = (file.filename or '').lower()
+    return filename.endswith('.zip') or file.mimetype in ('application/zip', 'application/x-zip-compressed')
+
+
+class _ByteBudget:
+    """Total decompressed bytes allowed across one archive."""
+
+    def __init__(self, limit: int):
+        self.remaining = limit
+        self._lock = threading.Lock()
+
+    def consume(self, size: int) -> None:
+        with self._lock:
+            self.remaining -= size
+            if self.remaining < 0:
+                raise ArchiveLimitError("Archive exceeds total uncompressed size limit")
+
+
+class ArchiveMember:
+    """Upload-like view of one PDF inside a ZIP (filename + read()).
+
+    Nothing is decompressed until read() is called, and then only this
+    member, in chunks, with the real size checked as it streams (headers
+    can lie about sizes).
+    """
+
+    def __init__(self, archive: zipfile.ZipFile, info: zipfile.ZipInfo, budget: _ByteBudget):
+        self._archive = archive
+        self._info = info
+        self._budget = budget
+        self.filename = os.path.basename(info.filename)
+
+    def read(self) -> bytes:
+        max_size = Config.ZIP_MAX_MEMBER_MB * 1024 * 1024
+        info = self._info
+
+        if info.file_size > max_size:
+            raise ArchiveLimitError(f"Member exceeds {Config.ZIP_MAX_MEMBER_MB}MB limit")
+        if info.compress_size and info.file_size / info.compress_size > Config.ZIP_MAX_RATIO:
+            raise ArchiveLimitError("Member compression ratio too high")
+
+        chunks = []
+        size = 0
+        with self._archive.open(info) as member:
+            while True:
+                chunk = member.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_size:
+                    raise ArchiveLimitError(f"Member exceeds {Config.ZIP_MAX_MEMBER_MB}MB limit")
+                self._budget.consume(len(chunk))
+                chunks.append(chunk)
+
+        return b''.join(chunks)
+
+
+def _pdf_members(archive: zipfile.ZipFile) -> list:
+    """List PDF entries, skipping folders, macOS metadata and encrypted files."""
+    members = []
+    for info in archive.infolist():
+        name = info.filename
+        if info.is_dir() or name.startswith('__MACOSX/') or os.path.basename(name).startswith('._'):
+            continue
+        if not name.lower().endswith('.pdf'):
+            continue
+        if info.flag_bits & 0x1:
+            logger.warning(f"Skipping encrypted archive member: {name}")
+            continue
+        members.append(info)
+    return members
+
+
+def open_resume_archive(fileobj) -> tuple:
+    """Open a ZIP and validate it from the central directory alone.
+
+    Only metadata is read here; members are decompressed lazily later.
+
+    Args:
+        fileobj: Seekable file object holding the archive
+
+    Returns:
+        Tuple of (ZipFile, list of PDF ZipInfo entries)
+
+    Raises:
+        ArchiveLimitError: Too many members or declared size too large
+        zipfile.BadZipFile: Not a valid ZIP
+    """
+    archive = zipfile.ZipFile(fileobj)
+    members = _pdf_members(archive)
+
+    if len(members) > Config.ZIP_MAX_MEMBERS:
+        archive.close()
+        raise ArchiveLimitError(f"Archive has {len(members)} PDFs (limit {Config.ZIP_MAX_MEMBERS})")
+
+    declared = sum(info.file_size for info in members)
+    if declared > Config.ZIP_MAX_TOTAL_MB * 1024 * 1024:
+        archive.close()
+        raise ArchiveLimitError(f"Archive exceeds {Config.ZIP_MAX_TOTAL_MB}MB uncompressed")
+
+    return archive, members
+
+
+def iter_archive_members(archive: zipfile.ZipFile, members: list):
+    """Yield lazily-read PDF members, closing the archive when done."""
+    budget = _ByteBudget(Config.ZIP_MAX_TOTAL_MB * 1024 * 1024)
+    try:
+        for info in members:
+            yield ArchiveMember(archive, info, budget)
+    finally:
+        archive.close()
+
+
+def expand_uploads(files: list):
+    """Validate any ZIP uploads and return a lazy stream of resume files.
+
+    Archives are validated up front so bad input fails before analysis
+    starts; their members are then streamed one at a time as the
+    pipeline pulls them.
+
+    Args:
+        files: Flask FileStorage objects (PDFs and/or ZIPs)
+
+    Returns:
+        Generator of upload-like objects with filename and read()
+
+    Raises:
+        ArchiveLimitError: An archive exceeds ingestion limits
+        zipfile.BadZipFile: An upload named .zip is not a valid archive
+    """
+    sources = []
+    for file in files:
+        if is_zip_upload(file):
+            archive, members = open_resume_archive(file.stream)
+            logger.info(f"Archive {file.filename}: {len(members)} PDFs")
+            sources.append((archive, members))
+        else:
+            sources.append(file)
+
+    def generate():
+        for source in sources:
+            if isinstance(source, tuple):
+                yield from iter_archive_members(*source)
+            else:
+                yield source
+
+    return generate()
+
+
+def expand_uploads_individually(files: list) -> tuple:
+    """Expand uploads one by one, setting aside ZIPs that fail validation.
+
+    Unlike expand_uploads, one bad archive doesn't reject the whole batch;
+    used for unattended intake (watch folders, CLI) where there is no one
+    to send a 400 to.
+
+    Args:
+        files: Upload-like objects (filename, mimetype, stream, read())
+
+    Returns:
+        Tuple of (generator of resume files, dict of rejected filename -> reason)
+    """
+    sources = []
+    rejected = {}
+    for file in files:
+        try:
+            sources.append(expand_uploads([file]))
+        except (ArchiveLimitError, zipfile.BadZipFile) as e:
+            logger.warning(f"Skipping archive {file.filename}: {e}")
+            rejected[file.filename] = str(e)
+
+    def generate():
+        for source in sources:
+            yield from source
+
+    return generate(), rejected
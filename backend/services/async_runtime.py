@@ -0,0 +1,73 @@
+"""Shared asyncio event loop for Gemini calls.
+
+All async Gemini work runs on one background loop thread, so hundreds of
+requests can be in flight without a thread each, and the SDK's async
+client is only ever used from a single loop. Synchronous callers (Flask
+handlers, pipeline threads) hand coroutines to the loop with run_async.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Loop thread and in-flight semaphore, created on first use
+_loop = None
+_loop_thread = None
+_semaphore = None
+_loop_lock = threading.Lock()
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Get the shared event loop, starting its thread on first use."""
+    global _loop, _loop_thread
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            _loop_thread = threading.Thread(target=_loop.run_forever, name='gemini-loop', daemon=True)
+            _loop_thread.start()
+            logger.info("Started Gemini event loop")
+        return _loop
+
+
+def run_async(coro):
+    """Run a coroutine on the shared loop and block until it finishes.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result (its exception is re-raised)
+
+    Raises:
+        RuntimeError: If called from the loop thread itself, which would deadlock
+    """
+    loop = get_loop()
+    if threading.current_thread() is _loop_thread:
+        coro.close()
+        raise RuntimeError("run_async called from the Gemini event loop; await the coroutine instead")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+def get_request_semaphore() -> asyncio.Semaphore:
+    """Semaphore bounding concurrent Gemini requests (only use on the shared loop)."""
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(max(1, Config.GEMINI_MAX_IN_FLIGHT))
+    return _semaphore
+
+
+def _reset_after_fork() -> None:
+    """Forked children get no running loop thread, so start fresh."""
+    global _loop, _loop_thread, _semaphore, _loop_lock
+    _loop = None
+    _loop_thread = None
+    _semaphore = None
+    _loop_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,95 @@
+"""Single-pass contact extraction (email, phone, profile links)."""
+
+import re
+
+# Contacts almost always sit in the resume header; the body is only
+# scanned when the header has no email or no phone.
+HEADER_CHARS = 1500
+
+# Header lines longer than this are cut at whitespace instead of the line end
+MAX_HEADER_OVERRUN = 200
+
+REQUIRED_FIELDS = ('email', 'phone')
+
+WHITESPACE_RE = re.compile(r'\s')
+
+CONTACT_FIELDS = ('email', 'phone', 'linkedin', 'github')
+
+# One compiled alternation so each region is scanned once. Alternatives
+# are tried left to right at each position: emails and links come first
+# so their digits are consumed before the phone pattern can see them.
+CONTACT_RE = re.compile(
+    r'(?P<email>[\w.+-]+@[\w-]+(?:\.[\w-]+)*\.\w+)'
+    r'|(?P<linkedin>(?:https?://)?(?:[\w-]+\.)?linkedin\.com/(?:in|pub)/[\w%-]+/?)'
+    r'|(?P<github>(?:https?://)?(?:www\.)?github\.com/[\w-]+(?:/[\w.-]+)?)'
+    r'|(?P<phone>'
+    r'\+?\d{1,3}[-.\s]?\d{3}[-.\s]?\d{3}[-.\s]?\d{4}'
+    r'|\+?\d{1,3}[-.\s]?\d{3}[-.\s]?\d{7}'
+    r'|\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
+    r'|\d{10,13})',
+    re.IGNORECASE
+)
+
+
+def _scan(region: str, found: dict) -> None:
+    """Fill missing fields in found from one pass over region."""
+    for match in CONTACT_RE.finditer(region):
+        field = match.lastgroup
+        if found[field] is None:
+            found[field] = match.group(field).strip()
+            if all(found[f] is not None for f in CONTACT_FIELDS):
+                return
+
+
+def _header_end(text: str) -> int:
+    """End of the header region, moved forward so no token is split."""
+    if len(text) <= HEADER_CHARS:
+        return len(text)
+    newline = text.find('\n', HEADER_CHARS, HEADER_CHARS + MAX_HEADER_OVERRUN)
+    if newline != -1:
+        return newline
+    match = WHITESPACE_RE.search(text, HEADER_CHARS)
+    return match.start() if match else len(text)
+
+
+def extract_contacts(text: str) -> dict:
+    """Extract email, phone, LinkedIn and GitHub in a single scan.
+
+    The header region is scanned first; the rest of the resume is only
+    scanned when the email or phone is still missing. Missing profile
+    links alone do not trigger a second pass.
+
+    Args:
+        text: Resume text content
+
+    Returns:
+        Dict with email, phone, and links (linkedin, github); None when missing
+    """
+    found = dict.fromkeys(CONTACT_FIELDS)
+
+    if text:
+        end = _header_end(text)
+        _scan(text[:end], found)
+        if end < len(text) and any(found[f] is None for f in REQUIRED_FIELDS):
+            _scan(text[end:], found)
+
+    return {
+        "email": found['email'].lower() if found['email'] else None,
+        "phone": found['phone'],
+        "links": {
+            "linkedin": found['linkedin'],
+            "github": found['github']
+        }
+    }
+
+
+def extract_contacts_batch(texts: list) -> list:
+    """Extract contacts for a batch of resumes.
+
+    Args:
+        texts: List of resume text contents
+
+    Returns:
+        List of contact dicts, aligned with texts
+    """
+    return [extract_contacts(text) for text in texts]
@@ -0,0 +1,331 @@
+"""Process-pool worker for CPU-bound local extraction (PyMuPDF + spaCy)."""
+
+import logging
+import os
+import signal
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Shared pool, created on first use
+_executor = None
+_executor_lock = threading.Lock()
+
+# SIGPROF can't interrupt a worker stuck inside C code (MuPDF), so the
+# kernel kills it (SIGXCPU) once it uses this multiple of its CPU budget
+CPU_BACKSTOP_FACTOR = 2
+
+# Wall-clock allowance per task, counted from when the task starts, as a
+# multiple of the CPU budget; past it the pool is killed and restarted
+WALL_CLOCK_FACTOR = 4
+START_POLL_INTERVAL = 0.05  # seconds
+
+
+class ExtractionTimeout(Exception):
+    """Raised inside a worker when a file exceeds its CPU budget."""
+
+
+def _current_address_space() -> int:
+    """Get this process's virtual memory size in bytes (Linux only)."""
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[0])
+        return pages * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def _on_cpu_budget_exceeded(signum, frame):
+    raise ExtractionTimeout("CPU budget exceeded")
+
+
+def _init_worker(memory_limit_mb: int) -> None:
+    """Preload spaCy once per worker and cap its address space.
+
+    With the fork start method and an app-level preload, the model is
+    inherited and this load is a no-op. The memory cap is applied after
+    the model is loaded so the budget covers per-file work only.
+    """
+    from services.local_extractor import get_nlp
+
+    if Config.NAME_EXTRACTION_MODE == 'spacy':
+        try:
+            get_nlp()
+        except Exception as e:
+            logger.error(f"Worker failed to preload spaCy model: {e}")
+
+    signal.signal(signal.SIGPROF, _on_cpu_budget_exceeded)
+
+    if memory_limit_mb:
+        try:
+            import resource
+            baseline = _current_address_space()
+            limit = baseline + memory_limit_mb * 1024 * 1024
+            _, hard = resource.getrlimit(resource.RLIMIT_AS)
+            if hard != resource.RLIM_INFINITY:
+                limit = min(limit, hard)
+            resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+        except (ImportError, ValueError, OSError) as e:
+            logger.warning(f"Could not set worker memory limit: {e}")
+
+
+def _set_cpu_backstop(cpu_budget: float = None) -> None:
+    """Move the soft RLIMIT_CPU just past this task's budget (None lifts it).
+
+    The limit counts the worker's total CPU time, so it is set relative to
+    what the worker has used so far. Python installs no SIGXCPU handler,
+    so hitting it terminates the worker even in the middle of a C call.
+    """
+    try:
+        import resource
+        _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+        soft = hard
+        if cpu_budget:
+            usage = resource.getrusage(resource.RUSAGE_SELF)
+            soft = int(usage.ru_utime + usage.ru_stime + cpu_budget * CPU_BACKSTOP_FACTOR) + 1
+            if hard != resource.RLIM_INFINITY:
+                soft = min(soft, hard)
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+    except (ImportError, ValueError, OSError) as e:
+        logger.warning(f"Could not set worker CPU limit: {e}")
+
+
+def _run_with_budget(fn, cpu_budget: float = None) -> dict:
+    """Run fn() under the CPU budget, mapping budget errors to an error dict."""
+    if cpu_budget:
+        _set_cpu_backstop(cpu_budget)
+        signal.setitimer(signal.ITIMER_PROF, cpu_budget)
+
+    try:
+        return {**fn(), "error": None}
+    except ExtractionTimeout:
+        return {"error": f"Extraction exceeded {cpu_budget}s CPU budget"}
+    except MemoryError:
+        return {"error": "Extraction exceeded memory budget"}
+    finally:
+        if cpu_budget:
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            _set_cpu_backstop(None)
+
+
+def extract_pdf(source: bytes | str, cpu_budget: float = None) -> dict:
+    """Parse one PDF inside a pool worker.
+
+    A CPU-time timer aborts pathological PDFs, and the kernel kills the
+    worker if the file keeps it busy inside MuPDF past that; allocations
+    past the memory cap surface as MemoryError.
+
+    Args:
+        source: Raw PDF bytes, or the path of the upload on disk (read
+            here, so large files aren't pickled across to the worker)
+        cpu_budget: CPU seconds allowed for this file
+
+    Returns:
+        Dict with pdf (analysis result), triage (None when disabled or
+        the PDF is invalid), and error
+    """
+    from services.pdf_parser import analyze_pdf
+    from services.triage import triage_document
+
+    def run():
+        pdf = analyze_pdf(
+            source,
+            Config.TEXT_CHAR_BUDGET,
+            Config.TEXT_PAGE_BUDGET,
+            segment=Config.SEGMENT_RESUMES
+        )
+        triage = triage_document(pdf) if Config.TRIAGE_ENABLED and pdf['valid'] else None
+        return {"pdf": pdf, "triage": triage}
+
+    return _run_with_budget(run, cpu_budget)
+
+
+def read_full_text(path: str, cpu_budget: float = None) -> dict:
+    """Read every page of a stored PDF inside a pool worker.
+
+    Args:
+        path: Stored PDF path
+        cpu_budget: CPU seconds allowed for this file
+
+    Returns:
+        Dict with text and error
+    """
+    from services.pdf_parser import extract_full_text
+
+    return _run_with_budget(lambda: {"text": extract_full_text(path)}, cpu_budget)
+
+
+def extract_info_batch(texts: list, cpu_budget: float = None, sections_list: list = None) -> dict:
+    """Run batched name/contact (and local structured) extraction in a pool worker.
+
+    Args:
+        texts: Resume texts for one batch
+        cpu_budget: CPU seconds allowed for the whole batch
+        sections_list: Segmenter sections per text, enables local structured extraction
+
+    Returns:
+        Dict with local_data, signatures, and structured (lists aligned
+        with texts) and error
+    """
+    from services.local_extractor import extract_basic_info_batch
+    from services.near_duplicate import compute_signature
+    from services.structured_extractor import extract_structured_local
+
+    def run():
+        # Workers are already one per core, so spaCy runs single-process here
+        result = {
+            "local_data": extract_basic_info_batch(texts, n_process=1),
+            "signatures": [compute_signature(text) for text in texts],
+            "structured": None
+        }
+        if sections_list is not None:
+            result["structured"] = [
+                extract_structured_local(text, sections) if text else None
+                for text, sections in zip(texts, sections_list)
+            ]
+        return result
+
+    return _run_with_budget(run, cpu_budget)
+
+
+def get_executor() -> ProcessPoolExecutor:
+    """Get the shared extraction pool, sized to the core count by default."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            workers = max(1, Config.EXTRACTION_WORKERS)
+            _executor = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(Config.EXTRACTION_MEMORY_MB,)
+            )
+            logger.info(f"Started extraction pool with {workers} workers")
+        return _executor
+
+
+def _reset_executor(executor: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next submission starts a fresh one.
+
+    Several waiters can notice the same broken pool; only the first
+    resets it, so a replacement pool is never shut down by mistake.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is executor:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+def _kill_workers(executor: ProcessPoolExecutor) -> None:
+    """Kill every worker of a pool, including ones hung in C code."""
+    kill_workers = getattr(executor, 'kill_workers', None)  # Python 3.14+
+    if kill_workers:
+        kill_workers()
+        return
+    for process in list((getattr(executor, '_processes', None) or {}).values()):
+        try:
+            process.kill()
+        except Exception as e:
+            logger.warning(f"Could not kill extraction worker {process.pid}: {e}")
+
+
+def _reset_after_fork() -> None:
+    """Forked children must not reuse the parent's pool or lock."""
+    global _executor, _executor_lock
+    _executor = None
+    _executor_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _submit(fn, *args):
+    """Submit work to the pool, restarting it once if it is broken.
+
+    The returned future remembers its pool (extraction_pool), so
+    wait_result can recycle the right one.
+    """
+    executor = get_executor()
+    try:
+        future = executor.submit(fn, *args)
+    except BrokenProcessPool:
+        logger.warning("Extraction pool broken, restarting")
+        _reset_executor(executor)
+        executor = get_executor()
+        future = executor.submit(fn, *args)
+    future.extraction_pool = executor
+    return future
+
+
+def submit_pdf_extraction(source: bytes | str):
+    """Submit one file's PDF parsing to the process pool.
+
+    Args:
+        source: Raw PDF bytes, or the path of a file holding them
+
+    Returns:
+        Future resolving to the extract_pdf result dict
+    """
+    return _submit(extract_pdf, source, Config.EXTRACTION_TIMEOUT)
+
+
+def submit_full_text(path: str):
+    """Submit on-demand full-text extraction of a stored PDF.
+
+    Returns:
+        Future resolving to the read_full_text result dict
+    """
+    return _submit(read_full_text, path, Config.EXTRACTION_TIMEOUT)
+
+
+def submit_info_batch(texts: list, sections_list: list = None):
+    """Submit a batch of texts for name/contact extraction.
+
+    Args:
+        texts: Resume texts
+        sections_list: Segmenter sections per text to also run local
+            structured extraction (None to skip it)
+
+    Returns:
+        Future resolving to the extract_info_batch result dict
+    """
+    return _submit(extract_info_batch, texts, Config.EXTRACTION_TIMEOUT, sections_list)
+
+
+def wait_result(future) -> dict:
+    """Wait for a submitted extraction within the wall-clock budget.
+
+    The budget starts once the pool picks the task up, so time spent
+    queued behind other uploads doesn't count. A task still running past
+    it has a hung worker, which is killed along with the rest of its pool
+    so the slot is not held forever.
+
+    Args:
+        future: Future returned by one of the submit functions
+
+    Returns:
+        Worker result dict; error is set on timeout or worker crash
+    """
+    executor = future.extraction_pool
+    timeout = None
+    if Config.EXTRACTION_TIMEOUT:
+        timeout = Config.EXTRACTION_TIMEOUT * WALL_CLOCK_FACTOR
+        while not (future.running() or future.done()):
+            time.sleep(START_POLL_INTERVAL)
+
+    try:
+        return future.result(timeout=timeout)
+    except BrokenProcessPool:
+        logger.error("Extraction worker died (out of memory or CPU), restarting pool")
+        _reset_executor(executor)
+        return {"error": "Extraction worker crashed"}
+    except TimeoutError:
+        logger.error(f"Extraction worker hung for over {timeout}s, restarting pool")
+        _kill_workers(executor)
+        _reset_executor(executor)
+        return {"error": "Extraction timed out"}
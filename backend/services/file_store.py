@@ -0,0 +1,242 @@
+"""Content-addressed PDF storage with streaming uploads and orphan GC."""
+
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from config import Config, BASE_DIR
+from models import get_db_connection
+
+logger = logging.getLogger(__name__)
+
+# Upload chunks are hashed as they are written
+CHUNK_SIZE = 64 * 1024
+
+
+class HashingUploadFile:
+    """Temp file that hashes upload chunks as Werkzeug streams them to disk.
+
+    Used as the multipart stream factory, so uploads never sit in memory
+    and their SHA-256 is known by the time the request handler runs. The
+    temp file lives next to the store so it can be hard-linked into place.
+    """
+
+    def __init__(self, directory: str):
+        os.makedirs(directory, exist_ok=True)
+        self._file = tempfile.NamedTemporaryFile(dir=directory, suffix='.part')
+        self._hash = hashlib.sha256()
+        self.path = self._file.name
+
+    def write(self, data: bytes) -> int:
+        self._hash.update(data)
+        return self._file.write(data)
+
+    @property
+    def content_hash(self) -> str:
+        return self._hash.hexdigest()
+
+    def __getattr__(self, name):
+        # read, seek, tell, flush, close, ... go to the temp file
+        return getattr(self._file, name)
+
+    def __iter__(self):
+        return iter(self._file)
+
+
+class LocalFile:
+    """Upload-like view of a file on disk (filename, mimetype, stream, read()).
+
+    Lets files picked up outside HTTP (watch folders, CLI) go through the
+    same pipeline as uploads. No upload temp path is exposed, so the
+    store copies the file instead of hard-linking a file it doesn't own.
+    """
+
+    def __init__(self, path: str):
+        self.local_path = path
+        self.filename = os.path.basename(path)
+        self.mimetype = 'application/zip' if path.lower().endswith('.zip') else 'application/pdf'
+        self._stream = None
+
+    @property
+    def stream(self):
+        if self._stream is None:
+            self._stream = open(self.local_path, 'rb')
+        return self._stream
+
+    def read(self) -> bytes:
+        with open(self.local_path, 'rb') as f:
+            return f.read()
+
+    def close(self) -> None:
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+
+def compute_file_hash(path: str) -> str:
+    """Compute SHA-256 of a file on disk in chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def path_for_hash(content_hash: str, extension: str = '.pdf') -> str:
+    """Get the sharded storage path for a content hash.
+
+    Files live under uploads/<2 hex>/<2 hex>/<hash><ext>, keeping every
+    directory small however many resumes are stored.
+
+    Returns:
+        Path relative to the backend directory (as stored in candidates.pdf_path)
+    """
+    relative_root = os.path.relpath(Config.UPLOAD_FOLDER, BASE_DIR)
+    return os.path.join(relative_root, content_hash[:2], content_hash[2:4], content_hash + extension)
+
+
+def resolve_path(stored_path: str) -> str:
+    """Resolve a stored (possibly relative) path to an absolute one."""
+    if os.path.isabs(stored_path):
+        return stored_path
+    return os.path.join(BASE_DIR, stored_path)
+
+
+def store_bytes(data: bytes | None, content_hash: str, source_path: str = None, link_source: bool = True) -> str:
+    """Store file content under its hash; identical content is stored once.
+
+    Args:
+        data: File content, or None to copy it from source_path
+        content_hash: SHA-256 hex digest of the content
+        source_path: File that already holds the content
+        link_source: Hard-link source_path when possible instead of copying
+
+    Returns:
+        Stored path relative to the backend directory
+    """
+    stored_path = path_for_hash(content_hash)
+    final_path = resolve_path(stored_path)
+
+    if os.path.exists(final_path):
+        return stored_path
+
+    os.makedirs(os.path.dirname(final_path), exist_ok=True)
+
+    if source_path and link_source:
+        try:
+            os.link(source_path, final_path)
+            return stored_path
+        except FileExistsError:
+            return stored_path
+        except OSError:
+            pass  # different filesystem or no hard links; write below
+
+    # Write to a temp name then rename, so readers never see partial files
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(final_path), suffix='.part')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            if data is None:
+                with open(source_path, 'rb') as source:
+                    shutil.copyfileobj(source, f, CHUNK_SIZE)
+            else:
+                f.write(data)
+        os.replace(temp_path, final_path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    return stored_path
+
+
+def get_referenced_paths() -> set:
+    """Get absolute paths of every PDF still referenced in the database."""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+
+    cursor.execute('''
+        SELECT pdf_path FROM candidates WHERE pdf_path IS NOT NULL
+        UNION
+        SELECT pdf_path FROM extraction_cache WHERE pdf_path IS NOT NULL
+    ''')
+
+    paths = {os.path.normpath(resolve_path(row[0])) for row in cursor.fetchall()}
+    conn.close()
+    return paths
+
+
+def collect_orphans(min_age_seconds: int = None) -> dict:
+    """Delete stored PDFs no candidate or cache entry references.
+
+    Files younger than min_age_seconds are kept, since their candidate
+    row may not have been written yet. Stale upload temp files are
+    removed as well.
+
+    Args:
+        min_age_seconds: Grace period (defaults to Config.UPLOAD_GC_MIN_AGE)
+
+    Returns:
+        Dict with scanned, removed, and bytes_freed counts
+    """
+    if min_age_seconds is None:
+        min_age_seconds = Config.UPLOAD_GC_MIN_AGE
+
+    referenced = get_referenced_paths()
+    cutoff = time.time() - min_age_seconds
+    stats = {"scanned": 0, "removed": 0, "bytes_freed": 0}
+
+    for root, _, filenames in os.walk(Config.UPLOAD_FOLDER):
+        for filename in filenames:
+            if not filename.endswith(('.pdf', '.part')):
+                continue
+
+            path = os.path.normpath(os.path.join(root, filename))
+            stats["scanned"] += 1
+
+            try:
+                info = os.stat(path)
+                if info.st_mtime > cutoff or path in referenced:
+                    continue
+                os.remove(path)
+                stats["removed"] += 1
+                stats["bytes_freed"] += info.st_size
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                logger.warning(f"Could not remove orphan {path}: {e}")
+
+    logger.info(
+        f"Upload GC: scanned {stats['scanned']}, removed {stats['removed']} "
+        f"({stats['bytes_freed'] / 1024 / 1024:.1f} MB)"
+    )
+    return stats
+
+
+def start_orphan_gc(interval_seconds: int = None) -> threading.Thread | None:
+    """Start a daemon thread that periodically collects orphaned uploads.
+
+    Args:
+        interval_seconds: Seconds between runs (defaults to Config.UPLOAD_GC_INTERVAL)
+
+    Returns:
+        The started thread, or None if GC is disabled
+    """
+    interval = interval_seconds if interval_seconds is not None else Config.UPLOAD_GC_INTERVAL
+    if not interval or interval <= 0:
+        return None
+
+    def run():
+        while True:
+            time.sleep(interval)
+            try:
+                collect_orphans()
+            except Exception as e:
+                logger.error(f"Upload GC failed: {e}")
+
+    thread = threading.Thread(target=run, name='upload-gc', daemon=True)
+    thread.start()
+    logger.info(f"Upload GC running every {interval}s")
+    return thread
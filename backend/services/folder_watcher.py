@@ -0,0 +1,332 @@
+"""Watch-folder ingestion daemon (inotify on Linux, polling elsewhere).
+
+Layout: one subfolder per role under Config.INGEST_WATCH_FOLDER, e.g.
+inbox/Senior_Backend_Engineer/*.pdf. Files that arrive are batched per
+role and run through Phase 1 (run_ingestion); every file is checkpointed
+in the ingested_files table so a restart never ingests it twice.
+"""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import threading
+import time
+from config import Config
+from models import get_ingested_file, record_ingested_files
+from services.analysis_service import run_ingestion
+from services.archive_reader import expand_uploads_individually
+from services.file_store import LocalFile
+
+logger = logging.getLogger(__name__)
+
+INGEST_EXTENSIONS = ('.pdf', '.zip')
+
+# inotify constants (linux/inotify.h)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_Q_OVERFLOW = 0x00004000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+EVENT_HEADER = struct.Struct('iIII')  # wd, mask, cookie, len
+
+
+class InotifyWatcher:
+    """Kernel file notifications via libc inotify, through ctypes.
+
+    Reports a file only once its writer closed it (or it was moved in),
+    so half-copied PDFs are never picked up.
+    """
+
+    def __init__(self):
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self._libc = libc
+        self._fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs = {}
+        self.overflowed = False
+
+    def add_directory(self, path: str) -> None:
+        mask = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), mask)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {path}")
+        self._dirs[wd] = path
+
+    def wait(self, timeout: float) -> tuple:
+        """Wait for events.
+
+        Returns:
+            Tuple of (completed file paths, newly created directory paths)
+        """
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return [], []
+
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return [], []
+
+        files, directories = [], []
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0').decode(errors='replace')
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                self.overflowed = True
+                continue
+            parent = self._dirs.get(wd)
+            if not parent or not name:
+                continue
+
+            path = os.path.join(parent, name)
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    directories.append(path)
+            elif mask & (IN_CLOSE_WRITE | IN_MOVED_TO):
+                files.append(path)
+
+        return files, directories
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class PollingWatcher:
+    """Fallback watcher that rescans folders on an interval.
+
+    A file is reported once its size and mtime are unchanged across two
+    scans, i.e. whatever was copying it has finished. New subdirectories
+    of watched folders are reported on the scan that finds them.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.overflowed = False
+        self._dirs = set()
+        self._known_subdirs = set()
+        self._last_seen = {}
+        self._reported = set()
+        self._next_scan = 0.0
+
+    def add_directory(self, path: str) -> None:
+        self._dirs.add(path)
+        self._known_subdirs.add(path)
+
+    def wait(self, timeout: float) -> tuple:
+        delay = self._next_scan - time.monotonic()
+        if delay > 0:
+            time.sleep(min(delay, timeout))
+            if delay > timeout:
+                return [], []
+        self._next_scan = time.monotonic() + self.interval
+
+        stable = []
+        new_dirs = []
+        seen = {}
+        for directory in list(self._dirs):
+            try:
+                entries = list(os.scandir(directory))
+            except FileNotFoundError:
+                continue
+            for entry in entries:
+                if entry.is_dir():
+                    if entry.path not in self._dirs and entry.path not in self._known_subdirs:
+                        self._known_subdirs.add(entry.path)
+                        new_dirs.append(entry.path)
+                    continue
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+                seen[entry.path] = (stat.st_size, stat.st_mtime)
+                if self._last_seen.get(entry.path) == seen[entry.path] and entry.path not in self._reported:
+                    stable.append(entry.path)
+
+        self._reported = (self._reported | set(stable)) & set(seen)
+        self._last_seen = seen
+        return stable, new_dirs
+
+    def close(self) -> None:
+        pass
+
+
+def create_watcher():
+    """Use inotify where available, polling otherwise."""
+    if Config.INGEST_USE_INOTIFY:
+        try:
+            return InotifyWatcher()
+        except (OSError, AttributeError) as e:
+            logger.warning(f"inotify unavailable ({e}), falling back to polling")
+    return PollingWatcher(Config.INGEST_POLL_INTERVAL)
+
+
+def role_title_for_folder(folder: str) -> str:
+    """Map a role folder name to a role title (Backend_Engineer -> Backend Engineer)."""
+    return ' '.join(os.path.basename(folder).replace('_', ' ').split())
+
+
+def _file_record(path: str) -> dict | None:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return {"path": path, "size": stat.st_size, "mtime": stat.st_mtime}
+
+
+def is_already_ingested(record: dict) -> bool:
+    """Check the checkpoint: same path, size and mtime means same file."""
+    checkpoint = get_ingested_file(record['path'])
+    return bool(checkpoint) and checkpoint['size'] == record['size'] and checkpoint['mtime'] == record['mtime']
+
+
+class FolderIngestionDaemon:
+    """Watch role folders and ingest arriving resumes in batches.
+
+    A role's batch is flushed once its oldest pending file has waited
+    batch_window seconds, or the batch reaches max_batch files.
+    """
+
+    def __init__(self, root: str = None, batch_window: float = None, max_batch: int = None):
+        self.root = os.path.abspath(root or Config.INGEST_WATCH_FOLDER)
+        self.batch_window = Config.INGEST_BATCH_WINDOW if batch_window is None else batch_window
+        self.max_batch = max_batch or Config.INGEST_MAX_BATCH
+        self._stop = threading.Event()
+        self._watcher = None
+        self._pending = {}  # role folder -> {path: first seen (monotonic)}
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _watch_role_folder(self, folder: str) -> None:
+        self._watcher.add_directory(folder)
+        logger.info(f"Watching role folder: {folder}")
+        # Files already present (arrived while down, or before the watch)
+        for entry in os.scandir(folder):
+            if entry.is_file():
+                self._enqueue(entry.path)
+
+    def _scan_all(self) -> None:
+        for entry in os.scandir(self.root):
+            if entry.is_dir():
+                for file_entry in os.scandir(entry.path):
+                    if file_entry.is_file():
+                        self._enqueue(file_entry.path)
+
+    def _enqueue(self, path: str) -> None:
+        folder = os.path.dirname(path)
+        if os.path.dirname(folder) != self.root:
+            return  # files directly in the root have no role
+        if not path.lower().endswith(INGEST_EXTENSIONS) or os.path.basename(path).startswith('.'):
+            return
+
+        pending = self._pending.setdefault(folder, {})
+        if path in pending:
+            return
+
+        record = _file_record(path)
+        if record and not is_already_ingested(record):
+            pending[path] = time.monotonic()
+
+    def _due_folders(self) -> list:
+        now = time.monotonic()
+        return [
+            folder for folder, pending in self._pending.items()
+            if pending and (
+                len(pending) >= self.max_batch
+                or now - min(pending.values()) >= self.batch_window
+            )
+        ]
+
+    def ingest_batch(self, folder: str, paths: list) -> dict | None:
+        """Run Phase 1 for one role's batch and checkpoint every file.
+
+        Args:
+            folder: Role folder the files arrived in
+            paths: Absolute file paths
+
+        Returns:
+            run_ingestion result, or None if nothing could be read
+        """
+        records = [r for r in map(_file_record, paths) if r]
+        files = [LocalFile(record['path']) for record in records]
+        uploads, rejected = expand_uploads_individually(files)
+
+        role_title = role_title_for_folder(folder)
+        result = None
+        try:
+            if len(rejected) < len(files):
+                result = run_ingestion(role_title, uploads)
+        finally:
+            for file in files:
+                file.close()
+
+        failed = {e['filename']: e['reason'] for e in (result['extraction']['errors'] or [])} if result else {}
+        for record in records:
+            filename = os.path.basename(record['path'])
+            error = rejected.get(filename) or failed.get(filename)
+            record.update({
+                "role_id": result['role']['id'] if result else None,
+                "session_id": result['session_id'] if result else None,
+                "status": "failed" if error else "ingested",
+                "error": error
+            })
+        record_ingested_files(records)
+
+        logger.info(
+            f"Ingested batch for {role_title}: {len(records)} files, "
+            f"{sum(1 for r in records if r['status'] == 'failed')} failed"
+        )
+        return result
+
+    def _flush(self, folder: str) -> None:
+        pending = self._pending.pop(folder, {})
+        paths = sorted(pending, key=pending.get)
+        for start in range(0, len(paths), self.max_batch):
+            try:
+                self.ingest_batch(folder, paths[start:start + self.max_batch])
+            except Exception as e:
+                # Not checkpointed, so the files are retried on the next start
+                logger.error(f"Ingestion batch for {folder} failed: {e}")
+
+    def run(self) -> None:
+        """Watch until stop() is called, flushing batches as they come due."""
+        os.makedirs(self.root, exist_ok=True)
+        self._watcher = create_watcher()
+        self._watcher.add_directory(self.root)
+        logger.info(f"Ingestion daemon watching {self.root} ({type(self._watcher).__name__})")
+
+        for entry in os.scandir(self.root):
+            if entry.is_dir():
+                self._watch_role_folder(entry.path)
+
+        # Pending files are not checkpointed on stop; the next start picks them up
+        try:
+            while not self._stop.is_set():
+                files, directories = self._watcher.wait(timeout=1.0)
+
+                for directory in directories:
+                    if os.path.dirname(directory) == self.root:
+                        self._watch_role_folder(directory)
+                for path in files:
+                    if os.path.isdir(path):
+                        continue
+                    self._enqueue(path)
+                if self._watcher.overflowed:
+                    logger.warning("Watch event queue overflowed, rescanning folders")
+                    self._watcher.overflowed = False
+                    self._scan_all()
+
+                for folder in self._due_folders():
+                    self._flush(folder)
+        finally:
+            self._watcher.close()
+            logger.info("Ingestion daemon stopped")
@@ -0,0 +1,119 @@
+"""Persistent Gemini response cache with in-flight request coalescing.
+
+Responses are keyed by model, prompt template and version, generation
+settings and the whitespace-normalized prompt, and stored in SQLite as
+parsed JSON. Identical requests that arrive while one is already in
+flight wait for it instead of calling Gemini again.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+from config import Config
+from models import get_cached_gemini_response, store_gemini_response
+
+logger = logging.getLogger(__name__)
+
+# Requests currently being answered: cache key -> future of the response JSON
+_in_flight = {}
+
+_stats = {"hits": 0, "misses": 0, "coalesced": 0}
+_stats_lock = threading.Lock()
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Collapse whitespace so formatting-only differences share a cache entry."""
+    return ' '.join(prompt.split())
+
+
+def make_cache_key(model: str, template: str, version: int, generation_config: dict, prompt: str) -> str:
+    """Build the cache key for one request.
+
+    Args:
+        model: Model name
+        template: Prompt template name
+        version: Template version, bumped whenever the template changes
+        generation_config: Pinned generation settings
+        prompt: Full prompt text
+
+    Returns:
+        SHA-256 hex digest
+    """
+    parts = [model, template, str(version), json.dumps(generation_config, sort_keys=True), normalize_prompt(prompt)]
+    return hashlib.sha256('\0'.join(parts).encode('utf-8')).hexdigest()
+
+
+def _count(name: str) -> None:
+    with _stats_lock:
+        _stats[name] += 1
+
+
+async def cached_generate(cache_key: str, model: str, template: str, generate) -> dict:
+    """Answer a request from the cache, an identical in-flight request, or generate().
+
+    Runs on the shared Gemini event loop (see async_runtime), which makes
+    the in-flight table single-threaded; SQLite work goes to a thread.
+
+    Args:
+        cache_key: Key from make_cache_key
+        model: Model name (stored with the entry)
+        template: Prompt template name (stored with the entry)
+        generate: Coroutine function performing the Gemini call; returns
+            the parsed response dict (empty if the response could not be parsed)
+
+    Returns:
+        Parsed response dict; every caller gets its own copy
+    """
+    if not Config.GEMINI_CACHE_ENABLED:
+        return await generate()
+
+    ttl_seconds = Config.GEMINI_CACHE_TTL_HOURS * 3600
+    cached = await asyncio.to_thread(get_cached_gemini_response, cache_key, ttl_seconds)
+    if cached is not None:
+        _count("hits")
+        logger.info(f"Gemini cache hit ({template})")
+        return json.loads(cached)
+
+    flight = _in_flight.get(cache_key)
+    if flight is not None:
+        _count("coalesced")
+        logger.info(f"Waiting for identical in-flight Gemini request ({template})")
+        # Shielded so a cancelled follower does not cancel the shared result
+        return json.loads(await asyncio.shield(flight))
+
+    flight = _in_flight[cache_key] = asyncio.get_running_loop().create_future()
+    _count("misses")
+    try:
+        data = await generate()
+    except asyncio.CancelledError:
+        flight.cancel()
+        raise
+    except Exception as e:
+        flight.set_exception(e)
+        # Retrieved here so an error nobody else awaited is not logged as unhandled
+        flight.exception()
+        raise
+    finally:
+        _in_flight.pop(cache_key, None)
+
+    response = json.dumps(data)
+    flight.set_result(response)
+
+    # Unparseable responses come back empty and are not worth keeping
+    if data:
+        try:
+            await asyncio.to_thread(
+                store_gemini_response, cache_key, model, template, response,
+                ttl_seconds, Config.GEMINI_CACHE_MAX_ENTRIES
+            )
+        except Exception as e:
+            logger.warning(f"Could not cache Gemini response ({template}): {e}")
+    return data
+
+
+def get_cache_stats() -> dict:
+    """Hits, misses and coalesced requests since the process started."""
+    with _stats_lock:
+        return dict(_stats)
@@ -0,0 +1,269 @@
+"""Long-lived Gemini models, one per task, with schema-constrained JSON output.
+
+Each prompt template (task) gets its own generation settings: JSON
+response mode, a response schema the API enforces, a temperature and an
+output token cap. Models are built once per task and reused by every
+request, so no call pays for constructing a client.
+"""
+
+import logging
+import os
+import threading
+import google.generativeai as genai
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Model configuration
+MODEL_NAME = 'models/gemini-2.5-flash'
+
+# 2.5 models count thinking tokens against max_output_tokens, so every cap leaves room for them
+THINKING_HEADROOM = 4096
+
+# Largest output the model supports
+MODEL_MAX_OUTPUT_TOKENS = 65536
+
+DIMENSIONS = ["experience", "skills", "projects", "positions", "education"]
+
+PRIORITY_VALUES = ["CRITICAL", "IMPORTANT", "NICE_TO_HAVE", "LOW_PRIORITY"]
+
+
+def _string_list() -> dict:
+    return {"type": "ARRAY", "items": {"type": "STRING"}}
+
+
+def _dimension_scores() -> dict:
+    return {
+        "type": "OBJECT",
+        "properties": {dim: {"type": "INTEGER"} for dim in DIMENSIONS},
+        "required": DIMENSIONS
+    }
+
+
+PROFILE_PROPERTIES = {
+    "skills": _string_list(),
+    "experience_years": {"type": "NUMBER"},
+    "experience_details": {
+        "type": "ARRAY",
+        "items": {
+            "type": "OBJECT",
+            "properties": {
+                "role": {"type": "STRING"},
+                "company": {"type": "STRING"},
+                "duration": {"type": "STRING"},
+                "highlights": _string_list()
+            },
+            "required": ["role", "company"]
+        }
+    },
+    "education": {
+        "type": "ARRAY",
+        "items": {
+            "type": "OBJECT",
+            "properties": {
+                "degree": {"type": "STRING"},
+                "institution": {"type": "STRING"},
+                "year": {"type": "INTEGER", "nullable": True}
+            },
+            "required": ["degree", "institution"]
+        }
+    },
+    "projects": {
+        "type": "ARRAY",
+        "items": {
+            "type": "OBJECT",
+            "properties": {
+                "name": {"type": "STRING"},
+                "description": {"type": "STRING"},
+                "technologies": _string_list(),
+                "impact": {"type": "STRING"}
+            },
+            "required": ["name"]
+        }
+    },
+    "positions": {
+        "type": "ARRAY",
+        "items": {
+            "type": "OBJECT",
+            "properties": {
+                "title": {"type": "STRING"},
+                "year": {"type": "INTEGER", "nullable": True}
+            },
+            "required": ["title"]
+        }
+    }
+}
+
+PROFILE_REQUIRED = list(PROFILE_PROPERTIES)
+
+# Response schema per task (prompt template name)
+RESPONSE_SCHEMAS = {
+    "extraction": {
+        "type": "OBJECT",
+        "properties": PROFILE_PROPERTIES,
+        "required": PROFILE_REQUIRED
+    },
+    "packed_extraction": {
+        "type": "OBJECT",
+        "properties": {
+            "profiles": {
+                "type": "ARRAY",
+                "items": {
+                    "type": "OBJECT",
+                    "properties": {"id": {"type": "STRING"}, **PROFILE_PROPERTIES},
+                    "required": ["id"] + PROFILE_REQUIRED
+                }
+            }
+        },
+        "required": ["profiles"]
+    },
+    "priorities": {
+        "type": "OBJECT",
+        "properties": {
+            "inferred_priorities": {
+                "type": "OBJECT",
+                "properties": {
+                    dim: {"type": "STRING", "format": "enum", "enum": PRIORITY_VALUES}
+                    for dim in DIMENSIONS
+                },
+                "required": DIMENSIONS
+            },
+            "reasoning": {"type": "STRING"}
+        },
+        "required": ["inferred_priorities", "reasoning"]
+    },
+    "comparison": {
+        "type": "OBJECT",
+        "properties": {
+            "explanation": {"type": "STRING"},
+            "key_differences": _string_list()
+        },
+        "required": ["explanation", "key_differences"]
+    },
+    "scoring": {
+        "type": "OBJECT",
+        "properties": {
+            "scores": {
+                "type": "ARRAY",
+                "items": {
+                    "type": "OBJECT",
+                    "properties": {
+                        "candidate_id": {"type": "STRING"},
+                        **{dim: {"type": "INTEGER"} for dim in DIMENSIONS}
+                    },
+                    "required": ["candidate_id"] + DIMENSIONS
+                }
+            }
+        },
+        "required": ["scores"]
+    },
+    "ranking": {
+        "type": "OBJECT",
+        "properties": {
+            "rankings": {
+                "type": "ARRAY",
+                "items": {
+                    "type": "OBJECT",
+                    "properties": {
+                        "candidate_id": {"type": "STRING"},
+                        "rank": {"type": "INTEGER"},
+                        "match_score": {"type": "INTEGER"},
+                        "scores": _dimension_scores(),
+                        "summary": _string_list(),
+                        "why_selected": {"type": "STRING"},
+                        "compared_to_pool": {"type": "STRING"}
+                    },
+                    "required": [
+                        "candidate_id", "rank", "match_score", "scores",
+                        "summary", "why_selected", "compared_to_pool"
+                    ]
+                }
+            }
+        },
+        "required": ["rankings"]
+    },
+    "tie_breaker": {
+        "type": "OBJECT",
+        "properties": {"tie_breaker_reason": {"type": "STRING"}},
+        "required": ["tie_breaker_reason"]
+    }
+}
+
+# Structured answers are pinned for determinism (and cacheability);
+# the prose explanations get a little variety
+TASK_TEMPERATURES = {
+    "comparison": 0.3,
+    "tie_breaker": 0.3
+}
+
+# Models built so far: task -> genai.GenerativeModel
+_models = {}
+_configs = {}
+_models_lock = threading.Lock()
+
+
+def _output_token_cap(task: str) -> int:
+    """Answer size budget for a task, before thinking headroom."""
+    caps = {
+        "extraction": 2048,
+        "packed_extraction": 2048 * max(1, Config.EXTRACTION_PACK_MAX_RESUMES),
+        "priorities": 512,
+        "comparison": 512,
+        "ranking": 400 * max(1, Config.RANK_BATCH_SIZE),
+        "tie_breaker": 256
+    }
+    # Scoring covers the whole pool in one response, so it only gets the model's own limit
+    return caps.get(task, MODEL_MAX_OUTPUT_TOKENS)
+
+
+def get_generation_config(task: str) -> dict:
+    """Generation settings for one task.
+
+    Args:
+        task: Prompt template name (key of RESPONSE_SCHEMAS)
+
+    Returns:
+        Dict accepted by genai.GenerativeModel(generation_config=...)
+    """
+    with _models_lock:
+        config = _configs.get(task)
+        if config is None:
+            config = _configs[task] = {
+                "temperature": TASK_TEMPERATURES.get(task, 0.0),
+                "top_p": 1.0,
+                "top_k": 1,
+                "candidate_count": 1,
+                "max_output_tokens": min(MODEL_MAX_OUTPUT_TOKENS, _output_token_cap(task) + THINKING_HEADROOM),
+                "response_mime_type": "application/json",
+                "response_schema": RESPONSE_SCHEMAS[task]
+            }
+        return config
+
+
+def get_model(task: str) -> genai.GenerativeModel:
+    """Get the shared model for a task, building it on first use.
+
+    Args:
+        task: Prompt template name (key of RESPONSE_SCHEMAS)
+
+    Returns:
+        genai.GenerativeModel configured for the task
+    """
+    config = get_generation_config(task)
+    with _models_lock:
+        model = _models.get(task)
+        if model is None:
+            model = _models[task] = genai.GenerativeModel(MODEL_NAME, generation_config=config)
+            logger.info(f"Created Gemini model for {task} (max {config['max_output_tokens']} output tokens)")
+        return model
+
+
+def _reset_after_fork() -> None:
+    """Model clients hold connections that must not be shared with a child process."""
+    global _models_lock
+    _models.clear()
+    _models_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -3,9 +3,17 @@
 import os
 import json
 import time
+import asyncio
 import logging
 from dotenv import load_dotenv
 import google.generativeai as genai
+from config import Config
+from services.async_runtime import get_request_semaphore, run_async
+from services.gemini_cache import cached_generate, make_cache_key
+from services.gemini_models import MODEL_NAME, get_generation_config, get_model
+from services.rate_limiter import get_gemini_limiter
+from services.text_compactor import compact_resume_text
+from services.tokens import estimate_tokens
 
 load_dotenv()
 logger = logging.getLogger(__name__)
@@ -17,13 +25,20 @@ if not API_KEY or API_KEY == 'your_gemini_api_key_here':
 else:
     genai.configure(api_key=API_KEY)
 
-# Model configuration
-MODEL_NAME = 'models/gemini-2.5-flash'
+# Prompt template versions; bump one when its template changes so cached answers expire
+PROMPT_VERSIONS = {
+    "extraction": 1,
+    "packed_extraction": 1,
+    "priorities": 1,
+    "comparison": 1,
+    "scoring": 2,
+    "ranking": 1,
+    "tie_breaker": 1
+}
 
 # Retry configuration
 MAX_RETRIES = 5
 INITIAL_RETRY_DELAY = 15  # seconds
-REQUEST_DELAY = 4  # seconds between API calls to stay under rate limits
 
 # Extraction prompt template
 EXTRACTION_PROMPT = """Extract structured data from this resume text.
@@ -74,6 +89,63 @@ Rules:
 """
 
 
+async def generate_with_rate_limit(model, prompt: str):
+    """Call model.generate_content_async within the shared RPM/TPM budget.
+
+    Every Gemini call goes through here, on the shared event loop: the
+    request semaphore bounds how many are outstanding and the limiter
+    spaces them to the quota, so callers never sleep a fixed delay.
+
+    Args:
+        model: genai.GenerativeModel
+        prompt: Prompt text
+
+    Returns:
+        Gemini response
+    """
+    limiter = get_gemini_limiter()
+    estimated = estimate_tokens(prompt)
+
+    async with get_request_semaphore():
+        waited = await limiter.acquire_async(estimated)
+        if waited >= 1:
+            logger.info(f"Waited {waited:.1f}s for Gemini rate limit capacity")
+
+        response = await model.generate_content_async(prompt)
+
+    usage = getattr(response, 'usage_metadata', None)
+    limiter.settle(estimated, getattr(usage, 'prompt_token_count', None))
+    return response
+
+
+async def generate_json_async(prompt: str, template: str) -> dict:
+    """Get Gemini's parsed JSON answer to a prompt, through the response cache.
+
+    Identical prompts (same template version and settings) are answered
+    from the cache or share one in-flight request; only misses reach the
+    rate limiter and the API. The template's shared model constrains the
+    answer to its response schema (see gemini_models).
+
+    Args:
+        prompt: Formatted prompt text
+        template: Name of the prompt template (key of PROMPT_VERSIONS)
+
+    Returns:
+        Parsed response dict (empty if the response was not valid JSON)
+    """
+    async def generate():
+        response = await generate_with_rate_limit(get_model(template), prompt)
+        if response.candidates:
+            finish_reason = response.candidates[0].finish_reason
+            if getattr(finish_reason, 'name', finish_reason) == 'MAX_TOKENS':
+                logger.warning(f"Gemini {template} response hit the output token cap")
+        return parse_gemini_response(response.text)
+
+    generation_config = get_generation_config(template)
+    cache_key = make_cache_key(MODEL_NAME, template, PROMPT_VERSIONS[template], generation_config, prompt)
+    return await cached_generate(cache_key, MODEL_NAME, template, generate)
+
+
 def parse_gemini_response(response_text: str) -> dict:
     """Parse Gemini response, handling markdown code blocks.
 
@@ -122,7 +194,7 @@ def parse_gemini_response(response_text: str) -> dict:
         return {}
 
 
-def extract_structured_data(resume_text: str) -> dict:
+async def extract_structured_data_async(resume_text: str) -> dict:
     """Extract structured data from resume using Gemini API.
 
     Args:
@@ -150,27 +222,16 @@ def extract_structured_data(resume_text: str) -> dict:
         default_response["extraction_error"] = "GEMINI_API_KEY not configured"
         return default_response
 
-    # Truncate very long resumes to avoid token limits
-    max_chars = 10000
-    if len(resume_text) > max_chars:
-        resume_text = resume_text[:max_chars]
-        logger.info(f"Resume text truncated to {max_chars} chars")
+    # Clean up PDF artifacts and fit whole sections into the token budget
+    original_tokens = estimate_tokens(resume_text)
+    resume_text = compact_resume_text(resume_text, Config.EXTRACTION_TOKEN_BUDGET)
+    logger.info(f"Resume text compacted: ~{original_tokens} -> ~{estimate_tokens(resume_text)} tokens")
 
     # Retry logic with exponential backoff for rate limits
     for attempt in range(MAX_RETRIES):
         try:
-            # Add delay before API call to stay under rate limits
-            time.sleep(REQUEST_DELAY)
-
-            # Create model and generate
-            model = genai.GenerativeModel(MODEL_NAME)
             prompt = EXTRACTION_PROMPT.format(resume_text=resume_text)
-
-            response = model.generate_content(prompt)
-
-            # Parse response
-            response_text = response.text.strip()
-            data = parse_gemini_response(response_text)
+            data = await generate_json_async(prompt, 'extraction')
 
             # Merge with defaults for missing fields
             for key in default_response:
@@ -183,10 +244,10 @@ def extract_structured_data(resume_text: str) -> dict:
         except Exception as e:
             error_str = str(e)
             if "429" in error_str or "quota" in error_str.lower():
-                # Rate limit - wait and retry
+                # Rate limit - hold back all callers, then retry
                 delay = INITIAL_RETRY_DELAY * (2 ** attempt)
                 logger.warning(f"Rate limit hit, retrying in {delay}s (attempt {attempt + 1}/{MAX_RETRIES})")
-                time.sleep(delay)
+                get_gemini_limiter().pause(delay)
             else:
                 # Other error - don't retry
                 logger.error(f"Gemini API error: {e}")
@@ -199,6 +260,195 @@ def extract_structured_data(resume_text: str) -> dict:
     return default_response
 
 
+def extract_structured_data(resume_text: str) -> dict:
+    """Blocking wrapper around extract_structured_data_async."""
+    return run_async(extract_structured_data_async(resume_text))
+
+
+# Several resumes per request: the instructions are sent once and the
+# request costs one unit of the requests-per-minute quota
+PACKED_EXTRACTION_PROMPT = """Extract structured data from each of the resumes below.
+Each resume starts with a line "=== RESUME <id> ===".
+
+{resumes}
+
+Return ONLY valid JSON with this exact structure (no markdown, no explanation),
+with exactly one profile per resume, each carrying that resume's id:
+{{
+  "profiles": [
+    {{
+      "id": "<id>",
+      "skills": ["skill1", "skill2", ...],
+      "experience_years": 4.5,
+      "experience_details": [
+        {{"role": "Job Title", "company": "Company Name", "duration": "2 years", "highlights": ["Achievement 1"]}}
+      ],
+      "education": [
+        {{"degree": "Degree Name", "institution": "University Name", "year": 2020}}
+      ],
+      "projects": [
+        {{"name": "Project Name", "description": "Brief description", "technologies": ["tech1"], "impact": "Measurable impact if mentioned"}}
+      ],
+      "positions": [
+        {{"title": "Position Title", "year": 2018}}
+      ]
+    }}
+  ]
+}}
+
+Rules:
+- Treat every resume independently; never mix information between resumes
+- Extract ALL skills mentioned (programming languages, frameworks, tools, soft skills)
+- experience_years should be TOTAL years of professional work experience
+- positions should show career progression chronologically (earliest first)
+- Include all jobs in experience_details, most recent first
+- For projects, include personal, academic, and professional projects
+- If information is not found, use empty arrays [] or 0 for numbers
+- Return ONLY the JSON object, no other text or markdown
+"""
+
+# Expected type of every field in an extracted profile
+PROFILE_FIELD_TYPES = {
+    "skills": list,
+    "experience_years": (int, float),
+    "experience_details": list,
+    "education": list,
+    "projects": list,
+    "positions": list
+}
+
+
+def is_valid_profile(profile) -> bool:
+    """Check that a profile from a packed response has every field, correctly typed."""
+    if not isinstance(profile, dict):
+        return False
+    return all(
+        isinstance(profile.get(field), expected) and not isinstance(profile.get(field), bool)
+        for field, expected in PROFILE_FIELD_TYPES.items()
+    )
+
+
+def pack_by_token_budget(sizes: dict, budget: int, max_items: int) -> list:
+    """Bin-pack items into groups under a token budget (first-fit decreasing).
+
+    Args:
+        sizes: Item ID -> estimated tokens
+        budget: Maximum total tokens per group
+        max_items: Maximum items per group
+
+    Returns:
+        List of groups (lists of item IDs)
+    """
+    groups = []
+    for item_id in sorted(sizes, key=sizes.get, reverse=True):
+        for group in groups:
+            if group["tokens"] + sizes[item_id] <= budget and len(group["ids"]) < max_items:
+                group["ids"].append(item_id)
+                group["tokens"] += sizes[item_id]
+                break
+        else:
+            groups.append({"ids": [item_id], "tokens": sizes[item_id]})
+    return [group["ids"] for group in groups]
+
+
+async def _extract_packed_group_async(texts: dict) -> dict:
+    """Run one packed request.
+
+    Args:
+        texts: Local ID -> compacted resume text
+
+    Returns:
+        Local ID -> profile, for the profiles that passed validation
+    """
+    resumes = "\n\n".join(f"=== RESUME {local_id} ===\n{text}" for local_id, text in texts.items())
+    prompt = PACKED_EXTRACTION_PROMPT.format(resumes=resumes)
+
+    for attempt in range(MAX_RETRIES):
+        try:
+            data = await generate_json_async(prompt, 'packed_extraction')
+            break
+        except Exception as e:
+            error_str = str(e)
+            if "429" in error_str or "quota" in error_str.lower():
+                delay = INITIAL_RETRY_DELAY * (2 ** attempt)
+                logger.warning(f"Rate limit hit, retrying in {delay}s (attempt {attempt + 1}/{MAX_RETRIES})")
+                get_gemini_limiter().pause(delay)
+            else:
+                logger.error(f"Packed Gemini extraction error: {e}")
+                return {}
+    else:
+        logger.error("All retry attempts exhausted for packed Gemini extraction")
+        return {}
+
+    profiles = data.get('profiles')
+    if not isinstance(profiles, list):
+        return {}
+
+    extracted = {}
+    for profile in profiles:
+        local_id = str(profile.get('id')) if isinstance(profile, dict) else None
+        if local_id in texts and local_id not in extracted and is_valid_profile(profile):
+            extracted[local_id] = {
+                **{field: profile[field] for field in PROFILE_FIELD_TYPES},
+                "extraction_error": None
+            }
+    return extracted
+
+
+async def extract_structured_data_packed_async(resume_texts: list) -> list:
+    """Extract several resumes with as few Gemini requests as possible.
+
+    Resumes are compacted, given short local IDs and bin-packed into
+    requests of up to EXTRACTION_PACK_TOKEN_BUDGET tokens. Profiles come
+    back keyed by local ID; a resume whose profile is missing or invalid
+    is re-sent on its own through extract_structured_data_async.
+
+    Args:
+        resume_texts: Resume texts
+
+    Returns:
+        List of extraction dicts aligned with resume_texts (see extract_structured_data)
+    """
+    if not API_KEY or API_KEY == 'your_gemini_api_key_here' or len(resume_texts) < 2:
+        return list(await asyncio.gather(*(extract_structured_data_async(text) for text in resume_texts)))
+
+    texts = {}
+    for index, text in enumerate(resume_texts):
+        if text and text.strip():
+            texts[f"r{index + 1}"] = compact_resume_text(text, Config.EXTRACTION_TOKEN_BUDGET)
+
+    groups = pack_by_token_budget(
+        {local_id: estimate_tokens(text) for local_id, text in texts.items()},
+        Config.EXTRACTION_PACK_TOKEN_BUDGET,
+        Config.EXTRACTION_PACK_MAX_RESUMES
+    )
+
+    # All packs are in flight at once; the limiter spaces them to the quota
+    packs = [group for group in groups if len(group) > 1]
+    found = await asyncio.gather(*(
+        _extract_packed_group_async({local_id: texts[local_id] for local_id in group})
+        for group in packs
+    ))
+    extracted = {}
+    for group, profiles in zip(packs, found):
+        logger.info(f"Packed extraction: {len(profiles)}/{len(group)} profiles in one request")
+        extracted.update(profiles)
+
+    # Not packed, empty, or its profile failed validation: send it alone
+    resend = [index for index in range(len(resume_texts)) if f"r{index + 1}" not in extracted]
+    singles = await asyncio.gather(*(extract_structured_data_async(resume_texts[index]) for index in resend))
+    results = [extracted.get(f"r{index + 1}") for index in range(len(resume_texts))]
+    for index, data in zip(resend, singles):
+        results[index] = data
+
+    return results
+
+
+def extract_structured_data_packed(resume_texts: list) -> list:
+    """Blocking wrapper around extract_structured_data_packed_async."""
+    return run_async(extract_structured_data_packed_async(resume_texts))
+
+
 def extract_with_retry(resume_text: str, max_retries: int = 2) -> dict:
     """Extract with retry on failure.
 
@@ -350,7 +600,7 @@ def validate_priorities(priorities: dict) -> dict:
     return validated
 
 
-def detect_job_priorities(job_description: str) -> dict:
+async def detect_job_priorities_async(job_description: str) -> dict:
     """Analyze JD to determine dimension priorities.
 
     Args:
@@ -380,17 +630,8 @@ def detect_job_priorities(job_description: str) -> dict:
         return default_response
 
     try:
-        # Add delay before API call to stay under rate limits
-        time.sleep(REQUEST_DELAY)
-
-        model = genai.GenerativeModel(MODEL_NAME)
         prompt = PRIORITY_DETECTION_PROMPT.format(job_description=job_description)
-
-        response = model.generate_content(prompt)
-        response_text = response.text.strip()
-
-        # Parse JSON response
-        data = parse_gemini_response(response_text)
+        data = await generate_json_async(prompt, 'priorities')
 
         # Validate priorities
         valid_levels = {'CRITICAL', 'IMPORTANT', 'NICE_TO_HAVE', 'LOW_PRIORITY'}
@@ -414,6 +655,11 @@ def detect_job_priorities(job_description: str) -> dict:
         return default_response
 
 
+def detect_job_priorities(job_description: str) -> dict:
+    """Blocking wrapper around detect_job_priorities_async."""
+    return run_async(detect_job_priorities_async(job_description))
+
+
 # Candidate Comparison Explanation (Story 5.11)
 
 COMPARISON_PROMPT = """Compare these two candidates and explain why one ranks higher.
@@ -457,7 +703,7 @@ Focus on:
 """
 
 
-def generate_comparison_explanation(
+async def generate_comparison_explanation_async(
     candidate1: dict,
     candidate2: dict,
     priorities: dict
@@ -500,8 +746,6 @@ def generate_comparison_explanation(
         return fallback
 
     try:
-        model = genai.GenerativeModel(MODEL_NAME)
-
         prompt = COMPARISON_PROMPT.format(
             rank_1=candidate1.get('rank', 1),
             name_1=candidate1.get('name', 'Candidate A'),
@@ -524,8 +768,7 @@ def generate_comparison_explanation(
             loser_name=loser_name
         )
 
-        response = model.generate_content(prompt)
-        data = parse_gemini_response(response.text)
+        data = await generate_json_async(prompt, 'comparison')
 
         logger.info("Comparison explanation generated successfully")
         return {
@@ -536,3 +779,12 @@ def generate_comparison_explanation(
     except Exception as e:
         logger.error(f'Comparison explanation error: {e}')
         return fallback
+
+
+def generate_comparison_explanation(
+    candidate1: dict,
+    candidate2: dict,
+    priorities: dict
+) -> dict:
+    """Blocking wrapper around generate_comparison_explanation_async."""
+    return run_async(generate_comparison_explanation_async(candidate1, candidate2, priorities))
@@ -1,137 +1,225 @@
 """Local data extraction service using regex and spaCy NER."""
 
 import re
-import spacy
 import logging
+from config import Config
+from services.contact_extractor import extract_contacts_batch
 
 logger = logging.getLogger(__name__)
 
 # Load spaCy model once at module level
 nlp = None
 
+# Pipes name extraction doesn't need; en_core_web_sm's NER has its own tok2vec
+NER_DISABLED_PIPES = ["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "senter"]
+
+# Names sit at the top of a resume; only this prefix goes through NER
+NAME_SCAN_CHARS = 1000
+
+# Name extraction modes: spaCy NER, or layout rules only
+NAME_MODE_SPACY = 'spacy'
+NAME_MODE_RULES = 'rules'
+
+# Top-of-resume headings that are never the candidate's name
+NAME_SKIP_LINES = {'resume', 'curriculum vitae', 'cv', 'profile', 'biodata', 'bio data', 'personal details'}
+NAME_LABEL_RE = re.compile(r'^(?:full\s+)?name\s*[:\-]\s*', re.IGNORECASE)
+NAME_SEPARATOR_RE = re.compile(r'\s*[|•,]\s*|\s{3,}')
+NAME_TOKEN_RE = re.compile(r"^[^\W\d_](?:[^\W\d_]|['.-])*$")  # letters (any script), ' . -
+
 
 def get_nlp():
-    """Lazy load spaCy model."""
+    """Lazy load spaCy model with only the NER component enabled."""
     global nlp
     if nlp is None:
-        nlp = spacy.load("en_core_web_sm")
+        # Imported here so rules mode never pays for loading spaCy
+        import spacy
+        nlp = spacy.load("en_core_web_sm", disable=NER_DISABLED_PIPES)
     return nlp
 
 
-def extract_email(text: str) -> str | None:
-    """Extract email using regex.
+def preload_models() -> None:
+    """Load the spaCy model up front so no request pays for it.
 
-    Args:
-        text: Resume text content
+    Call at app start before any worker forks: forked children (web
+    workers and extraction pool processes) share the loaded model
+    copy-on-write instead of loading it again. No-op in rules mode.
+    """
+    if Config.NAME_EXTRACTION_MODE != NAME_MODE_SPACY:
+        logger.info("Name extraction in rules mode, skipping spaCy preload")
+        return
 
-    Returns:
-        Email address or None if not found
+    try:
+        get_nlp()
+        logger.info("spaCy model preloaded")
+    except Exception as e:
+        logger.error(f"spaCy preload failed, will retry lazily: {e}")
+
+
+def _name_from_lines(text: str) -> str | None:
+    """Fallback: first non-empty line that looks like a name."""
+    lines = text.strip().split('\n')
+    for line in lines[:5]:
+        line = line.strip()
+        # Heuristic: name is usually short, no special chars
+        if line and len(line) < 40 and not any(c in line for c in ['@', '|', '•', ':']):
+            # Check if it looks like a name (mostly letters and spaces)
+            if re.match(r'^[A-Za-z\s.-]+$', line):
+                return line
+
+    return None
+
+
+def _name_from_doc(doc, text: str) -> str | None:
+    """Pick a candidate name from a processed NER doc.
+
+    Strategy:
+    1. Look for PERSON entities in the processed prefix
+    2. Prefer entities at the start of the document
+    3. Fallback to first non-empty line if no entity found
     """
-    pattern = r'[\w.-]+@[\w.-]+\.\w+'
-    match = re.search(pattern, text)
-    return match.group(0).lower() if match else None
+    # Find PERSON entities
+    for ent in doc.ents:
+        if ent.label_ == "PERSON":
+            name = ent.text.strip()
+            # Basic validation: should be 2+ words, reasonable length
+            if len(name.split()) >= 2 and len(name) < 50:
+                return name
 
+    return _name_from_lines(text)
 
-def extract_phone(text: str) -> str | None:
-    """Extract phone number using regex.
 
-    Handles formats:
-    - +1-123-456-7890
-    - (123) 456-7890
-    - 123.456.7890
-    - +92 300 1234567
-    - 10+ digit numbers
+def extract_name_rules(text: str) -> str | None:
+    """Extract candidate name with layout rules only (no spaCy).
+
+    Extends the first-lines fallback: skips headings like "Resume",
+    accepts "Name:" labels, and splits off contact details that share
+    the header line (e.g. "Jane Doe | jane@mail.com").
 
     Args:
         text: Resume text content
 
     Returns:
-        Phone number or None if not found
+        Candidate name or None if not found
     """
-    patterns = [
-        r'\+?[\d]{1,3}[-.\s]?[\d]{3}[-.\s]?[\d]{3}[-.\s]?[\d]{4}',
-        r'\+?[\d]{1,3}[-.\s]?[\d]{3}[-.\s]?[\d]{7}',
-        r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
-        r'\d{10,13}',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text)
-        if match:
-            # Clean up the phone number
-            phone = match.group(0).strip()
-            return phone
+    if not text:
+        return None
 
-    return None
+    for line in text.strip().split('\n')[:8]:
+        line = line.strip()
+        if not line or line.lower().strip(' :') in NAME_SKIP_LINES:
+            continue
 
+        line = NAME_LABEL_RE.sub('', line)
+        line = NAME_SEPARATOR_RE.split(line)[0].strip()
 
-def extract_name(text: str) -> str | None:
-    """Extract candidate name using spaCy NER.
+        words = line.split()
+        looks_like_name = all(w[0].isupper() and NAME_TOKEN_RE.match(w) for w in words)
+        if 2 <= len(words) <= 4 and len(line) < 40 and looks_like_name:
+            return line
+
+    return _name_from_lines(text)
 
-    Strategy:
-    1. Look for PERSON entities in first 1000 chars
-    2. Prefer entities at the start of the document
-    3. Fallback to first non-empty line if no entity found
+
+def extract_name(text: str, mode: str = None) -> str | None:
+    """Extract candidate name using spaCy NER or layout rules.
 
     Args:
         text: Resume text content
+        mode: 'spacy' or 'rules' (defaults to Config.NAME_EXTRACTION_MODE)
 
     Returns:
         Candidate name or None if not found
     """
+    mode = mode or Config.NAME_EXTRACTION_MODE
+    if mode == NAME_MODE_RULES:
+        return extract_name_rules(text)
+
     try:
         nlp_model = get_nlp()
 
-        # Process only first 1000 chars for speed (name usually at top)
-        doc = nlp_model(text[:1000])
-
-        # Find PERSON entities
-        for ent in doc.ents:
-            if ent.label_ == "PERSON":
-                name = ent.text.strip()
-                # Basic validation: should be 2+ words, reasonable length
-                if len(name.split()) >= 2 and len(name) < 50:
-                    return name
-
-        # Fallback: first non-empty line might be name
-        lines = text.strip().split('\n')
-        for line in lines[:5]:
-            line = line.strip()
-            # Heuristic: name is usually short, no special chars
-            if line and len(line) < 40 and not any(c in line for c in ['@', '|', '•', ':']):
-                # Check if it looks like a name (mostly letters and spaces)
-                if re.match(r'^[A-Za-z\s.-]+$', line):
-                    return line
-
-        return None
+        # Process only the top of the document for speed (name usually at top)
+        doc = nlp_model(text[:NAME_SCAN_CHARS])
+        return _name_from_doc(doc, text)
 
     except Exception as e:
         logger.error(f"spaCy name extraction failed: {e}")
         return None
 
 
-def extract_basic_info(text: str) -> dict:
-    """Extract name, email, phone from resume text.
+def extract_names_batch(
+    texts: list,
+    batch_size: int = None,
+    n_process: int = None,
+    mode: str = None
+) -> list:
+    """Extract candidate names for many resumes with one nlp.pipe pass.
 
     Args:
-        text: Resume text content
+        texts: List of resume text contents
+        batch_size: Docs per spaCy batch (defaults to Config.NER_BATCH_SIZE)
+        n_process: spaCy worker processes (defaults to Config.NER_PROCESSES)
+        mode: 'spacy' or 'rules' (defaults to Config.NAME_EXTRACTION_MODE)
 
     Returns:
-        Dict with name, email, phone (None for missing fields)
+        List of names (None where not found), aligned with texts
     """
-    if not text or not text.strip():
-        return {
-            "name": None,
-            "email": None,
-            "phone": None
-        }
+    if not texts:
+        return []
 
+    mode = mode or Config.NAME_EXTRACTION_MODE
+    if mode == NAME_MODE_RULES:
+        return [extract_name_rules(text or "") for text in texts]
+
+    batch_size = batch_size or Config.NER_BATCH_SIZE
+    n_process = n_process or Config.NER_PROCESSES
+
+    try:
+        nlp_model = get_nlp()
+        prefixes = ((text or "")[:NAME_SCAN_CHARS] for text in texts)
+        docs = nlp_model.pipe(prefixes, batch_size=batch_size, n_process=n_process)
+        return [_name_from_doc(doc, text or "") for doc, text in zip(docs, texts)]
+
+    except Exception as e:
+        logger.error(f"spaCy batch name extraction failed: {e}")
+        return [None] * len(texts)
+
+
+def _empty_info() -> dict:
     return {
-        "name": extract_name(text),
-        "email": extract_email(text),
-        "phone": extract_phone(text)
+        "name": None,
+        "email": None,
+        "phone": None,
+        "links": {"linkedin": None, "github": None}
+    }
+
+
+def extract_basic_info_batch(texts: list, batch_size: int = None, n_process: int = None) -> list:
+    """Extract name, email, phone, and links for a batch of resumes.
+
+    Names come from a single batched spaCy pass instead of one
+    pipeline call per resume; contacts from one compiled scan each.
+
+    Args:
+        texts: List of resume text contents
+        batch_size: Docs per spaCy batch
+        n_process: spaCy worker processes
+
+    Returns:
+        List of dicts with name, email, phone, links, aligned with texts
+    """
+    # Only process texts that have content
+    indexed = [(i, text) for i, text in enumerate(texts) if text and text.strip()]
+    present = [text for _, text in indexed]
+
+    names = extract_names_batch(present, batch_size, n_process)
+    contacts = extract_contacts_batch(present)
+    info_by_index = {
+        i: {"name": name, **contact}
+        for (i, _), name, contact in zip(indexed, names, contacts)
     }
 
+    return [info_by_index.get(i) or _empty_info() for i in range(len(texts))]
+
 
 def is_valid_email(email: str) -> bool:
     """Validate email format.
@@ -0,0 +1,152 @@
+"""MinHash signatures and LSH banding for near-duplicate resume detection.
+
+Two resumes whose word-shingle sets have high Jaccard similarity get
+mostly identical MinHash values. Splitting the signature into bands and
+indexing each band's hash in SQLite means a lookup only compares against
+resumes that share at least one band, not the whole pool.
+"""
+
+import hashlib
+import json
+import random
+import re
+import struct
+from config import Config
+from models import get_signature_matches, store_resume_signature
+
+# 64 hashes in 16 bands of 4 rows: P(candidate) is ~0.99 at Jaccard 0.7 and
+# ~0.025 at Jaccard 0.2, so true near-duplicates are found and few false
+# candidates need the full signature comparison
+NUM_PERM = 64
+LSH_BANDS = 16
+ROWS_PER_BAND = NUM_PERM // LSH_BANDS
+
+SHINGLE_WORDS = 5
+MIN_SHINGLES = 20  # shorter texts (e.g. failed OCR) are never matched
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+# Fixed seed so signatures stay comparable across processes and restarts
+_rng = random.Random(1337)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERM)
+]
+
+WORD_RE = re.compile(r'\w+')
+
+
+def _shingle_hashes(text: str) -> set:
+    words = WORD_RE.findall((text or '').lower())
+    shingles = {
+        ' '.join(words[i:i + SHINGLE_WORDS])
+        for i in range(max(0, len(words) - SHINGLE_WORDS + 1))
+    }
+    return {
+        int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), 'little')
+        for s in shingles
+    }
+
+
+def compute_signature(text: str) -> list | None:
+    """Compute the MinHash signature of a resume text.
+
+    Args:
+        text: Resume text
+
+    Returns:
+        List of NUM_PERM ints, or None if the text is too short to compare
+    """
+    hashes = _shingle_hashes(text)
+    if len(hashes) < MIN_SHINGLES:
+        return None
+
+    return [
+        min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+        for a, b in _PERMUTATIONS
+    ]
+
+
+def band_keys(signature: list) -> list:
+    """Hash each LSH band of a signature.
+
+    Returns:
+        List of (band index, bucket hex) tuples
+    """
+    keys = []
+    for band in range(LSH_BANDS):
+        rows = signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND]
+        digest = hashlib.blake2b(struct.pack(f'<{len(rows)}I', *rows), digest_size=8).hexdigest()
+        keys.append((band, digest))
+    return keys
+
+
+def estimate_similarity(signature_a: list, signature_b: list) -> float:
+    """Estimate Jaccard similarity from two signatures."""
+    if not signature_a or not signature_b:
+        return 0.0
+    matches = sum(1 for a, b in zip(signature_a, signature_b) if a == b)
+    return matches / NUM_PERM
+
+
+def encode_signature(signature: list) -> bytes:
+    """Pack a signature for SQLite storage."""
+    return struct.pack(f'<{NUM_PERM}I', *signature)
+
+
+def decode_signature(blob: bytes) -> list:
+    """Unpack a signature stored with encode_signature."""
+    return list(struct.unpack(f'<{NUM_PERM}I', blob))
+
+
+def find_near_duplicate(role_id: str, signature: list, email: str = None, threshold: float = None) -> dict | None:
+    """Find the most similar active resume in a role's pool.
+
+    Candidates with a different known email are never matched, so two
+    people using the same template aren't merged.
+
+    Args:
+        role_id: Role UUID
+        signature: MinHash signature of the new resume
+        email: Email extracted from the new resume, if any
+        threshold: Minimum estimated similarity (defaults to Config.NEAR_DUPLICATE_THRESHOLD)
+
+    Returns:
+        Dict with candidate_id, similarity, and gemini_data (the prior
+        extraction) or None if no near-duplicate exists
+    """
+    if not signature:
+        return None
+
+    threshold = Config.NEAR_DUPLICATE_THRESHOLD if threshold is None else threshold
+    best = None
+
+    for match in get_signature_matches(role_id, band_keys(signature)):
+        if email and match['email'] and match['email'].lower() != email.lower():
+            continue
+        similarity = estimate_similarity(signature, decode_signature(match['signature']))
+        if similarity >= threshold and (best is None or similarity > best['similarity']):
+            best = {**match, "similarity": similarity}
+
+    if not best:
+        return None
+
+    return {
+        "candidate_id": best['candidate_id'],
+        "similarity": best['similarity'],
+        "gemini_data": {
+            "skills": json.loads(best['skills'] or '[]'),
+            "experience_years": best['experience_years'] or 0,
+            "experience_details": json.loads(best['experience_details'] or '[]'),
+            "education": json.loads(best['education'] or '[]'),
+            "projects": json.loads(best['projects'] or '[]'),
+            "positions": json.loads(best['positions'] or '[]')
+        }
+    }
+
+
+def index_candidate(candidate_id: str, role_id: str, signature: list) -> None:
+    """Add a stored candidate's signature to the role's LSH index."""
+    if signature:
+        store_resume_signature(candidate_id, role_id, encode_signature(signature), band_keys(signature))
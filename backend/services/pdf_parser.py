@@ -1,150 +1,189 @@
 """PDF text extraction service using PyMuPDF."""
 
 import fitz  # PyMuPDF
+import hashlib
 import logging
 import os
-import uuid
-from werkzeug.utils import secure_filename
+from concurrent.futures import Future, ThreadPoolExecutor
+from services.file_store import store_bytes
+from services.resume_segmenter import segment_document
 
 logger = logging.getLogger(__name__)
 
-UPLOAD_FOLDER = 'uploads'
+# Background writer so disk I/O doesn't block text extraction (created lazily)
+_write_executor = None
 
 
-def extract_text_from_pdf(file_path: str) -> str:
-    """Extract text content from PDF file.
+def _get_write_executor() -> ThreadPoolExecutor:
+    global _write_executor
+    if _write_executor is None:
+        _write_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='pdf-writer')
+    return _write_executor
 
-    Args:
-        file_path: Path to the PDF file
-
-    Returns:
-        Extracted text as string, or empty string if extraction fails
-    """
-    try:
-        if not os.path.exists(file_path):
-            logger.error(f"PDF file not found: {file_path}")
-            return ""
 
-        doc = fitz.open(file_path)
-        text = ""
+def _reset_after_fork() -> None:
+    """Writer threads don't survive fork; let the child start its own."""
+    global _write_executor
+    _write_executor = None
 
-        for page in doc:
-            text += page.get_text()
 
-        doc.close()
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
 
-        if not text.strip():
-            logger.warning(f"No text extracted from PDF (possibly scanned): {file_path}")
-
-        return text.strip()
-
-    except Exception as e:
-        logger.error(f"Failed to extract text from PDF {file_path}: {e}")
-        return ""
 
+def iter_page_text(doc, max_chars: int = None, max_pages: int = None):
+    """Yield page text lazily, stopping once a budget is reached.
 
-def save_uploaded_pdf(file) -> str | None:
-    """Save uploaded PDF file to uploads directory.
+    Pages past the budget are never rendered, so a long portfolio costs
+    about as much as a short CV.
 
     Args:
-        file: Flask FileStorage object
+        doc: Open PyMuPDF document
+        max_chars: Stop after this many characters (None for no limit)
+        max_pages: Stop after this many pages (None for no limit)
 
-    Returns:
-        Path to saved file, or None if save fails
+    Yields:
+        Text of each page, in order
     """
-    try:
-        # Ensure uploads directory exists
-        os.makedirs(UPLOAD_FOLDER, exist_ok=True)
-
-        # Generate unique filename
-        original_name = secure_filename(file.filename)
-        unique_name = f"{uuid.uuid4()}_{original_name}"
-        file_path = os.path.join(UPLOAD_FOLDER, unique_name)
+    chars = 0
+    for index, page in enumerate(doc):
+        if max_pages and index >= max_pages:
+            return
 
-        # Save file
-        file.save(file_path)
-        logger.info(f"Saved PDF to: {file_path}")
+        text = page.get_text()
+        yield text
 
-        return file_path
+        chars += len(text)
+        if max_chars and chars >= max_chars:
+            return
 
-    except Exception as e:
-        logger.error(f"Failed to save PDF: {e}")
-        return None
 
+def extract_full_text(file_path: str) -> str:
+    """Extract the complete text of a stored PDF, ignoring the budgets.
 
-def is_valid_pdf(file_path: str) -> bool:
-    """Check if file is a valid PDF.
+    Phase 1 keeps only the budgeted text on the candidate; this reads the
+    whole document on demand (see extraction_worker.submit_full_text).
 
     Args:
-        file_path: Path to the PDF file
+        file_path: Path to the stored PDF file
 
     Returns:
-        True if valid PDF with at least one page, False otherwise
+        Full extracted text, or empty string if extraction fails
     """
     try:
-        doc = fitz.open(file_path)
-        page_count = doc.page_count
-        doc.close()
-        return page_count > 0
-    except Exception:
-        return False
+        with fitz.open(file_path) as doc:
+            return "".join(iter_page_text(doc)).strip()
+    except Exception as e:
+        logger.error(f"Failed to extract text from PDF {file_path}: {e}")
+        return ""
 
 
-def has_extractable_text(file_path: str) -> bool:
-    """Check if PDF has extractable text (not just images).
+def analyze_pdf(
+    source: bytes | str,
+    max_chars: int = None,
+    max_pages: int = None,
+    segment: bool = False
+) -> dict:
+    """Validate, count pages and extract text in a single PyMuPDF pass.
+
+    The document is opened once, from memory or from the upload's file on
+    disk, so it never has to be copied into the store first. Text
+    extraction stops at the character/page budget.
+    With segment=True the same pass reads text blocks with font metadata
+    and splits the resume into sections (see resume_segmenter).
 
     Args:
-        file_path: Path to the PDF file
+        source: Raw PDF bytes, or the path of a file holding them
+        max_chars: Optional character budget
+        max_pages: Optional page budget
+        segment: Also build section-filtered prompt text
 
     Returns:
-        True if PDF has substantial extractable text
+        Dict with valid, page_count, pages_read, truncated, and text; plus
+        sections, prompt_text, and tokens_saved when segmenting
     """
-    text = extract_text_from_pdf(file_path)
-    # Minimum character threshold
-    return len(text.strip()) > 50
+    result = {
+        "valid": False,
+        "page_count": 0,
+        "pages_read": 0,
+        "truncated": False,
+        "text": ""
+    }
+
+    try:
+        # Explicit filetype: streamed upload temp files end in .part
+        if isinstance(source, str):
+            document = fitz.open(source, filetype="pdf")
+        else:
+            document = fitz.open(stream=source, filetype="pdf")
+        with document as doc:
+            result["page_count"] = doc.page_count
+            if doc.page_count == 0:
+                return result
+
+            result["valid"] = True
+
+            if segment:
+                segmented = segment_document(doc, max_chars, max_pages)
+                result.update(segmented)
+            else:
+                pages = list(iter_page_text(doc, max_chars, max_pages))
+                result["pages_read"] = len(pages)
+                result["text"] = "".join(pages).strip()
+
+            result["truncated"] = result["pages_read"] < doc.page_count
+
+    except Exception as e:
+        logger.error(f"Failed to open PDF: {e}")
+
+    return result
 
 
-def process_pdf_file(file) -> dict:
-    """Process uploaded PDF file: save and extract text.
+def compute_content_hash(data: bytes) -> str:
+    """Compute SHA-256 hex digest of uploaded file bytes.
 
     Args:
-        file: Flask FileStorage object
+        data: Raw file content
 
     Returns:
-        Dict with file_path, text, and status
+        Hex digest string used as the extraction cache key
     """
-    result = {
-        "file_path": None,
-        "text": "",
-        "status": "failed",
-        "error": None,
-        "original_name": file.filename
-    }
+    return hashlib.sha256(data).hexdigest()
+
 
-    # Save file
-    file_path = save_uploaded_pdf(file)
-    if not file_path:
-        result["error"] = "Failed to save file"
-        return result
+def _write_pdf(content_hash: str, data: bytes = None, source_path: str = None, link_source: bool = False) -> str | None:
+    """Store a PDF in the content-addressed store.
 
-    result["file_path"] = file_path
+    Returns:
+        Stored path, or None (logged) if the write failed
+    """
+    try:
+        stored_path = store_bytes(data, content_hash, source_path, link_source)
+        logger.info(f"Saved PDF to: {stored_path}")
+        return stored_path
+    except Exception as e:
+        logger.error(f"Failed to save PDF {content_hash}: {e}")
+        return None
 
-    # Validate PDF
-    if not is_valid_pdf(file_path):
-        result["error"] = "Invalid or corrupted PDF"
-        logger.error(f"Invalid PDF: {file.filename}")
-        return result
 
-    # Extract text
-    text = extract_text_from_pdf(file_path)
-    result["text"] = text
+def submit_pdf_save(
+    content_hash: str,
+    data: bytes = None,
+    source_path: str = None,
+    link_source: bool = False
+) -> Future:
+    """Save a PDF to the content-addressed upload store on the background writer.
 
-    if not text.strip():
-        result["status"] = "warning"
-        result["error"] = "No text extracted (possibly scanned image)"
-        logger.warning(f"No text in PDF: {file.filename}")
-    else:
-        result["status"] = "success"
-        logger.info(f"Extracted {len(text)} chars from {file.filename}")
+    Identical files map to the same path, so re-uploads are stored once.
 
-    return result
+    Args:
+        content_hash: SHA-256 of the PDF
+        data: Raw PDF bytes, or None to copy the file at source_path
+        source_path: File on disk holding the PDF
+        link_source: Hard-link source_path into the store when possible
+            (only for streamed upload temp files the app owns)
+
+    Returns:
+        Future resolving to the stored path, or None if the write failed
+    """
+    return _get_write_executor().submit(_write_pdf, content_hash, data, source_path, link_source)
@@ -0,0 +1,107 @@
+"""Resume previews: stored PDF lookup and cached first-page thumbnails."""
+
+import logging
+import os
+import re
+import tempfile
+import threading
+import fitz  # PyMuPDF
+from config import Config
+from services.file_store import compute_file_hash, resolve_path
+
+logger = logging.getLogger(__name__)
+
+# Stored PDFs are named by content hash (see file_store.path_for_hash)
+HASH_NAME_RE = re.compile(r'^[0-9a-f]{64}$')
+
+# One render per hash at a time; concurrent requests wait for it.
+# Maps hash -> [lock, requests using it]; dropped when the last one leaves
+_render_locks = {}
+_render_locks_guard = threading.Lock()
+
+
+def get_stored_pdf(stored_path: str | None) -> tuple:
+    """Resolve a candidate's stored PDF and its content hash.
+
+    Args:
+        stored_path: candidates.pdf_path value
+
+    Returns:
+        Tuple of (absolute path, content hash), or (None, None) if missing
+    """
+    if not stored_path:
+        return None, None
+
+    path = resolve_path(stored_path)
+    if not os.path.isfile(path):
+        return None, None
+
+    stem = os.path.splitext(os.path.basename(path))[0]
+    content_hash = stem if HASH_NAME_RE.match(stem) else compute_file_hash(path)
+    return path, content_hash
+
+
+def thumbnail_path_for_hash(content_hash: str) -> str:
+    """Get the cache path of a PDF's first-page thumbnail."""
+    return os.path.join(Config.THUMBNAIL_FOLDER, content_hash[:2], content_hash + '.png')
+
+
+def render_first_page(pdf_path: str, output_path: str, width: int = None) -> None:
+    """Render page one of a PDF to a PNG of the given width.
+
+    Written to a temp file and renamed, so readers never see a partial PNG.
+    """
+    width = width or Config.THUMBNAIL_WIDTH
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+
+    with fitz.open(pdf_path) as doc:
+        page = doc[0]
+        zoom = width / page.rect.width
+        pixmap = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(output_path), suffix='.png.part')
+        os.close(fd)
+        try:
+            pixmap.save(temp_path, output='png')
+            os.replace(temp_path, output_path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+
+def get_thumbnail(pdf_path: str, content_hash: str) -> str | None:
+    """Get a PDF's first-page thumbnail, rendering it on first request.
+
+    Thumbnails are cached on disk by content hash, so each distinct PDF
+    is rendered once no matter how many candidates or visits use it.
+
+    Args:
+        pdf_path: Absolute path of the stored PDF
+        content_hash: SHA-256 of the PDF
+
+    Returns:
+        Absolute path of the PNG, or None if rendering fails
+    """
+    output_path = thumbnail_path_for_hash(content_hash)
+    if os.path.exists(output_path):
+        return output_path
+
+    with _render_locks_guard:
+        entry = _render_locks.setdefault(content_hash, [threading.Lock(), 0])
+        entry[1] += 1
+
+    try:
+        with entry[0]:
+            if not os.path.exists(output_path):
+                render_first_page(pdf_path, output_path)
+                logger.info(f"Rendered thumbnail for {content_hash}")
+        return output_path
+    except Exception as e:
+        logger.error(f"Failed to render thumbnail for {pdf_path}: {e}")
+        return None
+    finally:
+        with _render_locks_guard:
+            entry[1] -= 1
+            if not entry[1]:
+                del _render_locks[content_hash]
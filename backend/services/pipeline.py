@@ -0,0 +1,221 @@
+"""Bounded-queue staged pipeline used for Phase 1 extraction."""
+
+import logging
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Sentinel telling a stage worker to exit
+_STOP = object()
+
+# Pipelines currently running, for live stats
+_active_pipelines = {}
+_active_lock = threading.Lock()
+
+
+class PipelineStage:
+    """A pool of worker threads draining one bounded input queue.
+
+    The handler processes one item at a time or, for batched stages, a
+    list of up to batch_size items collected for at most batch_timeout
+    seconds (a list even when batch_size is 1), and
+    forwards it downstream via StagedPipeline.submit. A full queue blocks
+    the upstream producer, which keeps memory flat regardless of upload size.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler,
+        workers: int = 1,
+        queue_size: int = 16,
+        on_error=None,
+        batch_size: int = 1,
+        batch_timeout: float = 0.2,
+        batched: bool = False
+    ):
+        self.name = name
+        self.handler = handler
+        self.workers = max(1, workers)
+        self.queue_size = queue_size
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.on_error = on_error
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+        self.batched = batched
+
+        self._threads = []
+        self._lock = threading.Lock()
+
+        self.processed = 0
+        self.failed = 0
+        self.busy_seconds = 0.0
+        self.max_depth = 0
+        self.started_at = None
+        self.finished_at = None
+
+    def start(self) -> None:
+        """Start worker threads."""
+        self.started_at = time.monotonic()
+        for i in range(self.workers):
+            thread = threading.Thread(
+                target=self._run,
+                name=f"pipeline-{self.name}-{i}",
+                daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def put(self, item) -> None:
+        """Enqueue an item, blocking while the queue is full."""
+        self.queue.put(item)
+        depth = self.queue.qsize()
+        with self._lock:
+            self.max_depth = max(self.max_depth, depth)
+
+    def close(self) -> None:
+        """Drain remaining items and stop workers."""
+        for _ in self._threads:
+            self.queue.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+        self.finished_at = time.monotonic()
+
+    def _next_batch(self) -> tuple:
+        """Collect up to batch_size items, waiting at most batch_timeout.
+
+        Returns:
+            Tuple of (items, stop) where stop means the worker should exit
+        """
+        item = self.queue.get()
+        if item is _STOP:
+            return [], True
+
+        batch = [item]
+        deadline = time.monotonic() + self.batch_timeout
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self.queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+
+        return batch, False
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            batch, stop = self._next_batch()
+            if not batch:
+                continue
+
+            start = time.monotonic()
+            ok = True
+            try:
+                self.handler(batch if self.batched else batch[0])
+            except Exception as e:
+                ok = False
+                logger.error(f"Pipeline stage '{self.name}' failed: {e}")
+                if self.on_error:
+                    for item in batch:
+                        self.on_error(item, str(e))
+
+            with self._lock:
+                self.busy_seconds += time.monotonic() - start
+                if ok:
+                    self.processed += len(batch)
+                else:
+                    self.failed += len(batch)
+
+    def get_stats(self) -> dict:
+        """Get queue depth and throughput for this stage."""
+        end = self.finished_at or time.monotonic()
+        elapsed = end - self.started_at if self.started_at else 0
+
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "batch_size": self.batch_size,
+                "queue_depth": self.queue.qsize(),
+                "max_queue_depth": self.max_depth,
+                "queue_size": self.queue_size,
+                "processed": self.processed,
+                "failed": self.failed,
+                "busy_seconds": round(self.busy_seconds, 2),
+                "throughput_per_sec": round(self.processed / elapsed, 2) if elapsed > 0 else 0
+            }
+
+
+class StagedPipeline:
+    """Ordered set of stages connected by bounded queues.
+
+    Stages are closed in the order they were added, so every item
+    submitted upstream is flushed through later stages before they stop.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.stages = {}
+        self.started_at = None
+
+    def add_stage(
+        self,
+        name: str,
+        handler,
+        workers: int = 1,
+        queue_size: int = 16,
+        on_error=None,
+        batch_size: int = 1,
+        batch_timeout: float = 0.2,
+        batched: bool = False
+    ) -> None:
+        """Register a stage; stages run in insertion order.
+
+        Batched stages always get a list of items; others get one item.
+        """
+        self.stages[name] = PipelineStage(
+            name, handler, workers, queue_size, on_error, batch_size, batch_timeout, batched
+        )
+
+    def submit(self, stage_name: str, item) -> None:
+        """Hand an item to a stage, blocking under backpressure."""
+        self.stages[stage_name].put(item)
+
+    def start(self) -> None:
+        """Start all stages and register for live stats."""
+        self.started_at = time.monotonic()
+        for stage in self.stages.values():
+            stage.start()
+        with _active_lock:
+            _active_pipelines[self.name] = self
+
+    def close(self) -> None:
+        """Flush and stop all stages in order."""
+        try:
+            for stage in self.stages.values():
+                stage.close()
+        finally:
+            with _active_lock:
+                _active_pipelines.pop(self.name, None)
+
+    def get_stats(self) -> dict:
+        """Get per-stage stats plus total elapsed time."""
+        elapsed = time.monotonic() - self.started_at if self.started_at else 0
+        return {
+            "elapsed_seconds": round(elapsed, 2),
+            "stages": {name: stage.get_stats() for name, stage in self.stages.items()}
+        }
+
+
+def get_active_pipeline_stats() -> dict:
+    """Get live stats for every running pipeline, keyed by name."""
+    with _active_lock:
+        pipelines = list(_active_pipelines.values())
+    return {p.name: p.get_stats() for p in pipelines}
@@ -0,0 +1,209 @@
+"""Bulk import of pre-extracted candidate profiles from JSON Lines.
+
+Each line is one candidate: name/email/phone plus the fields that
+extract_structured_data produces. Records are validated, then inserted
+in large transactions straight into the role pool, with no PDF parsing
+or Gemini involved.
+"""
+
+import json
+import logging
+from config import Config
+from models import (
+    create_or_get_role,
+    create_session_for_upload,
+    bulk_create_candidates,
+    get_candidate_count,
+    update_session_counts
+)
+from services.local_extractor import is_valid_email
+
+logger = logging.getLogger(__name__)
+
+# Only the first errors are returned; the counts cover everything
+MAX_REPORTED_ERRORS = 100
+
+CONTACT_FIELDS = {'name': str, 'email': str, 'phone': str, 'resume_text': str}
+
+# Extraction schema (see gemini_service.EXTRACTION_PROMPT): list field -> item fields.
+# Item fields are optional except the first, which identifies the entry.
+LIST_FIELDS = {
+    'experience_details': {'role': str, 'company': str, 'duration': str, 'highlights': list},
+    'education': {'degree': str, 'institution': str, 'year': int},
+    'projects': {'name': str, 'description': str, 'technologies': list, 'impact': str},
+    'positions': {'title': str, 'year': int}
+}
+
+MAX_EXPERIENCE_YEARS = 70
+
+
+def _type_name(expected) -> str:
+    return {str: 'string', int: 'integer', list: 'array'}.get(expected, expected.__name__)
+
+
+def _check_type(value, expected) -> bool:
+    if expected is int:
+        return isinstance(value, int) and not isinstance(value, bool)
+    return isinstance(value, expected)
+
+
+def _validate_items(field: str, items: list, errors: list) -> list:
+    schema = LIST_FIELDS[field]
+    key_field = next(iter(schema))
+    cleaned = []
+
+    for index, item in enumerate(items):
+        where = f"{field}[{index}]"
+        if not isinstance(item, dict):
+            errors.append(f"{where} must be an object")
+            continue
+
+        unknown = set(item) - set(schema)
+        if unknown:
+            errors.append(f"{where} has unknown fields: {', '.join(sorted(unknown))}")
+
+        for name, expected in schema.items():
+            value = item.get(name)
+            if value is not None and not _check_type(value, expected):
+                errors.append(f"{where}.{name} must be {_type_name(expected)}")
+        if not item.get(key_field):
+            errors.append(f"{where}.{key_field} is required")
+
+        cleaned.append({name: item.get(name) for name in schema if name in item})
+
+    return cleaned
+
+
+def validate_profile(record) -> tuple:
+    """Validate one imported profile against the extraction schema.
+
+    Args:
+        record: Parsed JSON value of one line
+
+    Returns:
+        Tuple of (normalized profile dict, list of error strings)
+    """
+    if not isinstance(record, dict):
+        return None, ["record must be a JSON object"]
+
+    errors = []
+    allowed = set(CONTACT_FIELDS) | set(LIST_FIELDS) | {'skills', 'experience_years'}
+    unknown = set(record) - allowed
+    if unknown:
+        errors.append(f"unknown fields: {', '.join(sorted(unknown))}")
+
+    profile = {}
+    for name, expected in CONTACT_FIELDS.items():
+        value = record.get(name)
+        if value is not None and not isinstance(value, expected):
+            errors.append(f"{name} must be a string")
+        elif value:
+            profile[name] = value.strip()
+
+    if not profile.get('name'):
+        errors.append("name is required")
+    if profile.get('email') and not is_valid_email(profile['email']):
+        errors.append(f"invalid email: {profile['email']}")
+
+    skills = record.get('skills', [])
+    if not isinstance(skills, list) or not all(isinstance(s, str) for s in skills):
+        errors.append("skills must be an array of strings")
+    else:
+        profile['skills'] = [s.strip() for s in skills if s.strip()]
+
+    years = record.get('experience_years', 0)
+    if isinstance(years, bool) or not isinstance(years, (int, float)):
+        errors.append("experience_years must be a number")
+    elif not 0 <= years <= MAX_EXPERIENCE_YEARS:
+        errors.append(f"experience_years must be between 0 and {MAX_EXPERIENCE_YEARS}")
+    else:
+        profile['experience_years'] = years
+
+    for field in LIST_FIELDS:
+        items = record.get(field, [])
+        if not isinstance(items, list):
+            errors.append(f"{field} must be an array")
+        else:
+            profile[field] = _validate_items(field, items, errors)
+
+    return (None, errors) if errors else (profile, [])
+
+
+def import_profiles(role_title: str, lines, batch_size: int = None, on_progress=None) -> dict:
+    """Import JSON Lines profiles into a role's candidate pool.
+
+    Invalid lines are skipped and reported; valid ones are inserted in
+    transactions of batch_size records.
+
+    Args:
+        role_title: Title of the role (created if new)
+        lines: Iterable of JSON Lines (str or bytes), e.g. an open file
+        batch_size: Records per transaction (defaults to Config.IMPORT_BATCH_SIZE)
+        on_progress: Optional callback receiving a dict after each batch
+
+    Returns:
+        Dict with session_id, role, imported, superseded, failed, and errors
+    """
+    batch_size = batch_size or Config.IMPORT_BATCH_SIZE
+
+    role = create_or_get_role(role_title)
+    role_id = role['id']
+    session_id = create_session_for_upload(role_id)['id']
+
+    result = {"imported": 0, "superseded": 0, "failed": 0, "errors": []}
+    batch = []
+
+    def flush():
+        inserted = bulk_create_candidates(role_id, session_id, batch)
+        result["imported"] += len(inserted['candidate_ids'])
+        result["superseded"] += inserted['superseded']
+        batch.clear()
+        logger.info(f"Imported {result['imported']} profiles into {role_title}")
+        if on_progress:
+            on_progress({
+                "event": "import_batch",
+                "imported": result["imported"],
+                "failed": result["failed"]
+            })
+
+    for line_number, line in enumerate(lines, start=1):
+        if isinstance(line, bytes):
+            line = line.decode('utf-8', errors='replace')
+        if not line.strip():
+            continue
+
+        try:
+            profile, errors = validate_profile(json.loads(line))
+        except json.JSONDecodeError as e:
+            profile, errors = None, [f"invalid JSON: {e}"]
+
+        if errors:
+            result["failed"] += 1
+            if len(result["errors"]) < MAX_REPORTED_ERRORS:
+                result["errors"].append({"line": line_number, "errors": errors})
+            continue
+
+        batch.append(profile)
+        if len(batch) >= batch_size:
+            flush()
+
+    if batch:
+        flush()
+
+    pool_size = get_candidate_count(role_id)
+    update_session_counts(session_id, result["imported"], pool_size)
+    logger.info(
+        f"Import complete for {role_title}: {result['imported']} imported, "
+        f"{result['superseded']} superseded, {result['failed']} rejected"
+    )
+
+    return {
+        "session_id": session_id,
+        "role": {
+            "id": role_id,
+            "title": role_title,
+            "is_new": role.get('is_new', False),
+            "total_in_pool": pool_size
+        },
+        **result
+    }
@@ -1,10 +1,16 @@
 """Ranking service for multi-level candidate evaluation."""
 
+import asyncio
 import json
 import logging
-import time
-import google.generativeai as genai
-from services.gemini_service import parse_gemini_response, MODEL_NAME, MAX_RETRIES, INITIAL_RETRY_DELAY, REQUEST_DELAY
+from config import Config
+from services.async_runtime import run_async
+from services.gemini_service import (
+    generate_json_async,
+    MAX_RETRIES,
+    INITIAL_RETRY_DELAY
+)
+from services.rate_limiter import get_gemini_limiter
 from services.pool_manager import format_pool_for_gemini
 
 logger = logging.getLogger(__name__)
@@ -25,16 +31,16 @@ CANDIDATES:
 
 Return ONLY valid JSON (no markdown):
 {{
-  "scores": {{
-    "candidate_id_1": {{
+  "scores": [
+    {{
+      "candidate_id": "uuid",
       "experience": 75,
       "skills": 80,
       "projects": 65,
       "positions": 70,
       "education": 60
-    }},
-    "candidate_id_2": {{ ... }}
-  }}
+    }}
+  ]
 }}
 
 Scoring Guidelines:
@@ -95,7 +101,7 @@ def apply_thresholds(candidates: list, thresholds: dict, scores: dict) -> tuple:
     return remaining, eliminated
 
 
-def score_candidates_for_thresholds(job_description: str, candidates: list) -> dict:
+async def score_candidates_for_thresholds_async(job_description: str, candidates: list) -> dict:
     """Get dimension scores for all candidates.
 
     Args:
@@ -109,11 +115,6 @@ def score_candidates_for_thresholds(job_description: str, candidates: list) -> d
         return {}
 
     try:
-        # Add delay before API call to stay under rate limits
-        time.sleep(REQUEST_DELAY)
-
-        model = genai.GenerativeModel(MODEL_NAME)
-
         # Format candidates
         candidate_text = format_pool_for_gemini(candidates)
 
@@ -122,12 +123,14 @@ def score_candidates_for_thresholds(job_description: str, candidates: list) -> d
             candidates=candidate_text
         )
 
-        response = model.generate_content(prompt)
-        response_text = response.text.strip()
+        data = await generate_json_async(prompt, 'scoring')
 
-        # Parse response
-        data = parse_gemini_response(response_text)
-        scores = data.get('scores', {})
+        # The response schema returns a list; callers look scores up by candidate
+        scores = {}
+        for entry in data.get('scores') or []:
+            if isinstance(entry, dict) and entry.get('candidate_id'):
+                candidate_id = entry.pop('candidate_id')
+                scores[candidate_id] = entry
 
         logger.info(f"Scored {len(scores)} candidates")
         return scores
@@ -137,6 +140,11 @@ def score_candidates_for_thresholds(job_description: str, candidates: list) -> d
         return {}
 
 
+def score_candidates_for_thresholds(job_description: str, candidates: list) -> dict:
+    """Blocking wrapper around score_candidates_for_thresholds_async."""
+    return run_async(score_candidates_for_thresholds_async(job_description, candidates))
+
+
 def get_elimination_summary(eliminated: list) -> dict:
     """Generate summary of eliminations.
 
@@ -467,7 +475,7 @@ def generate_summary_fallback(candidate: dict, scores: dict) -> list:
     return summary[:3]
 
 
-def rank_candidates_comparatively(
+async def rank_candidates_comparatively_async(
     job_description: str,
     candidates: list,
     weights: dict,
@@ -491,18 +499,17 @@ def rank_candidates_comparatively(
     validated_weights = validate_weights(weights)
 
     # Process in batches if too many candidates (Gemini can't handle 80+ at once)
-    BATCH_SIZE = 20
+    BATCH_SIZE = Config.RANK_BATCH_SIZE
     if len(candidates) > BATCH_SIZE:
-        logger.info(f"Processing {len(candidates)} candidates in batches of {BATCH_SIZE}")
-        all_rankings = []
+        batches = [candidates[i:i + BATCH_SIZE] for i in range(0, len(candidates), BATCH_SIZE)]
+        logger.info(f"Processing {len(candidates)} candidates in {len(batches)} batches of {BATCH_SIZE}")
 
-        for i in range(0, len(candidates), BATCH_SIZE):
-            batch = candidates[i:i + BATCH_SIZE]
-            logger.info(f"Ranking batch {i // BATCH_SIZE + 1}: {len(batch)} candidates")
-            batch_rankings = _rank_single_batch(
-                job_description, batch, validated_weights, priorities
-            )
-            all_rankings.extend(batch_rankings)
+        # All batches are in flight at once; the shared rate limiter keeps them within quota
+        batch_results = await asyncio.gather(*(
+            _rank_single_batch_async(job_description, batch, validated_weights, priorities)
+            for batch in batches
+        ))
+        all_rankings = [r for batch_rankings in batch_results for r in batch_rankings]
 
         # Re-sort all rankings by match_score and assign final ranks
         all_rankings.sort(key=lambda x: x.get('match_score', 0), reverse=True)
@@ -512,10 +519,20 @@ def rank_candidates_comparatively(
         logger.info(f"Ranked {len(all_rankings)} candidates across batches")
         return all_rankings
 
-    return _rank_single_batch(job_description, candidates, validated_weights, priorities)
+    return await _rank_single_batch_async(job_description, candidates, validated_weights, priorities)
+
+
+def rank_candidates_comparatively(
+    job_description: str,
+    candidates: list,
+    weights: dict,
+    priorities: dict
+) -> list:
+    """Blocking wrapper around rank_candidates_comparatively_async."""
+    return run_async(rank_candidates_comparatively_async(job_description, candidates, weights, priorities))
 
 
-def _rank_single_batch(
+async def _rank_single_batch_async(
     job_description: str,
     candidates: list,
     validated_weights: dict,
@@ -525,8 +542,6 @@ def _rank_single_batch(
     if not candidates:
         return []
 
-    model = genai.GenerativeModel(MODEL_NAME)
-
     # Format inputs
     candidates_text = format_pool_for_gemini(candidates)
     priorities_text = json.dumps(priorities, indent=2) if priorities else "{}"
@@ -547,12 +562,8 @@ def _rank_single_batch(
     last_error = None
     for attempt in range(MAX_RETRIES):
         try:
-            # Add delay before API call to stay under rate limits
-            time.sleep(REQUEST_DELAY)
-
-            response = model.generate_content(prompt)
-            logger.info(f"Gemini ranking response (first 1000 chars): {response.text[:1000]}")
-            data = parse_gemini_response(response.text)
+            data = await generate_json_async(prompt, 'ranking')
+            logger.info(f"Gemini ranking response (first 1000 chars): {json.dumps(data)[:1000]}")
             logger.info(f"Parsed rankings data keys: {data.keys() if data else 'None'}")
             logger.info(f"Number of rankings in response: {len(data.get('rankings', []))}")
 
@@ -601,10 +612,10 @@ def _rank_single_batch(
             error_str = str(e)
             last_error = e
             if "429" in error_str or "quota" in error_str.lower():
-                # Rate limit - wait and retry
+                # Rate limit - hold back all callers, then retry
                 delay = INITIAL_RETRY_DELAY * (2 ** attempt)
                 logger.warning(f"Ranking rate limit hit, retrying in {delay}s (attempt {attempt + 1}/{MAX_RETRIES})")
-                time.sleep(delay)
+                get_gemini_limiter().pause(delay)
             else:
                 # Other error - break out of retry loop
                 logger.error(f"Ranking error: {e}")
@@ -753,7 +764,7 @@ def apply_tie_breaker_flags(rankings: list, priorities: dict) -> list:
     return rankings
 
 
-def generate_tie_breaker_explanation(
+async def generate_tie_breaker_explanation_async(
     candidate_a: dict,
     candidate_b: dict,
     priorities: dict
@@ -771,8 +782,6 @@ def generate_tie_breaker_explanation(
     critical_dims = [d for d, p in priorities.items() if p == 'CRITICAL']
 
     try:
-        model = genai.GenerativeModel(MODEL_NAME)
-
         prompt = TIE_BREAKER_PROMPT.format(
             rank_a=candidate_a.get('rank', 1),
             name_a=candidate_a.get('name', 'Candidate A'),
@@ -785,8 +794,7 @@ def generate_tie_breaker_explanation(
             critical_dims=', '.join(critical_dims) or 'None specified'
         )
 
-        response = model.generate_content(prompt)
-        data = parse_gemini_response(response.text)
+        data = await generate_json_async(prompt, 'tie_breaker')
 
         return data.get('tie_breaker_reason', 'Based on overall profile strength')
 
@@ -795,6 +803,15 @@ def generate_tie_breaker_explanation(
         return "Based on overall profile assessment"
 
 
+def generate_tie_breaker_explanation(
+    candidate_a: dict,
+    candidate_b: dict,
+    priorities: dict
+) -> str:
+    """Blocking wrapper around generate_tie_breaker_explanation_async."""
+    return run_async(generate_tie_breaker_explanation_async(candidate_a, candidate_b, priorities))
+
+
 def rank_with_tie_breakers(
     job_description: str,
     candidates: list,
@@ -0,0 +1,134 @@
+"""Process-wide token-bucket rate limiter for Gemini API calls."""
+
+import asyncio
+import logging
+import threading
+import time
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Shared limiter, created on first use so CLI overrides of the config apply
+_gemini_limiter = None
+_gemini_limiter_lock = threading.Lock()
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute budgets as two token buckets.
+
+    Each bucket holds up to one minute of quota and refills continuously.
+    acquire_async() suspends the calling coroutine until both buckets can
+    cover the request; the buckets sit behind a lock, so every coroutine
+    and thread in the process shares one quota. A limit of 0 disables
+    that bucket.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self.rpm = requests_per_minute
+        self.tpm = tokens_per_minute
+
+        self._requests = float(requests_per_minute)
+        self._tokens = float(tokens_per_minute)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+        self.granted = 0
+        self.waited = 0
+        self.wait_seconds = 0.0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        if self.rpm > 0:
+            self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+        if self.tpm > 0:
+            self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+
+    def _time_until_available(self, now: float, tokens: int) -> float:
+        if now < self._paused_until:
+            return self._paused_until - now
+
+        wait = 0.0
+        if self.rpm > 0 and self._requests < 1:
+            wait = (1 - self._requests) * 60 / self.rpm
+        if self.tpm > 0 and self._tokens < tokens:
+            wait = max(wait, (tokens - self._tokens) * 60 / self.tpm)
+        return wait
+
+    def _clamp(self, tokens: int) -> int:
+        # A prompt larger than the whole budget still has to go through eventually
+        return min(tokens, self.tpm) if self.tpm > 0 else tokens
+
+    def _take(self, tokens: int, started: float) -> float:
+        """Consume capacity for one request (caller holds the lock)."""
+        self._requests -= 1
+        self._tokens -= tokens
+        waited = time.monotonic() - started
+        self.granted += 1
+        if waited > 0.01:
+            self.waited += 1
+            self.wait_seconds += waited
+        return waited
+
+    async def acquire_async(self, tokens: int = 0) -> float:
+        """Wait until one request of the given size fits the budgets.
+
+        Args:
+            tokens: Estimated prompt tokens of the request
+
+        Returns:
+            Seconds spent waiting
+        """
+        tokens = self._clamp(tokens)
+        started = time.monotonic()
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._time_until_available(now, tokens)
+                if wait <= 0:
+                    return self._take(tokens, started)
+            # Re-check at least once a second so a settle() refund is noticed
+            await asyncio.sleep(min(wait, 1.0))
+
+    def settle(self, estimated: int, actual: int | None) -> None:
+        """Correct the token bucket once the real prompt size is known.
+
+        Args:
+            estimated: Tokens passed to acquire_async()
+            actual: Prompt tokens reported by the API (None if unknown)
+        """
+        if actual is None or self.tpm <= 0:
+            return
+        with self._lock:
+            self._tokens = min(self.tpm, self._tokens - (actual - estimated))
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller, e.g. after the API answered 429."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            self._refill(time.monotonic())
+            return {
+                "requests_per_minute": self.rpm,
+                "tokens_per_minute": self.tpm,
+                "available_requests": round(self._requests, 2),
+                "available_tokens": round(self._tokens),
+                "granted": self.granted,
+                "waited": self.waited,
+                "wait_seconds": round(self.wait_seconds, 2)
+            }
+
+
+def get_gemini_limiter() -> RateLimiter:
+    """Get the limiter shared by every Gemini call in this process."""
+    global _gemini_limiter
+    with _gemini_limiter_lock:
+        if _gemini_limiter is None:
+            _gemini_limiter = RateLimiter(Config.GEMINI_RPM, Config.GEMINI_TPM)
+            logger.info(f"Gemini rate limit: {Config.GEMINI_RPM} requests/min, {Config.GEMINI_TPM} tokens/min")
+        return _gemini_limiter
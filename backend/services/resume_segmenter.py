@@ -0,0 +1,192 @@
+"""Layout-aware resume section segmentation using PyMuPDF text blocks."""
+
+import re
+from collections import Counter
+from services.tokens import estimate_tokens
+
+# Heading text (normalized) -> section name
+SECTION_HEADINGS = {
+    'experience': [
+        'experience', 'work experience', 'professional experience', 'employment',
+        'employment history', 'work history', 'career history', 'relevant experience',
+        'internships', 'internship experience'
+    ],
+    'education': [
+        'education', 'academic background', 'academic qualifications', 'qualifications',
+        'education and training', 'academics'
+    ],
+    'skills': [
+        'skills', 'technical skills', 'core skills', 'key skills', 'core competencies',
+        'competencies', 'technologies', 'tools', 'tools and technologies', 'expertise'
+    ],
+    'projects': [
+        'projects', 'personal projects', 'academic projects', 'key projects',
+        'selected projects', 'portfolio'
+    ],
+    'summary': [
+        'summary', 'professional summary', 'profile', 'about me', 'objective',
+        'career objective', 'professional profile'
+    ],
+    'certifications': ['certifications', 'certificates', 'licenses', 'courses', 'training'],
+    'achievements': ['achievements', 'awards', 'honors', 'accomplishments'],
+    'references': ['references', 'referees'],
+    'interests': ['interests', 'hobbies', 'hobbies and interests', 'extracurricular activities'],
+    'personal': ['personal details', 'personal information', 'declaration'],
+    'languages': ['languages'],
+    'publications': ['publications']
+}
+
+HEADING_LOOKUP = {
+    heading: section
+    for section, headings in SECTION_HEADINGS.items()
+    for heading in headings
+}
+
+# Sections EXTRACTION_PROMPT uses (skills, experience, education, projects, positions)
+PROMPT_SECTIONS = ['summary', 'experience', 'projects', 'skills', 'education', 'certifications', 'achievements']
+
+# Lines in the top/bottom band of a page are header/footer candidates
+MARGIN_BAND = 0.08
+
+PAGE_NUMBER_RE = re.compile(r'^(page\s*)?\d+(\s*(of|/)\s*\d+)?$', re.IGNORECASE)
+BOLD_FLAG = 16
+
+
+def _normalize_heading(text: str) -> str:
+    text = re.sub(r'[^a-z& ]', '', text.lower().replace('&', ' and '))
+    return ' '.join(text.split())
+
+
+def _page_lines(page) -> list:
+    """Flatten a page's text blocks into lines with font metadata."""
+    lines = []
+    height = page.rect.height or 1
+
+    for block in page.get_text('dict')['blocks']:
+        if block.get('type') != 0:
+            continue  # image block
+        for line in block['lines']:
+            spans = [span for span in line['spans'] if span['text']]
+            if not spans:
+                continue
+            lines.append({
+                "text": ''.join(span['text'] for span in spans),
+                "size": max(span['size'] for span in spans),
+                "bold": all(span['flags'] & BOLD_FLAG for span in spans if span['text'].strip()),
+                "position": line['bbox'][1] / height
+            })
+
+    return lines
+
+
+def _repeated_margin_lines(pages: list) -> set:
+    """Find header/footer lines repeated across pages."""
+    if len(pages) < 2:
+        return set()
+
+    counts = Counter()
+    for lines in pages:
+        seen = {
+            line['text'].strip()
+            for line in lines
+            if line['position'] < MARGIN_BAND or line['position'] > 1 - MARGIN_BAND
+        }
+        counts.update(seen)
+
+    return {text for text, count in counts.items() if text and count >= 2}
+
+
+def _heading_section(line: dict, body_size: float) -> str | None:
+    """Map a line to a section if it reads and looks like a heading."""
+    text = line['text'].strip().rstrip(':')
+    if not text or len(text.split()) > 5:
+        return None
+
+    section = HEADING_LOOKUP.get(_normalize_heading(text))
+    if not section:
+        return None
+
+    # Keyword must also be styled like a heading, unless it stands alone
+    styled = line['bold'] or line['size'] > body_size + 0.5 or text.isupper()
+    return section if styled or text == text.title() else None
+
+
+def segment_document(doc, max_chars: int = None, max_pages: int = None) -> dict:
+    """Split a resume into sections using text blocks and font metadata.
+
+    Repeated headers/footers and page numbers are dropped; text before the
+    first heading is the contact section. The prompt text keeps only the
+    sections EXTRACTION_PROMPT needs.
+
+    Args:
+        doc: Open PyMuPDF document
+        max_chars: Stop reading pages after this many characters
+        max_pages: Stop after this many pages
+
+    Returns:
+        Dict with text (plain text as read), sections, prompt_text, and
+        token counts (full_tokens, prompt_tokens, tokens_saved)
+    """
+    pages = []
+    chars = 0
+    for index, page in enumerate(doc):
+        if max_pages and index >= max_pages:
+            break
+        lines = _page_lines(page)
+        pages.append(lines)
+        chars += sum(len(line['text']) + 1 for line in lines)
+        if max_chars and chars >= max_chars:
+            break
+
+    text = ''.join(line['text'] + '\n' for lines in pages for line in lines).strip()
+
+    all_lines = [line for lines in pages for line in lines]
+    sizes = Counter(round(line['size']) for line in all_lines if line['text'].strip())
+    body_size = sizes.most_common(1)[0][0] if sizes else 0
+    boilerplate = _repeated_margin_lines(pages)
+
+    sections = {}
+    current = 'contact'
+    for line in all_lines:
+        stripped = line['text'].strip()
+        if not stripped or stripped in boilerplate or PAGE_NUMBER_RE.match(stripped):
+            continue
+
+        section = _heading_section(line, body_size)
+        if section:
+            current = section
+            continue
+
+        # Inline heading, e.g. "SKILLS: Python, SQL"
+        label, colon, rest = stripped.partition(':')
+        inline = HEADING_LOOKUP.get(_normalize_heading(label)) if colon and rest.strip() else None
+        if inline and len(label.split()) <= 4:
+            current = inline
+            stripped = rest.strip()
+
+        sections.setdefault(current, []).append(stripped)
+
+    sections = {name: '\n'.join(lines) for name, lines in sections.items()}
+
+    # No headings recognized: segmentation can't be trusted, send everything
+    if set(sections) <= {'contact'}:
+        prompt_text = text
+    else:
+        prompt_text = '\n\n'.join(
+            f"{name.upper()}\n{sections[name]}"
+            for name in PROMPT_SECTIONS
+            if sections.get(name)
+        )
+
+    full_tokens = estimate_tokens(text)
+    prompt_tokens = estimate_tokens(prompt_text)
+
+    return {
+        "text": text,
+        "pages_read": len(pages),
+        "sections": sections,
+        "prompt_text": prompt_text,
+        "full_tokens": full_tokens,
+        "prompt_tokens": prompt_tokens,
+        "tokens_saved": max(0, full_tokens - prompt_tokens)
+    }
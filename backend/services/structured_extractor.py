@@ -0,0 +1,385 @@
+"""Local structured resume extraction (skills, education, roles, experience).
+
+Produces the same schema as gemini_service.parse_gemini_response plus a
+confidence score, so cleanly formatted resumes can skip the Gemini call.
+"""
+
+import re
+from datetime import date
+
+# Canonical skill names; matched case-insensitively as whole phrases
+SKILL_GAZETTEER = [
+    # Languages
+    'Python', 'Java', 'JavaScript', 'TypeScript', 'C', 'C++', 'C#', 'Go', 'Rust', 'Ruby',
+    'PHP', 'Swift', 'Kotlin', 'Scala', 'R', 'MATLAB', 'Perl', 'Dart', 'Bash', 'SQL',
+    'HTML', 'CSS', 'Sass', 'Objective-C', 'Elixir', 'Haskell', 'Lua', 'Solidity',
+    # Frameworks and libraries
+    'React', 'React Native', 'Angular', 'Vue', 'Vue.js', 'Next.js', 'Node.js', 'Express',
+    'Django', 'Flask', 'FastAPI', 'Spring', 'Spring Boot', 'Rails', 'Ruby on Rails',
+    'Laravel', '.NET', 'ASP.NET', 'Flutter', 'jQuery', 'Redux', 'Tailwind CSS', 'Bootstrap',
+    'GraphQL', 'REST', 'gRPC', 'Svelte', 'NestJS',
+    # Data and ML
+    'Pandas', 'NumPy', 'SciPy', 'scikit-learn', 'TensorFlow', 'PyTorch', 'Keras',
+    'Spark', 'Hadoop', 'Airflow', 'Kafka', 'Tableau', 'Power BI', 'Excel', 'Looker',
+    'Machine Learning', 'Deep Learning', 'NLP', 'Computer Vision', 'Data Analysis',
+    'Data Visualization', 'Statistics', 'spaCy', 'OpenCV', 'LLM', 'dbt', 'Snowflake',
+    # Databases
+    'PostgreSQL', 'MySQL', 'SQLite', 'MongoDB', 'Redis', 'Elasticsearch', 'Cassandra',
+    'DynamoDB', 'Oracle', 'SQL Server', 'Firebase', 'BigQuery',
+    # Cloud and DevOps
+    'AWS', 'Azure', 'GCP', 'Google Cloud', 'Docker', 'Kubernetes', 'Terraform', 'Ansible',
+    'Jenkins', 'GitHub Actions', 'GitLab CI', 'CI/CD', 'Linux', 'Nginx', 'Git', 'Prometheus',
+    'Grafana', 'Serverless', 'Microservices',
+    # Design and product
+    'Figma', 'Sketch', 'Adobe XD', 'Photoshop', 'Illustrator', 'UI/UX', 'Jira', 'Agile',
+    'Scrum', 'Product Management',
+    # Testing
+    'Jest', 'Cypress', 'Selenium', 'PyTest', 'JUnit', 'Unit Testing',
+    # Soft skills
+    'Leadership', 'Communication', 'Teamwork', 'Problem Solving', 'Project Management',
+    'Mentoring', 'Public Speaking'
+]
+
+# Single letters and ambiguous words only count inside a skills section
+AMBIGUOUS_SKILLS = {'C', 'R', 'Go', 'Spring', 'Express', 'Excel', 'Oracle', 'REST', 'Swift', 'Rails'}
+
+TITLE_KEYWORDS = (
+    'engineer', 'developer', 'manager', 'analyst', 'designer', 'intern', 'lead',
+    'consultant', 'scientist', 'architect', 'specialist', 'administrator', 'officer',
+    'director', 'coordinator', 'assistant', 'associate', 'programmer', 'head',
+    'researcher', 'technician', 'executive', 'founder', 'tester', 'qa'
+)
+
+DEGREE_RE = re.compile(
+    r"\b(ph\.?d|doctor(?:ate)? of [a-z ]+|master(?:'s)?(?: of [a-z ]+)?|mba|m\.?sc|m\.?s|m\.?eng|m\.?tech|"
+    r"bachelor(?:'s)?(?: of [a-z ]+)?|b\.?sc|b\.?s|b\.?a|b\.?eng|b\.?tech|b\.?e|bba|bcs|"
+    r"associate(?:'s)? degree|diploma|high school|intermediate|matric(?:ulation)?|a[- ]levels?|o[- ]levels?)\b"
+    r"[^\n,|]*",
+    re.IGNORECASE
+)
+# Degree tokens that are also ordinary words ("be used", "MS Office"); only
+# trusted under an education heading
+AMBIGUOUS_DEGREE_RE = re.compile(r'^(m\.?s|b\.?s|b\.?a|b\.?e|intermediate)$', re.IGNORECASE)
+INSTITUTION_RE = re.compile(r'(university|college|institute|school|academy|polytechnic)', re.IGNORECASE)
+YEAR_RE = re.compile(r'\b(19[5-9]\d|20\d{2})\b')
+
+MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+_MONTH = r'jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec'
+_DATE = r'(?:(?P<{p}m>' + _MONTH + r')[a-z]*\.?,?\s*|(?P<{p}n>\d{{1,2}})[/.-])?(?P<{p}y>(?:19|20)\d{{2}})'
+DATE_RANGE_RE = re.compile(
+    _DATE.format(p='s') + r'\s*(?:-|–|—|to|until)\s*(?:(?P<present>present|current|now|date|ongoing)|'
+    + _DATE.format(p='e') + r')',
+    re.IGNORECASE
+)
+
+BULLET_RE = re.compile(r'^[\s•●▪■◦‣∙·*\-–]+')
+TITLE_SPLIT_RE = re.compile(r'\s+(?:at|@)\s+|\s*[|,–—]\s*|\s+-\s+')
+
+# Confidence weights per signal; Gemini is skipped above the configured threshold
+CONFIDENCE_WEIGHTS = {
+    "skills": 0.25,
+    "experience": 0.3,
+    "education": 0.2,
+    "sections": 0.15,
+    "projects": 0.1
+}
+
+_matcher = None
+_tokenizer = None
+
+
+def _get_matcher():
+    """Build the skill PhraseMatcher once (tokenizer only, no model needed)."""
+    global _matcher, _tokenizer
+    if _matcher is None:
+        import spacy
+        from spacy.matcher import PhraseMatcher
+
+        nlp = spacy.blank('en')
+        matcher = PhraseMatcher(nlp.vocab, attr='LOWER')
+        for skill in SKILL_GAZETTEER:
+            matcher.add(skill, [nlp.make_doc(skill)])
+        _tokenizer, _matcher = nlp, matcher
+    return _tokenizer, _matcher
+
+
+def _month_index(match, prefix: str, default_month: int = 1) -> int | None:
+    year = match.group(f'{prefix}y')
+    if not year:
+        return None
+    month_name = match.group(f'{prefix}m')
+    month_num = match.group(f'{prefix}n')
+    if month_name:
+        month = MONTHS.get(month_name[:3].lower(), 1)
+    elif month_num and 1 <= int(month_num) <= 12:
+        month = int(month_num)
+    else:
+        month = default_month
+    return int(year) * 12 + month - 1
+
+
+def _parse_range(match) -> tuple | None:
+    """Convert a date-range match to (start, end) month indexes."""
+    start = _month_index(match, 's')
+    if match.group('present'):
+        today = date.today()
+        end = today.year * 12 + today.month - 1
+    else:
+        # A bare end year ("2016 - 2018") runs through that year
+        end = _month_index(match, 'e', default_month=12)
+
+    if start is None or end is None or end < start:
+        return None
+    return start, end
+
+
+def _merged_months(ranges: list) -> int:
+    """Total months covered by possibly overlapping ranges."""
+    total = 0
+    current_start, current_end = None, None
+    for start, end in sorted(ranges):
+        if current_end is None or start > current_end + 1:
+            if current_end is not None:
+                total += current_end - current_start + 1
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+    if current_end is not None:
+        total += current_end - current_start + 1
+    return total
+
+
+def _format_duration(months: int) -> str:
+    years = round(months / 12, 1)
+    if years >= 1:
+        return f"{years:g} year" + ("" if years == 1 else "s")
+    return f"{months} month" + ("" if months == 1 else "s")
+
+
+def extract_skills(text: str, skills_section: str = None) -> list:
+    """Match gazetteer skills, plus listed items from a skills section."""
+    nlp, matcher = _get_matcher()
+    found = {}
+
+    def add(skill):
+        found.setdefault(skill.lower(), skill)
+
+    for source, allow_ambiguous in ((skills_section, True), (text, False)):
+        if not source:
+            continue
+        doc = nlp.make_doc(source)
+        for match_id, _, _ in matcher(doc):
+            skill = nlp.vocab.strings[match_id]
+            if allow_ambiguous or skill not in AMBIGUOUS_SKILLS:
+                add(skill)
+
+    # Short comma/bullet separated entries in a skills section are skills too
+    if skills_section:
+        for entry in re.split(r'[,;|•\n]', skills_section):
+            entry = BULLET_RE.sub('', entry).strip().rstrip('.')
+            if ':' in entry:
+                entry = entry.split(':', 1)[1].strip()
+            if 1 < len(entry) <= 30 and len(entry.split()) <= 3:
+                add(entry)
+
+    return list(found.values())
+
+
+def _split_title_company(text: str) -> tuple:
+    parts = [p.strip() for p in TITLE_SPLIT_RE.split(text) if p and p.strip()]
+    if not parts:
+        return None, None
+    title_index = next(
+        (i for i, p in enumerate(parts) if any(k in p.lower() for k in TITLE_KEYWORDS)),
+        None
+    )
+    if title_index is None:
+        return None, None
+    title = parts[title_index]
+    others = [p for i, p in enumerate(parts) if i != title_index]
+    return title, (others[0] if others else None)
+
+
+def extract_experience(section: str) -> tuple:
+    """Find job entries (title, company, date range, highlights).
+
+    Returns:
+        Tuple of (experience_details, positions, experience_years)
+    """
+    lines = [line.strip() for line in section.split('\n') if line.strip()]
+    details = []
+    positions = []
+    ranges = []
+
+    for i, line in enumerate(lines):
+        match = DATE_RANGE_RE.search(line)
+        if not match:
+            continue
+        period = _parse_range(match)
+        if not period:
+            continue
+
+        # Title/company on the same line, else on the lines just above
+        remainder = (line[:match.start()] + ' ' + line[match.end():]).strip(' ()|,-–—')
+        title, company = _split_title_company(remainder)
+        for back in (1, 2):
+            if title or i - back < 0:
+                break
+            candidate = lines[i - back]
+            if not BULLET_RE.match(candidate) and not DATE_RANGE_RE.search(candidate):
+                title, other = _split_title_company(candidate)
+                company = company or other
+                if title and not company and i - back - 1 >= 0:
+                    company = lines[i - back - 1] if not BULLET_RE.match(lines[i - back - 1]) else None
+        if not title:
+            continue
+
+        highlights = []
+        for following in lines[i + 1:]:
+            if not BULLET_RE.match(following):
+                if highlights:
+                    break
+                continue
+            highlights.append(BULLET_RE.sub('', following).strip())
+            if len(highlights) == 3:
+                break
+
+        ranges.append(period)
+        start, end = period
+        details.append({
+            "role": title,
+            "company": company or "",
+            "duration": _format_duration(end - start + 1),
+            "highlights": highlights
+        })
+        positions.append({"title": title, "year": start // 12})
+
+    positions.sort(key=lambda p: p['year'])
+    experience_years = round(_merged_months(ranges) / 12, 1) if ranges else 0
+    return details, positions, experience_years
+
+
+def extract_education(section: str, in_section: bool = True) -> list:
+    """Find degrees with institution and year.
+
+    Args:
+        section: Education section text, or the whole resume
+        in_section: False when scanning text outside an education heading;
+            ambiguous degree tokens are then ignored and a degree needs an
+            institution or year nearby
+    """
+    lines = [line.strip() for line in section.split('\n') if line.strip()]
+    education = []
+
+    for i, line in enumerate(lines):
+        match = DEGREE_RE.search(line)
+        if not match:
+            continue
+        if not in_section and AMBIGUOUS_DEGREE_RE.match(match.group(1)):
+            continue
+
+        window = lines[max(0, i - 1):i + 3]
+        institution = next((l for l in window if INSTITUTION_RE.search(l)), "")
+        years = [int(y) for l in window for y in YEAR_RE.findall(l)]
+        if not in_section and not institution and not years:
+            continue
+
+        if institution == line:
+            # Degree and institution share a line, e.g. "BSc CS, NUST University"
+            institution = next(
+                (p.strip() for p in re.split(r'[,|–—-]', line) if INSTITUTION_RE.search(p)),
+                institution
+            )
+        institution = YEAR_RE.sub('', institution).strip(' ,|()-–—')
+
+        education.append({
+            "degree": match.group(0).strip(' ,|-–—'),
+            "institution": institution,
+            "year": max(years) if years else None
+        })
+
+    return education
+
+
+def extract_projects(section: str, text_skills: list) -> list:
+    """Treat short non-bullet lines as project names, bullets as details."""
+    projects = []
+    current = None
+
+    for line in section.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+        if BULLET_RE.match(line) and current:
+            detail = BULLET_RE.sub('', line).strip()
+            current["description"] = current["description"] or detail
+            current["_text"] += ' ' + detail
+        elif current and not current["description"] and len(line.split()) > 4:
+            # Unbulleted description right under the project name
+            current["description"] = line
+            current["_text"] += ' ' + line
+        elif len(line) <= 80:
+            current = {"name": line.rstrip(':'), "description": "", "technologies": [], "impact": "", "_text": line}
+            projects.append(current)
+        elif current:
+            current["description"] = current["description"] or line
+            current["_text"] += ' ' + line
+
+    # Whole-word matches only, so "Java" is not found in "JavaScript" nor "Go" in "Google"
+    skill_re = None
+    if text_skills:
+        alternatives = '|'.join(re.escape(s) for s in sorted(text_skills, key=len, reverse=True))
+        skill_re = re.compile(r'(?<!\w)(?:' + alternatives + r')(?![\w+#&])', re.IGNORECASE)
+
+    for project in projects:
+        block = project.pop("_text")
+        mentioned = {m.lower() for m in skill_re.findall(block)} if skill_re else set()
+        project["technologies"] = [s for s in text_skills if s.lower() in mentioned][:8]
+
+    return projects
+
+
+def extract_structured_local(text: str, sections: dict = None) -> dict:
+    """Extract the Gemini extraction schema locally, with a confidence score.
+
+    Args:
+        text: Resume text content
+        sections: Optional sections from resume_segmenter
+
+    Returns:
+        Dict with skills, experience_years, experience_details, education,
+        projects, positions, confidence, and extraction_source
+    """
+    sections = sections or {}
+    text = text or ""
+
+    skills = extract_skills(text, sections.get('skills'))
+    details, positions, experience_years = extract_experience(sections.get('experience') or text)
+    if sections.get('education'):
+        education = extract_education(sections['education'])
+    else:
+        education = extract_education(text, in_section=False)
+    projects = extract_projects(sections['projects'], skills) if sections.get('projects') else []
+
+    signals = {
+        "skills": len(skills) >= 3,
+        "experience": bool(details),
+        "education": bool(education),
+        "sections": 'experience' in sections and 'skills' in sections,
+        "projects": bool(projects)
+    }
+    confidence = sum(CONFIDENCE_WEIGHTS[name] for name, present in signals.items() if present)
+
+    return {
+        "skills": skills,
+        "experience_years": experience_years,
+        "experience_details": details,
+        "education": education,
+        "projects": projects,
+        "positions": positions,
+        "confidence": round(confidence, 2),
+        "extraction_source": "local"
+    }
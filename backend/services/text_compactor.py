@@ -0,0 +1,178 @@
+"""Resume text compaction for extraction prompts.
+
+Cleans PDF text artifacts (spacing, broken lines, repeated headers and
+footers, bullet glyphs, duplicate lines) and fits the result to a token
+budget by dropping whole low-priority sections instead of cutting the tail.
+"""
+
+import re
+from services.resume_segmenter import HEADING_LOOKUP, PAGE_NUMBER_RE
+from services.tokens import estimate_tokens
+
+# Sections kept first when over budget; unlisted sections come after these
+SECTION_PRIORITY = [
+    'experience', 'skills', 'education', 'projects', 'summary',
+    'certifications', 'achievements', 'contact'
+]
+
+BULLET_GLYPH_RE = re.compile(r'^[•●▪■◦‣∙·○►▸➢✓✔*]+\s*|^[-–—]\s+')
+SPACE_RE = re.compile(r'[ \t\u00a0\u2000-\u200b\u3000]+')
+SENTENCE_END = ('.', ':', ';', '!', '?')
+
+# Lines shorter than this can legitimately repeat (e.g. "Python", "2020")
+MIN_DEDUPE_CHARS = 15
+
+
+def _heading_of(line: str) -> str | None:
+    text = line.strip().rstrip(':')
+    if not text or len(text.split()) > 5:
+        return None
+    normalized = ' '.join(re.sub(r'[^a-z& ]', '', text.lower().replace('&', ' and ')).split())
+    return HEADING_LOOKUP.get(normalized)
+
+
+def _is_bullet(line: str) -> bool:
+    return line.startswith('- ')
+
+
+def normalize_lines(text: str) -> list:
+    """Normalize whitespace and bullet glyphs, one entry per line."""
+    lines = []
+    for raw in text.replace('\r', '\n').replace('\f', '\n').split('\n'):
+        line = SPACE_RE.sub(' ', raw).strip()
+        if BULLET_GLYPH_RE.match(line):
+            line = '- ' + BULLET_GLYPH_RE.sub('', line)
+        lines.append(line)
+    return lines
+
+
+def merge_broken_lines(lines: list) -> list:
+    """Join lines that PDF extraction wrapped mid-sentence."""
+    merged = []
+    for line in lines:
+        previous = merged[-1] if merged else ''
+        continues = (
+            line and previous
+            and not _is_bullet(line)
+            and not _heading_of(line)
+            and not _heading_of(previous)
+            and not previous.endswith(SENTENCE_END)
+            and (line[0].islower() or previous.endswith((',', '-', '&', ' and', ' or')))
+        )
+        if continues:
+            if previous.endswith('-') and not previous.endswith(' -'):
+                merged[-1] = previous[:-1] + line  # hyphenated word split
+            else:
+                merged[-1] = f"{previous} {line}"
+        else:
+            merged.append(line)
+    return merged
+
+
+def drop_repeated_lines(lines: list) -> list:
+    """Remove page numbers and repeated lines (headers, footers, copies).
+
+    The first occurrence is kept, so a contact header repeated on every
+    page survives once.
+    """
+    seen = set()
+    kept = []
+    for line in lines:
+        if line and PAGE_NUMBER_RE.match(line):
+            continue
+        key = line.lower()
+        if len(line) >= MIN_DEDUPE_CHARS:
+            if key in seen:
+                continue
+            seen.add(key)
+        kept.append(line)
+    return kept
+
+
+def split_sections(lines: list) -> list:
+    """Group lines into (section, lines) blocks at recognized headings."""
+    sections = [('contact', [])]
+    for line in lines:
+        section = _heading_of(line)
+        if section:
+            sections.append((section, [line]))
+        else:
+            sections[-1][1].append(line)
+    return [(name, body) for name, body in sections if any(body)]
+
+
+def _join(lines: list) -> str:
+    text = '\n'.join(lines)
+    return re.sub(r'\n{3,}', '\n\n', text).strip()
+
+
+def _trim_lines(lines: list, max_tokens: int) -> list:
+    """Leading lines of a section that fit the budget (cut at a line boundary)."""
+    trimmed = []
+    for line in lines:
+        if estimate_tokens(_join(trimmed + [line])) + 1 > max_tokens:
+            break
+        trimmed.append(line)
+    return trimmed
+
+
+def fit_to_budget(sections: list, max_tokens: int) -> list:
+    """Keep the most important section, then fill the budget by priority.
+
+    The top-priority section present is always kept, cut at a line
+    boundary if it alone is over budget. The remaining budget goes to
+    whole sections in priority order. Kept sections stay in document order.
+
+    Args:
+        sections: (section, lines) blocks in document order
+        max_tokens: Token budget for the compacted text
+
+    Returns:
+        Subset of sections that fits the budget
+    """
+    if not sections:
+        return []
+
+    def priority(index):
+        name = sections[index][0]
+        return (SECTION_PRIORITY.index(name) if name in SECTION_PRIORITY else len(SECTION_PRIORITY), index)
+
+    order = sorted(range(len(sections)), key=priority)
+    top = order[0]
+    name, lines = sections[top]
+    kept = {top: (name, lines)}
+    used = estimate_tokens(_join(lines)) + 1
+    if used > max_tokens:
+        trimmed = _trim_lines(lines, max_tokens)
+        kept[top] = (name, trimmed)
+        used = estimate_tokens(_join(trimmed)) + 1
+
+    for index in order[1:]:
+        cost = estimate_tokens(_join(sections[index][1])) + 1
+        if used + cost <= max_tokens:
+            kept[index] = sections[index]
+            used += cost
+
+    return [kept[index] for index in sorted(kept)]
+
+
+def compact_resume_text(text: str, max_tokens: int = None) -> str:
+    """Compact resume text and fit it to a token budget.
+
+    Args:
+        text: Resume text (raw or section-filtered prompt text)
+        max_tokens: Optional token budget (None for no truncation)
+
+    Returns:
+        Compacted text
+    """
+    if not text:
+        return ""
+
+    lines = drop_repeated_lines(merge_broken_lines(normalize_lines(text)))
+    sections = split_sections(lines)
+
+    if max_tokens and estimate_tokens(_join(lines)) > max_tokens:
+        sections = fit_to_budget(sections, max_tokens)
+
+    return _join([line for _, body in sections for line in body])
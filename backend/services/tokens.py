@@ -0,0 +1,18 @@
+"""Token estimates for Gemini prompts."""
+
+# Rough average for English prose with Gemini's tokenizer
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a text.
+
+    Args:
+        text: Prompt or resume text
+
+    Returns:
+        Approximate number of tokens
+    """
+    if not text:
+        return 0
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
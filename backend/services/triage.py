@@ -0,0 +1,91 @@
+"""Pre-extraction triage: turn away non-resumes before any LLM call.
+
+Runs on what PDF parsing already produced (text, page counts, sections),
+so it costs a few regex scans per file. Cover letters, transcripts,
+scanned images without a text layer and other documents are rejected
+with a reason instead of spending a Gemini extraction.
+"""
+
+import re
+from config import Config
+from services.contact_extractor import extract_contacts
+from services.resume_segmenter import SECTION_HEADINGS
+
+# Sections whose headings signal a resume
+RESUME_SECTIONS = ('experience', 'education', 'skills', 'projects', 'summary', 'certifications')
+
+RESUME_HEADING_RE = re.compile(
+    r'^\s*(?:' + '|'.join(
+        re.escape(heading).replace(r'\ ', r'\s+')
+        for section in RESUME_SECTIONS
+        for heading in sorted(SECTION_HEADINGS[section], key=len, reverse=True)
+    ) + r')\s*(?::|$)',
+    re.IGNORECASE | re.MULTILINE
+)
+
+COVER_LETTER_RE = re.compile(
+    r'\b(dear\s+(?:hiring|sir|madam|recruit\w*|mr|ms|mrs|team)|to whom it may concern|'
+    r'i am writing to|i am excited to apply|sincerely|yours (?:faithfully|truly)|cover letter)\b',
+    re.IGNORECASE
+)
+TRANSCRIPT_RE = re.compile(
+    r'\b(transcript|semester|credit hours?|cumulative gpa|cgpa|course code|'
+    r'grade points?|marks obtained|registrar|academic record)\b',
+    re.IGNORECASE
+)
+
+# Distinct phrases needed before a document counts as a letter/transcript
+COVER_LETTER_MIN_SIGNALS = 2
+TRANSCRIPT_MIN_SIGNALS = 3
+
+
+def _distinct_matches(pattern: re.Pattern, text: str) -> int:
+    return len({' '.join(m.group(0).lower().split()) for m in pattern.finditer(text)})
+
+
+def triage_document(pdf: dict) -> dict:
+    """Decide whether a parsed PDF looks like a resume.
+
+    Args:
+        pdf: Result of pdf_parser.analyze_pdf
+
+    Returns:
+        Dict with accepted, reason (None if accepted), and the signals used
+    """
+    text = pdf.get('text') or ''
+    pages_read = max(1, pdf.get('pages_read') or 1)
+    page_count = pdf.get('page_count') or 0
+
+    sections = set(pdf.get('sections') or {}) & set(RESUME_SECTIONS)
+    if not sections:
+        sections = {' '.join(m.group(0).lower().strip(' :\n').split()) for m in RESUME_HEADING_RE.finditer(text)}
+
+    contacts = extract_contacts(text)
+    signals = {
+        "chars_per_page": round(len(text.strip()) / pages_read),
+        "page_count": page_count,
+        "resume_sections": len(sections),
+        "has_contact": bool(contacts['email'] or contacts['phone']),
+        "cover_letter_phrases": _distinct_matches(COVER_LETTER_RE, text),
+        "transcript_terms": _distinct_matches(TRANSCRIPT_RE, text)
+    }
+
+    def reject(reason):
+        return {"accepted": False, "reason": reason, "signals": signals}
+
+    if signals["chars_per_page"] < Config.TRIAGE_MIN_CHARS_PER_PAGE:
+        return reject("No text layer (scanned image or empty PDF)")
+    if page_count > Config.TRIAGE_MAX_PAGES:
+        return reject(f"{page_count} pages, too long for a resume")
+
+    weak_resume = signals["resume_sections"] <= 1
+    if weak_resume and signals["transcript_terms"] >= TRANSCRIPT_MIN_SIGNALS:
+        return reject("Looks like an academic transcript, not a resume")
+    if weak_resume and signals["cover_letter_phrases"] >= COVER_LETTER_MIN_SIGNALS:
+        return reject("Looks like a cover letter, not a resume")
+
+    resume_signals = signals["resume_sections"] + int(signals["has_contact"])
+    if resume_signals < Config.TRIAGE_MIN_RESUME_SIGNALS:
+        return reject("No resume sections or contact details found")
+
+    return {"accepted": True, "reason": None, "signals": signals}
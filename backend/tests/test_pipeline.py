@@ -0,0 +1,46 @@
+import threading
+
+from services.pipeline import StagedPipeline
+
+
+def run_pipeline(batch_size):
+    received = []
+    lock = threading.Lock()
+    pipeline = StagedPipeline(f'test-{batch_size}')
+
+    def ner_stage(items):
+        with lock:
+            received.append(items)
+
+    pipeline.add_stage('ner', ner_stage, workers=1, batch_size=batch_size, batch_timeout=0.01, batched=True)
+    pipeline.start()
+    for i in range(5):
+        pipeline.submit('ner', {"filename": f"{i}.pdf"})
+    pipeline.close()
+    return received
+
+
+def test_batched_stage_gets_lists_with_batch_size_one():
+    received = run_pipeline(1)
+
+    assert len(received) == 5
+    assert all(isinstance(batch, list) and len(batch) == 1 for batch in received)
+    assert all(isinstance(batch[0], dict) for batch in received)
+
+
+def test_batched_stage_groups_items():
+    received = run_pipeline(5)
+
+    assert sorted(item["filename"] for batch in received for item in batch) == [f"{i}.pdf" for i in range(5)]
+    assert all(isinstance(batch, list) for batch in received)
+
+
+def test_unbatched_stage_gets_single_items():
+    received = []
+    pipeline = StagedPipeline('test-single')
+    pipeline.add_stage('writer', received.append)
+    pipeline.start()
+    pipeline.submit('writer', {"filename": "a.pdf"})
+    pipeline.close()
+
+    assert received == [{"filename": "a.pdf"}]
@@ -0,0 +1,31 @@
+from services.text_compactor import fit_to_budget
+from services.tokens import estimate_tokens
+
+
+def test_oversized_experience_is_trimmed_not_dropped():
+    experience = ['Experience'] + [f'- Led project {i} delivering measurable results for the team' for i in range(300)]
+    sections = [
+        ('contact', ['Jane Doe', 'jane@example.com']),
+        ('experience', experience),
+        ('skills', ['Skills', 'Python, SQL']),
+    ]
+
+    kept = fit_to_budget(sections, 500)
+
+    names = [name for name, _ in kept]
+    assert 'experience' in names
+    lines = dict(kept)['experience']
+    assert lines == experience[:len(lines)]
+    assert len(lines) > 10
+    total = sum(estimate_tokens('\n'.join(body)) + 1 for _, body in kept)
+    assert total <= 500
+
+
+def test_sections_that_fit_are_kept_in_document_order():
+    sections = [
+        ('contact', ['Jane Doe']),
+        ('experience', ['Experience', '- Engineer at Acme']),
+        ('skills', ['Skills', 'Python']),
+    ]
+
+    assert fit_to_budget(sections, 1000) == sections
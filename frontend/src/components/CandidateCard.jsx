@@ -6,9 +6,38 @@ import {
   TooltipProvider,
   TooltipTrigger,
 } from '@/components/ui/tooltip';
+import { useState } from 'react';
 import { Check } from 'lucide-react';
 import { ScoreBreakdown } from '@/components/ScoreBar';
 import WhySection from '@/components/WhySection';
+import { getResumeUrl, getResumeThumbnailUrl } from '@/services/api';
+
+function ResumePreview({ candidateId, name }) {
+  const [failed, setFailed] = useState(false);
+
+  if (failed) {
+    return null;
+  }
+
+  // Only the small cached thumbnail loads with the card; the PDF opens on click
+  return (
+    <a
+      href={getResumeUrl(candidateId)}
+      target="_blank"
+      rel="noopener noreferrer"
+      className="shrink-0"
+      title="Open resume"
+    >
+      <img
+        src={getResumeThumbnailUrl(candidateId)}
+        alt={`Resume of ${name}`}
+        loading="lazy"
+        onError={() => setFailed(true)}
+        className="w-12 h-16 object-cover object-top rounded border bg-white hover:border-primary transition-colors"
+      />
+    </a>
+  );
+}
 
 function CandidateCard({
   candidate,
@@ -63,7 +92,8 @@ function CandidateCard({
       )}
 
       <CardHeader className="pt-6 pb-2">
-        <div className="flex items-start justify-between">
+        <div className="flex items-start justify-between gap-3">
+          <ResumePreview candidateId={id} name={name} />
           <div className="flex-1">
             <h3 className="font-semibold text-lg">{name}</h3>
             <p className="text-sm text-muted-foreground">{email}</p>
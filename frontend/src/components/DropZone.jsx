@@ -12,7 +12,7 @@ function DropZone({ onFilesAdded }) {
         toast({
           variant: 'destructive',
           title: 'Invalid file type',
-          description: 'Only PDF files are accepted',
+          description: 'Only PDF files or ZIP archives of PDFs are accepted',
         });
       }
       if (acceptedFiles.length > 0) {
@@ -26,6 +26,7 @@ function DropZone({ onFilesAdded }) {
     onDrop,
     accept: {
       'application/pdf': ['.pdf'],
+      'application/zip': ['.zip'],
     },
     multiple: true,
   });
@@ -51,7 +52,7 @@ function DropZone({ onFilesAdded }) {
       <p className="text-center">
         <span className="font-medium">Drop resumes here</span>
         <br />
-        <span className="text-sm text-muted-foreground">or click to browse • PDF only</span>
+        <span className="text-sm text-muted-foreground">or click to browse • PDF or ZIP</span>
       </p>
     </div>
   );
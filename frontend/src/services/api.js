@@ -31,6 +31,29 @@ export const analyzeResumes = async (formData) => {
   return response.data;
 };
 
+/**
+ * Add resumes to a role pool without ranking it
+ * @param {FormData} formData - Form data with role_title, optional job_description, files
+ * @returns {Promise<object>} Ingestion result with candidate_ids and extraction summary
+ */
+export const ingestResumes = async (formData) => {
+  const response = await api.post('/ingest', formData, {
+    headers: { 'Content-Type': 'multipart/form-data' }
+  });
+  return response.data;
+};
+
+/**
+ * Rank a role's current pool on demand
+ * @param {string} roleId - Role UUID
+ * @param {object} options - Optional job_description, weights, thresholds
+ * @returns {Promise<object>} Analysis results (same shape as analyzeResumes, without extraction)
+ */
+export const rankRolePool = async (roleId, options = {}) => {
+  const response = await api.post(`/roles/${roleId}/rank`, options);
+  return response.data;
+};
+
 /**
  * Compare two candidates side by side
  * @param {string} sessionId - Session UUID
@@ -102,4 +125,28 @@ export const createRole = async (title, weights = null) => {
   return response.data;
 };
 
+/**
+ * URL of a candidate's original PDF (supports range requests)
+ * @param {string} candidateId - Candidate UUID
+ * @returns {string} Resume URL for links or embedded viewers
+ */
+export const getResumeUrl = (candidateId) => `${API_BASE}/candidates/${candidateId}/resume`;
+
+/**
+ * URL of a cached first-page PNG of a candidate's resume
+ * @param {string} candidateId - Candidate UUID
+ * @returns {string} Thumbnail image URL
+ */
+export const getResumeThumbnailUrl = (candidateId) => `${API_BASE}/candidates/${candidateId}/thumbnail`;
+
+/**
+ * Get the full text of a candidate's resume (all pages, read on demand)
+ * @param {string} candidateId - Candidate UUID
+ * @returns {Promise<object>} Object with candidate_id and text
+ */
+export const getResumeText = async (candidateId) => {
+  const response = await api.get(`/candidates/${candidateId}/text`);
+  return response.data;
+};
+
 export default api;